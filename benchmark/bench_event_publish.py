@@ -0,0 +1,73 @@
+"""
+Compares `LocalEventBus.publish` task-per-handler dispatch with worker pool,
+fan-out strategies, eager handler start (Python 3.12+) and `publish_many`.
+
+Run with: python -m benchmark.bench_event_publish
+"""
+
+import asyncio
+import sys
+import time
+from dataclasses import dataclass
+
+from mediator.event import EventFanOut, LocalEventBus
+
+EVENTS = 50000
+HANDLERS = 2
+REPEAT = 3
+BATCH = 1000
+
+
+@dataclass(frozen=True)
+class ItemChanged:
+    id: int
+
+
+def _create_handler():
+    async def _handler(event: ItemChanged):
+        pass
+
+    return _handler
+
+
+async def _measure(name: str, bus: LocalEventBus, batch: bool = False):
+    for _ in range(HANDLERS):
+        bus.register(_create_handler())
+    events = [ItemChanged(i) for i in range(EVENTS)]
+    batches = [
+        [ItemChanged(i) for i in range(start, min(start + BATCH, EVENTS))]
+        for start in range(0, EVENTS, BATCH)
+    ]
+    publish = bus.publish
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        if batch:
+            for events_batch in batches:
+                await bus.publish_many(events_batch)
+        else:
+            for event in events:
+                await publish(event)
+        await bus.drain()
+        best = min(best, time.perf_counter() - started)
+    await bus.aclose()
+    print(
+        f"{name:<32} {best / EVENTS * 1e6:8.2f}us/event "
+        f"{EVENTS / best:10.0f} events/s"
+    )
+
+
+async def main():
+    await _measure("task per handler", LocalEventBus())
+    await _measure("workers=1", LocalEventBus(workers=1))
+    await _measure("workers=8", LocalEventBus(workers=8))
+    await _measure("workers=64", LocalEventBus(workers=64))
+    await _measure("sequential", LocalEventBus(fan_out=EventFanOut.SEQUENTIAL))
+    await _measure("inline", LocalEventBus(fan_out=EventFanOut.INLINE))
+    if sys.version_info >= (3, 12):
+        await _measure("eager", LocalEventBus(eager=True))
+    await _measure(f"publish_many({BATCH})", LocalEventBus(), batch=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
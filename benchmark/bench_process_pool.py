@@ -0,0 +1,68 @@
+"""
+Compares CPU-bound request handler throughput
+in thread pool and process pool with growing number of workers.
+
+Run with: python -m benchmark.bench_process_pool
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+
+from mediator.common.factory import (
+    ProcessCallableHandlerPolicy,
+    ThreadedCallableHandlerPolicy,
+)
+from mediator.common.handler import ProcessHandlerPool, ThreadHandlerPool
+from mediator.request import LocalRequestBus
+
+REQUESTS = 64
+ROUNDS = 20000
+
+
+@dataclass(frozen=True)
+class HashCommand:
+    seed: int
+
+
+def hash_handler(command: HashCommand):
+    digest = command.seed.to_bytes(8, "little")
+    for _ in range(ROUNDS):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()
+
+
+async def _measure(name: str, bus: LocalRequestBus):
+    started = time.perf_counter()
+    await bus.execute_many([HashCommand(i) for i in range(REQUESTS)])
+    elapsed = time.perf_counter() - started
+    print(f"{name:<24} {elapsed:8.3f}s {REQUESTS / elapsed:8.1f} requests/s")
+
+
+async def main():
+    cpus = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, cpus})
+    for count in workers:
+        thread_pool = ThreadHandlerPool(max_workers=count)
+        bus = LocalRequestBus(
+            policies=[ThreadedCallableHandlerPolicy(pool=thread_pool)]
+        )
+        bus.register(hash_handler)
+        await _measure(f"threads({count})", bus)
+        thread_pool.shutdown()
+
+    for count in workers:
+        process_pool = ProcessHandlerPool(max_workers=count)
+        await process_pool.warm_up()
+        bus = LocalRequestBus(
+            policies=[ProcessCallableHandlerPolicy(pool=process_pool)]
+        )
+        bus.register(hash_handler)
+        await _measure(f"processes({count})", bus)
+        process_pool.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+Measures `LocalRequestBus.execute` per-call overhead.
+
+Run with: python -m benchmark.bench_request_execute
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from mediator.common.factory import CallableHandlerPolicy
+from mediator.common.modifiers import ModifierFactory
+from mediator.request import LocalRequestBus
+
+CALLS = 200000
+REPEAT = 5
+
+
+@dataclass(frozen=True)
+class GetItem:
+    id: int
+
+
+@dataclass(frozen=True)
+class GetNamedItem:
+    id: int
+
+
+async def get_item(query: GetItem, user: str = ""):
+    return query.id
+
+
+async def get_named_item(*, query: GetNamedItem):
+    return query.id
+
+
+class PassModifierFactory(ModifierFactory):
+    def create(self, call, **kwargs):
+        return call
+
+
+async def _measure(name: str, bus: LocalRequestBus, obj, **kwargs):
+    execute = bus.execute
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        for _ in range(CALLS):
+            await execute(obj, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<32} {best / CALLS * 1e9:8.0f}ns/call")
+
+
+async def main():
+    bus = LocalRequestBus()
+    bus.register(get_item)
+    bus.register(get_named_item)
+    modified_bus = LocalRequestBus(modifiers=[PassModifierFactory()])
+    modified_bus.register(get_item)
+    compiled_bus = LocalRequestBus(policies=[CallableHandlerPolicy(compiled=True)])
+    compiled_bus.register(get_item)
+    metrics_bus = LocalRequestBus(modifiers=[PassModifierFactory()], metrics=True)
+    metrics_bus.register(get_item)
+
+    await _measure("positional subject", bus, GetItem(1))
+    await _measure("keyword subject", bus, GetNamedItem(1))
+    await _measure("with kwargs", bus, GetItem(1), user="test")
+    await _measure("with modifier", modified_bus, GetItem(1))
+    await _measure("with kwargs (compiled)", compiled_bus, GetItem(1), user="test")
+    await _measure("with modifier and metrics", metrics_bus, GetItem(1))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
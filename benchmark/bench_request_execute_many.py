@@ -0,0 +1,68 @@
+"""
+Compares `LocalRequestBus.execute_many` with `asyncio.gather` over `execute`.
+
+Run with: python -m benchmark.bench_request_execute_many
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from mediator.request import LocalRequestBus
+
+BATCH = 500
+ROUNDS = 200
+
+
+@dataclass(frozen=True)
+class GetItem:
+    id: int
+
+
+async def get_item(query: GetItem):
+    await asyncio.sleep(0)
+    return query.id
+
+
+async def _gather(bus: LocalRequestBus, queries):
+    return await asyncio.gather(*(bus.execute(query) for query in queries))
+
+
+async def _gather_bounded(bus: LocalRequestBus, queries, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _execute(query):
+        async with semaphore:
+            return await bus.execute(query)
+
+    return await asyncio.gather(*(_execute(query) for query in queries))
+
+
+async def _measure(name: str, fn):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await fn()
+    elapsed = time.perf_counter() - started
+    per_request = elapsed / (ROUNDS * BATCH) * 1e6
+    print(f"{name:<32} {elapsed:8.3f}s {per_request:8.2f}us/request")
+
+
+async def main():
+    bus = LocalRequestBus()
+    bus.register(get_item)
+    queries = [GetItem(i) for i in range(BATCH)]
+
+    await _measure("gather(execute)", lambda: _gather(bus, queries))
+    await _measure("execute_many", lambda: bus.execute_many(queries))
+    await _measure(
+        "gather(execute) + semaphore(50)",
+        lambda: _gather_bounded(bus, queries, 50),
+    )
+    await _measure(
+        "execute_many(concurrency=50)",
+        lambda: bus.execute_many(queries, concurrency=50),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
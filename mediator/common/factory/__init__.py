@@ -12,6 +12,7 @@ from mediator.common.factory.cascade import (
     InspectionHandlerFactoryCascadeError,
 )
 from mediator.common.factory.factories import (
+    BatchHandlerFactory,
     CallableHandlerFactory,
     MethodHandlerFactory,
 )
@@ -20,10 +21,13 @@ from mediator.common.factory.mappers import (
     TypeHandlerFactoryMapper,
 )
 from mediator.common.factory.policies import (
+    BatchHandlerPolicy,
     CallableHandlerPolicy,
     MappablePolicy,
     MethodHandlerPolicy,
     PolicyType,
+    ProcessCallableHandlerPolicy,
+    ThreadedCallableHandlerPolicy,
 )
 
 __all__ = [
@@ -39,14 +43,18 @@ __all__ = [
     "IncompatibleHandlerFactoryCascadeError",
     "InspectionHandlerFactoryCascadeError",
     # factories
+    "BatchHandlerFactory",
     "CallableHandlerFactory",
     "MethodHandlerFactory",
     # mappers
     "DefaultHandlerFactoryMapper",
     "TypeHandlerFactoryMapper",
     # policy
+    "BatchHandlerPolicy",
     "CallableHandlerPolicy",
     "MappablePolicy",
     "MethodHandlerPolicy",
     "PolicyType",
+    "ProcessCallableHandlerPolicy",
+    "ThreadedCallableHandlerPolicy",
 ]
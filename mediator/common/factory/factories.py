@@ -1,14 +1,19 @@
 from typing import Any
 
 from mediator.common.factory.base import HandlerFactory
-from mediator.common.factory.policies import CallableHandlerPolicy, MethodHandlerPolicy
+from mediator.common.factory.policies import (
+    BatchHandlerPolicy,
+    CallableHandlerPolicy,
+    MethodHandlerPolicy,
+)
 from mediator.common.factory.utils import (
+    BatchHandlerSubjectArgGet,
     CallableAttributeDetails,
     CallableHandlerCreate,
     CallableObjDetails,
     HandlerSubjectArgGet,
 )
-from mediator.common.handler import Handler
+from mediator.common.handler import BatchCallableHandler, Handler
 
 
 class CallableHandlerFactory(HandlerFactory):
@@ -30,6 +35,8 @@ class CallableHandlerFactory(HandlerFactory):
             subject_as_keyword=policy.subject_as_keyword,
             arg_map=policy.arg_map,
             arg_strict=policy.arg_strict,
+            pool=policy.pool,
+            compiled=policy.compiled,
         )
 
     def create(self, obj: Any) -> Handler:
@@ -69,6 +76,8 @@ class MethodHandlerFactory(HandlerFactory):
             subject_as_keyword=callable_policy.subject_as_keyword,
             arg_map=callable_policy.arg_map,
             arg_strict=callable_policy.arg_strict,
+            pool=callable_policy.pool,
+            compiled=callable_policy.compiled,
         )
 
     def create(self, obj: Any) -> Handler:
@@ -83,3 +92,49 @@ class MethodHandlerFactory(HandlerFactory):
         details = self._attribute_details(obj)
         arg = self._arg_get(details)
         return self._handler_create(details=details, arg=arg, obj=obj)
+
+
+class BatchHandlerFactory(HandlerFactory):
+    """
+    Batch handler factory.
+
+    Factory that produces batch callable handler from callable object,
+    that processes list of action subjects at once.
+    """
+
+    def __init__(self, policy: BatchHandlerPolicy):
+        """
+        Initializes batch handler factory.
+        :param policy: policy used as a configuration or specification
+        for producing handler object
+        """
+        callable_policy = policy.policy
+        self._obj_details = CallableObjDetails()
+        self._arg_get = BatchHandlerSubjectArgGet(name=callable_policy.subject_arg)
+        self._handler_create = CallableHandlerCreate(
+            subject_as_keyword=callable_policy.subject_as_keyword,
+            arg_map=callable_policy.arg_map,
+            arg_strict=callable_policy.arg_strict,
+            pool=callable_policy.pool,
+            compiled=callable_policy.compiled,
+        )
+        self._max_size = policy.max_size
+        self._max_delay = policy.max_delay
+
+    def create(self, obj: Any) -> Handler:
+        """
+        Creates batch handler from callable object.
+        :param obj: callable object
+        :raises IncompatibleHandlerFactoryError: when callable object is incompatible
+        with factory specification
+        :raises HandlerFactoryError: when there is failure during object inspection
+        :return: handler collecting actions into batches processed by callable object
+        """
+        details = self._obj_details(obj)
+        arg = self._arg_get(details)
+        return BatchCallableHandler(
+            handler=self._handler_create(details=details, arg=arg, obj=obj),
+            key=self._arg_get.item_type(details, arg),
+            max_size=self._max_size,
+            max_delay=self._max_delay,
+        )
@@ -2,10 +2,17 @@ from typing import Any, Callable, Dict, Mapping, Optional, Type
 
 from mediator.common.factory.base import HandlerFactory, HandlerFactoryMapper
 from mediator.common.factory.factories import (
+    BatchHandlerFactory,
     CallableHandlerFactory,
     MethodHandlerFactory,
 )
-from mediator.common.factory.policies import CallableHandlerPolicy, MethodHandlerPolicy
+from mediator.common.factory.policies import (
+    BatchHandlerPolicy,
+    CallableHandlerPolicy,
+    MethodHandlerPolicy,
+    ProcessCallableHandlerPolicy,
+    ThreadedCallableHandlerPolicy,
+)
 
 
 class TypeHandlerFactoryMapper(HandlerFactoryMapper):
@@ -42,8 +49,9 @@ class DefaultHandlerFactoryMapper(TypeHandlerFactoryMapper):
     """
     Library default handler factory mapper.
 
-    Maps `CallableHandlerPolicy` objects and `MethodHandlerPolicy` objects
-    into handler factories.
+    Maps `CallableHandlerPolicy`, `ThreadedCallableHandlerPolicy`,
+    `ProcessCallableHandlerPolicy`, `MethodHandlerPolicy`
+    and `BatchHandlerPolicy` objects into handler factories.
     """
 
     def __init__(
@@ -75,5 +83,8 @@ class DefaultHandlerFactoryMapper(TypeHandlerFactoryMapper):
         """
         return {
             CallableHandlerPolicy: CallableHandlerFactory,
+            ThreadedCallableHandlerPolicy: CallableHandlerFactory,
+            ProcessCallableHandlerPolicy: CallableHandlerFactory,
             MethodHandlerPolicy: MethodHandlerFactory,
+            BatchHandlerPolicy: BatchHandlerFactory,
         }
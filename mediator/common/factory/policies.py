@@ -1,6 +1,12 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Type, Union
 
+from mediator.common.handler.pools import (
+    HandlerPool,
+    ProcessHandlerPool,
+    ThreadHandlerPool,
+)
+
 
 class MappablePolicy:
     """
@@ -31,6 +37,10 @@ class CallableHandlerPolicy(MappablePolicy):
     arg_map: Dict[str, str] = field(default_factory=dict)
     # force fill all action arguments into callable or only ones defined in signature
     arg_strict: bool = False
+    # pool running synchronous callables; when not set only async ones are accepted
+    pool: Optional[HandlerPool] = None
+    # generate specialized invoker performing all argument processing in one step
+    compiled: bool = False
 
     @property
     def subject_as_keyword(self):
@@ -53,6 +63,32 @@ class CallableHandlerPolicy(MappablePolicy):
             return self
 
 
+@dataclass
+class ThreadedCallableHandlerPolicy(CallableHandlerPolicy):
+    """
+    Threaded callable handler policy.
+
+    Callable handler policy that accepts also synchronous callables
+    and runs them in thread pool, not blocking event loop.
+    """
+
+    # thread pool running synchronous callables
+    pool: Optional[HandlerPool] = field(default_factory=ThreadHandlerPool)
+
+
+@dataclass
+class ProcessCallableHandlerPolicy(CallableHandlerPolicy):
+    """
+    Process callable handler policy.
+
+    Callable handler policy that accepts also synchronous picklable callables
+    and runs them in process pool; suitable for CPU-bound handlers.
+    """
+
+    # process pool running synchronous callables
+    pool: Optional[HandlerPool] = field(default_factory=ProcessHandlerPool)
+
+
 @dataclass
 class MethodHandlerPolicy(MappablePolicy):
     """
@@ -94,4 +130,45 @@ class MethodHandlerPolicy(MappablePolicy):
             return self
 
 
-PolicyType = Union[CallableHandlerPolicy, MethodHandlerPolicy, MappablePolicy]
+@dataclass
+class BatchHandlerPolicy(MappablePolicy):
+    """
+    Batch handler policy.
+
+    Specification or recipe how to inspect callable object
+    that processes list of action subjects at once
+    and how should be built handler that collects single actions into batches.
+    """
+
+    # batch callable handler policy (primary argument is a list of action subjects)
+    policy: CallableHandlerPolicy = field(default_factory=CallableHandlerPolicy)
+    # max number of action subjects in single batch
+    max_size: int = 100
+    # max time in seconds that first action in batch waits for another ones;
+    # zero value collects actions executed in the same event loop iteration
+    max_delay: float = 0.0
+
+    def replace_map(self, policy: "MappablePolicy") -> "BatchHandlerPolicy":
+        """
+        Maps this policy into new one, patching internals by given policy.
+        :param policy: policy to patch internals
+        :return: new policy that is current one with replaced values form given one
+        """
+        if isinstance(policy, CallableHandlerPolicy):
+            return BatchHandlerPolicy(
+                policy=policy, max_size=self.max_size, max_delay=self.max_delay
+            )
+        elif isinstance(policy, BatchHandlerPolicy):
+            return policy
+        else:
+            return self
+
+
+PolicyType = Union[
+    CallableHandlerPolicy,
+    ThreadedCallableHandlerPolicy,
+    ProcessCallableHandlerPolicy,
+    MethodHandlerPolicy,
+    BatchHandlerPolicy,
+    MappablePolicy,
+]
@@ -1,10 +1,19 @@
+import asyncio
+from typing import List
+
 import pytest
 
 from mediator.common.factory import (
+    BatchHandlerFactory,
+    BatchHandlerPolicy,
     CallableHandlerFactory,
     CallableHandlerPolicy,
+    HandlerFactoryError,
+    IncompatibleHandlerFactoryError,
     MethodHandlerFactory,
     MethodHandlerPolicy,
+    ProcessCallableHandlerPolicy,
+    ThreadedCallableHandlerPolicy,
 )
 from mediator.common.handler import Handler
 from mediator.common.types import ActionResult, ActionSubject
@@ -39,6 +48,7 @@ async def _check_handler(handler: Handler):
         (_A().a, CallableHandlerPolicy(arg_strict=True)),
         (_A().b, CallableHandlerPolicy(arg_map={"x": "a", "y": "b"}, arg_strict=True)),
         (_A().c, CallableHandlerPolicy(arg_map={"x": "a"})),
+        (_A().c, CallableHandlerPolicy(arg_map={"x": "a"}, compiled=True)),
     ],
 )
 @pytest.mark.asyncio
@@ -67,3 +77,80 @@ async def test_method_handler_factory(obj, policy: MethodHandlerPolicy):
     factory = MethodHandlerFactory(policy)
     handler = factory.create(obj)
     await _check_handler(handler)
+
+
+class _Sync:
+    # noinspection PyMethodMayBeStatic
+    def a(self, arg: str, x: int, y: int):
+        return arg, x, y
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        CallableHandlerFactory(ThreadedCallableHandlerPolicy()),
+        MethodHandlerFactory(
+            MethodHandlerPolicy(name="a", policy=ThreadedCallableHandlerPolicy())
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_threaded_handler_factory(factory):
+    for obj in [_Sync(), _A()]:
+        if isinstance(factory, CallableHandlerFactory):
+            obj = obj.a
+        await _check_handler(factory.create(obj))
+
+
+def test_callable_handler_factory_sync_error():
+    factory = CallableHandlerFactory(CallableHandlerPolicy())
+    with pytest.raises(HandlerFactoryError):
+        factory.create(_Sync().a)
+
+
+def _process(arg: str, x: int, y: int):
+    return arg, x, y
+
+
+@pytest.mark.asyncio
+async def test_process_handler_factory():
+    def _local(arg: str, x: int, y: int):
+        return arg, x, y
+
+    policy = ProcessCallableHandlerPolicy()
+    factory = CallableHandlerFactory(policy)
+    try:
+        await _check_handler(factory.create(_process))
+        await _check_handler(factory.create(_A().a))
+        with pytest.raises(HandlerFactoryError, match="not picklable"):
+            factory.create(_local)
+    finally:
+        policy.pool.shutdown()
+
+
+async def _batch(args: List[str], x: int, y: int):
+    return [(arg, x, y) for arg in args]
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_factory():
+    factory = BatchHandlerFactory(BatchHandlerPolicy(max_size=2))
+    handler = factory.create(_batch)
+    assert handler.key is str
+    assert handler.obj is _batch
+    await _check_handler(handler)
+
+    results = await asyncio.gather(
+        *[
+            handler(ActionSubject(subject=f"test{i}", inject={"x": 1, "y": 2}))
+            for i in range(3)
+        ]
+    )
+    assert [result.result for result in results] == [
+        ("test0", 1, 2),
+        ("test1", 1, 2),
+        ("test2", 1, 2),
+    ]
+
+    with pytest.raises(IncompatibleHandlerFactoryError):
+        factory.create(_A().a)
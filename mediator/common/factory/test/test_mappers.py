@@ -1,11 +1,15 @@
 import pytest
 
 from mediator.common.factory import (
+    BatchHandlerFactory,
+    BatchHandlerPolicy,
     CallableHandlerFactory,
     CallableHandlerPolicy,
     DefaultHandlerFactoryMapper,
     MethodHandlerFactory,
     MethodHandlerPolicy,
+    ProcessCallableHandlerPolicy,
+    ThreadedCallableHandlerPolicy,
 )
 
 
@@ -13,7 +17,10 @@ from mediator.common.factory import (
     "policy, factory_type",
     [
         (CallableHandlerPolicy(), CallableHandlerFactory),
+        (ThreadedCallableHandlerPolicy(), CallableHandlerFactory),
+        (ProcessCallableHandlerPolicy(), CallableHandlerFactory),
         (MethodHandlerPolicy(name="method"), MethodHandlerFactory),
+        (BatchHandlerPolicy(), BatchHandlerFactory),
     ],
 )
 def test_default_handler_factory_mapper(policy, factory_type):
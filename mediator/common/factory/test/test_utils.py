@@ -1,9 +1,10 @@
-from typing import Dict, Optional, Sequence, Type
+from typing import Dict, List, Optional, Sequence, Type
 
 import pytest
 
 from mediator.common.factory import HandlerFactoryError, IncompatibleHandlerFactoryError
 from mediator.common.factory.utils import (
+    BatchHandlerSubjectArgGet,
     CallableAttributeDetails,
     CallableHandlerCreate,
     CallableObjDetails,
@@ -137,6 +138,41 @@ def test_subject_arg_get(
         assert arg.name == expected_name
 
 
+# noinspection PyUnusedLocal
+def _batch_method(
+    one: List[_A], two: Sequence[int], three: List[Optional[str]], four: _A, five
+):
+    pass
+
+
+@pytest.mark.parametrize(
+    "name, expected_type, error, error_message",
+    [
+        ("one", _A, None, None),
+        ("two", int, None, None),
+        ("three", None, HandlerFactoryError, "type annotation item is not a type"),
+        ("four", None, IncompatibleHandlerFactoryError, "is not a list"),
+        ("five", None, HandlerFactoryError, "no type annotation"),
+    ],
+)
+def test_batch_subject_arg_get(
+    name: str,
+    expected_type: Optional[type],
+    error: Optional[Type[Exception]],
+    error_message: Optional[str],
+):
+    arg_get = BatchHandlerSubjectArgGet(name=name)
+    details = CallableObjDetails()(_batch_method)
+    if error:
+        with pytest.raises(error) as e:
+            arg_get(details)
+        assert error_message and error_message in str(e.value)
+    else:
+        arg = arg_get(details)
+        assert arg.name == name
+        assert arg_get.item_type(details, arg) is expected_type
+
+
 def _result(*args, **kwargs):
     return args, kwargs
 
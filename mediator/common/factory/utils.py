@@ -1,10 +1,11 @@
+import collections.abc
 from typing import Any, Dict, Optional, Sequence, Tuple
 
 from mediator.common.factory.base import (
     HandlerFactoryError,
     IncompatibleHandlerFactoryError,
 )
-from mediator.common.handler import CallableHandler, Handler
+from mediator.common.handler import CallableHandler, Handler, HandlerPool
 from mediator.utils.inspection import CallableArg, CallableDetails, CallableInspector
 
 
@@ -173,13 +174,76 @@ class HandlerSubjectArgGet:
             )
 
 
+class BatchHandlerSubjectArgGet(HandlerSubjectArgGet):
+    """
+    Utility that finds primary argument for given batch callable object,
+    to be filled with list of action subjects.
+    """
+
+    _origins = (
+        list,
+        collections.abc.Sequence,
+        collections.abc.Collection,
+        collections.abc.Iterable,
+    )
+
+    @classmethod
+    def _check_type(cls, details: CallableDetails, arg: CallableArg):
+        """
+        Checks given primary argument candidate is a valid batch one
+        :param details: callable details
+        :param arg: primary argument candidate details
+        :raises IncompatibleHandlerFactoryError:
+        when given primary argument is not annotated as list of subjects
+        :raises HandlerFactoryError:
+        when for given primary argument cannot be determined unequivocal type
+        """
+        cls.item_type(details, arg)
+
+    @classmethod
+    def item_type(cls, details: CallableDetails, arg: CallableArg) -> type:
+        """
+        Provides action subject type of given batch primary argument.
+        :param details: callable details
+        :param arg: primary argument details
+        :raises IncompatibleHandlerFactoryError:
+        when given primary argument is not annotated as list of subjects
+        :raises HandlerFactoryError:
+        when for given primary argument cannot be determined unequivocal type
+        :return: action subject type
+        """
+        if arg.type is None:
+            raise HandlerFactoryError(
+                f"Callable {details.obj!r} argument {arg.name} has no type annotation"
+            )
+        origin = getattr(arg.type, "__origin__", None)
+        args: Tuple[Any, ...] = getattr(arg.type, "__args__", None) or ()
+        if origin not in cls._origins or len(args) != 1:
+            raise IncompatibleHandlerFactoryError(
+                f"Callable {details.obj!r} argument {arg.name}"
+                f" type annotation is not a list"
+            )
+        item_type = args[0]
+        if not isinstance(item_type, type):
+            raise HandlerFactoryError(
+                f"Callable {details.obj!r} argument {arg.name}"
+                f" type annotation item is not a type"
+            )
+        return item_type
+
+
 class CallableHandlerCreate:
     """
     Creates callable handler using given specification.
     """
 
     def __init__(
-        self, subject_as_keyword: bool, arg_map: Dict[str, str], arg_strict: bool
+        self,
+        subject_as_keyword: bool,
+        arg_map: Dict[str, str],
+        arg_strict: bool,
+        pool: Optional[HandlerPool] = None,
+        compiled: bool = False,
     ):
         """
         Initializes callable handler factory using given specification.
@@ -190,10 +254,15 @@ class CallableHandlerCreate:
         :param arg_strict: when True all action arguments will be provided for handler,
         when False only those that fits into handler callable arguments set
         (excessive ones will be dropped)
+        :param pool: (optional) pool running synchronous callables;
+        when not provided only async callables are accepted
+        :param compiled: when True handlers use generated specialized invokers
         """
         self.subject_as_keyword = subject_as_keyword
         self.arg_map = arg_map
         self.arg_strict = arg_strict
+        self.pool = pool
+        self.compiled = compiled
 
     def __call__(self, details: CallableDetails, arg: CallableArg, obj: Any) -> Handler:
         """
@@ -203,10 +272,20 @@ class CallableHandlerCreate:
         :param obj: underlying object
         - source of callable object and handler behaviour information object
         :raises HandlerFactoryError: when callable object is not async callable
+        and no pool for synchronous callables is provided
+        or given pool cannot run callable object
         :return: handler object that can call underlying callable using provided action
         """
+        fn = details.obj
         if not details.is_async:
-            raise HandlerFactoryError(f"Object {details.obj!r} is not async callable")
+            if self.pool is None:
+                raise HandlerFactoryError(
+                    f"Object {details.obj!r} is not async callable"
+                )
+            try:
+                fn = self.pool.wrap(fn)
+            except TypeError as e:
+                raise HandlerFactoryError(f"Object {details.obj!r}: {e}") from e
 
         subject_name: Optional[str]
         if self.subject_as_keyword or not arg.is_positional:
@@ -221,9 +300,10 @@ class CallableHandlerCreate:
 
         return CallableHandler(
             obj=obj,
-            fn=details.obj,
+            fn=fn,
             key=arg.type,
             subject_name=subject_name,
             arg_map=self.arg_map,
             allow_args=allow_args,
+            compiled=self.compiled,
         )
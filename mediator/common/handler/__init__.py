@@ -1,10 +1,20 @@
 from mediator.common.handler.base import Handler, HandlerInfo
-from mediator.common.handler.handlers import CallableHandler
+from mediator.common.handler.handlers import BatchCallableHandler, CallableHandler
+from mediator.common.handler.pools import (
+    HandlerPool,
+    ProcessHandlerPool,
+    ThreadHandlerPool,
+)
 
 __all__ = [
     # base
     "Handler",
     "HandlerInfo",
     # handlers
+    "BatchCallableHandler",
     "CallableHandler",
+    # pools
+    "HandlerPool",
+    "ProcessHandlerPool",
+    "ThreadHandlerPool",
 ]
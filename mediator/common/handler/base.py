@@ -1,4 +1,4 @@
-from typing import Any, Hashable
+from typing import Any, Awaitable, Callable, Hashable, Optional
 
 from mediator.common.types import ActionResult, ActionSubject
 
@@ -54,3 +54,12 @@ class Handler(HandlerInfo):
         :return: action result object including return value
         """
         raise NotImplementedError
+
+    def subject_call(self) -> Optional[Callable[[Any], Awaitable[Any]]]:
+        """
+        Provides optional fast path callable, that performs handler action
+        for action subject without extra arguments and returns raw result.
+        :return: fast path callable
+        or None when handler does not support direct subject calls
+        """
+        return None
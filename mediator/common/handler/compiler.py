@@ -0,0 +1,111 @@
+from typing import Any, Awaitable, Callable, Collection, Dict, List, Mapping, Optional
+
+from mediator.common.types import ActionCallType, ActionResult
+
+
+class CallableInvokerCompiler:
+    """
+    Callable invoker compiler.
+
+    Generates specialized action invoker for given callable specification,
+    that inlines subject placement, argument name mapping and filtering
+    into single function without intermediate dictionaries.
+    Invoker passes exactly the same values as generic argument processing;
+    when many action extra arguments map to the same allowed argument
+    the last one wins, so generic processing is inlined for such callables.
+    """
+
+    @classmethod
+    def compile(
+        cls,
+        fn: Callable[..., Awaitable[Any]],
+        subject_name: Optional[str],
+        arg_map: Mapping[str, str],
+        allow_args: Optional[Collection[str]],
+    ) -> ActionCallType:
+        """
+        Generates action invoker for given callable specification.
+        :param fn: callable to invoke
+        :param subject_name: main argument name;
+        when is not None, action main argument (subject) is provided as keyword arg,
+        else action main argument (subject) is placed as positional one
+        :param arg_map: action extra argument names to callable argument names map
+        :param allow_args: collection of callable argument names
+        to be filled with action extra arguments; when None all are provided
+        :return: async callable invoking given callable with action values
+        that returns result wrapped into `ActionResult` object
+        """
+        namespace: Dict[str, Any] = {
+            "_fn": fn,
+            "_ActionResult": ActionResult,
+            "_arg_get": dict(arg_map).get,
+            "_allow_args": frozenset(allow_args or ()),
+        }
+        source = "\n".join(cls._source(subject_name, arg_map, allow_args))
+        exec(compile(source, f"<invoker {fn!r}>", "exec"), namespace)
+        return namespace["_invoke"]
+
+    @classmethod
+    def _source(
+        cls,
+        subject_name: Optional[str],
+        arg_map: Mapping[str, str],
+        allow_args: Optional[Collection[str]],
+    ) -> List[str]:
+        """
+        Generates invoker source code lines.
+        :param subject_name: main argument name (or None for positional one)
+        :param arg_map: action extra argument names to callable argument names map
+        :param allow_args: allowed callable argument names (or None for all)
+        :return: invoker source code lines
+        """
+        if subject_name:
+            args = ""
+            subject = f"{subject_name!r}: action.subject"
+        else:
+            args = "action.subject, "
+            subject = ""
+
+        lines = ["async def _invoke(action):"]
+        if allow_args is None:
+            if arg_map:
+                lines.append(
+                    "    kwargs = {_arg_get(name, name): value"
+                    " for name, value in action.inject.items()}"
+                )
+                if subject_name:
+                    lines.append(f"    kwargs[{subject_name!r}] = action.subject")
+            elif subject_name:
+                lines.append(f"    kwargs = {{**action.inject, {subject}}}")
+            else:
+                lines.append("    kwargs = action.inject")
+        else:
+            sources: Dict[str, List[str]] = {}
+            for name in [*arg_map, *sorted(allow_args)]:
+                arg = arg_map.get(name, name)
+                if arg in allow_args and arg != subject_name:
+                    sources.setdefault(arg, [])
+                    if name not in sources[arg]:
+                        sources[arg].append(name)
+            if any(len(names) > 1 for names in sources.values()):
+                # value of colliding names depends on action extra arguments order
+                lines.append(
+                    "    kwargs = {_arg_get(name, name): value"
+                    " for name, value in action.inject.items()}"
+                )
+                lines.append(
+                    "    kwargs = {name: value for name, value in kwargs.items()"
+                    " if name in _allow_args}"
+                )
+                if subject_name:
+                    lines.append(f"    kwargs[{subject_name!r}] = action.subject")
+            else:
+                lines.append(f"    kwargs = {{{subject}}}")
+                if sources:
+                    lines.append("    inject = action.inject")
+                    lines.append("    if inject:")
+                    for arg, (name,) in sources.items():
+                        lines.append(f"        if {name!r} in inject:")
+                        lines.append(f"            kwargs[{arg!r}] = inject[{name!r}]")
+        lines.append(f"    return _ActionResult(await _fn({args}**kwargs))")
+        return lines
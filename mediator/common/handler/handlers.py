@@ -1,17 +1,22 @@
+import asyncio
 from typing import (
     Any,
     Awaitable,
     Callable,
     Collection,
+    Coroutine,
     Dict,
     Hashable,
+    List,
     Mapping,
     Optional,
+    Set,
     Tuple,
 )
 
 from mediator.common.handler.base import Handler
-from mediator.common.types import ActionResult, ActionSubject
+from mediator.common.handler.compiler import CallableInvokerCompiler
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
 
 
 class CallableHandler(Handler):
@@ -21,7 +26,16 @@ class CallableHandler(Handler):
     with prepared arguments sourced from action object.
     """
 
-    __slots__ = ("_obj", "_fn", "_key", "_arg_map", "_arg_filter", "_args")
+    __slots__ = (
+        "_obj",
+        "_fn",
+        "_key",
+        "_subject_name",
+        "_arg_map",
+        "_arg_filter",
+        "_args",
+        "_invoke",
+    )
 
     def __init__(
         self,
@@ -31,6 +45,7 @@ class CallableHandler(Handler):
         subject_name: Optional[str],
         arg_map: Mapping[str, str],
         allow_args: Optional[Collection[str]],
+        compiled: bool = False,
     ):
         """
         Creates callable handler object.
@@ -46,13 +61,21 @@ class CallableHandler(Handler):
         :param allow_args: collection of action only necessary argument names,
         used to make filter removing excessive arguments
         that may not fit into callable signature
+        :param compiled: when True specialized invoker is generated for given
+        specification, that performs all argument processing in single step
         """
         self._obj = obj
         self._fn = fn
         self._key = key
+        self._subject_name = subject_name
         self._arg_map = self._arg_map_factory(arg_map)
         self._arg_filter = self._arg_filter_factory(allow_args)
         self._args = self._args_factory(subject_name)
+        self._invoke: ActionCallType = self._call
+        if compiled:
+            self._invoke = CallableInvokerCompiler.compile(
+                fn=fn, subject_name=subject_name, arg_map=arg_map, allow_args=allow_args
+            )
 
     @property
     def key(self) -> Hashable:
@@ -70,7 +93,17 @@ class CallableHandler(Handler):
         """
         return self._obj
 
-    async def __call__(self, action: ActionSubject) -> ActionResult:
+    def __call__(self, action: ActionSubject) -> Coroutine[Any, Any, ActionResult]:
+        """
+        Performs arguments mapping, filtering and invokes underlying callable.
+        Uses generated invoker in compiled mode.
+        :param action: action containing call values
+        :return: coroutine providing callable returned value
+        wrapped into `ActionResult` object
+        """
+        return self._invoke(action)  # type: ignore
+
+    async def _call(self, action: ActionSubject) -> ActionResult:
         """
         Performs arguments mapping, filtering and invokes underlying callable.
         :param action: action containing call values
@@ -82,6 +115,22 @@ class CallableHandler(Handler):
         result = await self._fn(*args, **kwargs)
         return ActionResult(result)
 
+    def subject_call(self) -> Optional[Callable[[Any], Awaitable[Any]]]:
+        """
+        Provides fast path callable that invokes underlying callable
+        only with action subject and returns raw result.
+        :return: fast path callable
+        """
+        fn = self._fn
+        subject_name = self._subject_name
+        if not subject_name:
+            return fn
+
+        def _subject_call(subject: Any) -> Awaitable[Any]:
+            return fn(**{subject_name: subject})  # type: ignore
+
+        return _subject_call
+
     @classmethod
     def _arg_map_factory(cls, arg_map: Mapping[str, str]):
         """
@@ -155,3 +204,172 @@ class CallableHandler(Handler):
                 return (subject,), kwargs
 
         return _args
+
+
+class _Batch:
+    """
+    Actions collected to be processed in single batch handler call.
+    """
+
+    __slots__ = ("inject", "subjects", "futures", "timer")
+
+    def __init__(self, inject: Dict[str, Any]):
+        self.inject = inject
+        self.subjects: List[Any] = []
+        self.futures: List["asyncio.Future[Any]"] = []
+        self.timer: Optional[asyncio.Handle] = None
+
+
+class BatchCallableHandler(Handler):
+    """
+    Batch callable handler.
+    Collects single actions into batches
+    and processes them by underlying handler in one call.
+
+    Underlying handler is invoked with list of action subjects
+    and should return list of results in the same order (or None).
+    Only actions with equal extra arguments are collected into the same batch.
+    """
+
+    __slots__ = ("_handler", "_key", "_max_size", "_max_delay", "_pending", "_tasks")
+
+    def __init__(
+        self,
+        handler: Handler,
+        key: Hashable,
+        max_size: int,
+        max_delay: float,
+    ):
+        """
+        Creates batch callable handler object.
+        :param handler: handler processing action with list of subjects
+        :param key: handler hashable key (single action subject type)
+        :param max_size: max number of action subjects in single batch
+        :param max_delay: max time in seconds that first action in batch
+        waits for another ones; zero value collects actions
+        executed in the same event loop iteration
+        """
+        self._handler = handler
+        self._key = key
+        self._max_size = max_size
+        self._max_delay = max_delay
+        self._pending: List[_Batch] = []
+        self._tasks: Set["asyncio.Future[None]"] = set()
+
+    @property
+    def key(self) -> Hashable:
+        """
+        Provides unique key that will be used to match given handler with action.
+        :return: hashable key
+        """
+        return self._key
+
+    @property
+    def obj(self) -> Any:
+        """
+        Provides handler underlying object
+        :return: handler underlying object
+        """
+        return self._handler.obj
+
+    async def __call__(self, action: ActionSubject) -> ActionResult:
+        """
+        Adds action subject to batch and waits for batch processing result.
+        :param action: action containing call values
+        :return: result for given action subject wrapped into `ActionResult` object
+        """
+        loop = asyncio.get_event_loop()
+        batch = self._batch(action.inject, loop)
+        future = loop.create_future()
+        batch.subjects.append(action.subject)
+        batch.futures.append(future)
+        if len(batch.subjects) >= self._max_size:
+            self._flush(batch)
+        return ActionResult(await future)
+
+    def _batch(self, inject: Dict[str, Any], loop: asyncio.AbstractEventLoop):
+        """
+        Provides pending batch for given extra arguments or starts new one.
+        :param inject: action extra arguments
+        :param loop: running event loop
+        :return: pending batch
+        """
+        for batch in self._pending:
+            if batch.inject == inject:
+                return batch
+        batch = _Batch(inject)
+        if self._max_delay > 0:
+            batch.timer = loop.call_later(self._max_delay, self._flush, batch)
+        else:
+            batch.timer = loop.call_soon(self._flush, batch)
+        self._pending.append(batch)
+        return batch
+
+    def _flush(self, batch: _Batch):
+        """
+        Starts processing of given batch.
+        :param batch: batch to process
+        """
+        if batch not in self._pending:
+            return
+        self._pending.remove(batch)
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._process(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, batch: _Batch):
+        """
+        Processes given batch and provides results for all waiting actions.
+        Subjects of already cancelled actions are skipped
+        and processing is cancelled when all waiting actions are cancelled.
+        :param batch: batch to process
+        """
+        subjects = []
+        futures = []
+        for subject, future in zip(batch.subjects, batch.futures):
+            if not future.done():
+                subjects.append(subject)
+                futures.append(future)
+        if not futures:
+            return
+
+        # batch call is cancelled once all waiting actions are cancelled
+        task = asyncio.current_task()
+        waiting = len(futures)
+
+        def _cancelled(future: "asyncio.Future[Any]"):
+            nonlocal waiting
+            if future.cancelled():
+                waiting -= 1
+                if not waiting and task is not None:
+                    task.cancel()
+
+        for future in futures:
+            future.add_done_callback(_cancelled)
+
+        try:
+            result = await self._handler(
+                ActionSubject(subject=subjects, inject=batch.inject)
+            )
+            values = result.result
+            if values is None:
+                values = [None] * len(futures)
+            elif len(values) != len(futures):
+                raise ValueError(
+                    f"Batch handler {self.obj!r} returned {len(values)} results"
+                    f" for {len(futures)} subjects"
+                )
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future, value in zip(futures, values):
+                if not future.done():
+                    future.set_result(value)
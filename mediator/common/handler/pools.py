@@ -0,0 +1,308 @@
+import asyncio
+import contextvars
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Set, Tuple
+
+
+class HandlerPool:
+    """
+    Handler pool abstraction.
+
+    Runs synchronous handler callables outside of event loop thread.
+    """
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+        """
+        Provides async callable that runs given synchronous callable in pool.
+        :param fn: synchronous callable
+        :raises TypeError: when given callable cannot be run by pool
+        :return: async callable with the same signature
+        """
+        raise NotImplementedError
+
+    def shutdown(self, wait: bool = True):
+        """
+        Releases pool resources.
+        :param wait: when True waits for all pending calls to finish
+        """
+        raise NotImplementedError
+
+
+class ThreadHandlerPool(HandlerPool):
+    """
+    Thread handler pool.
+
+    Runs synchronous handler callables in bounded thread pool executor
+    (created on first use) and keeps track of queue depth.
+    Context variables of caller are visible inside handler callable.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        thread_name_prefix: str = "mediator-handler",
+    ):
+        """
+        Initializes thread handler pool.
+        :param max_workers: max number of worker threads;
+        when not provided `min(32, cpu count + 4)` is used
+        :param thread_name_prefix: worker thread name prefix
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+
+    @property
+    def queued(self) -> int:
+        """
+        Number of calls waiting for free worker thread.
+        :return: queue depth
+        """
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """
+        Number of calls currently running in worker threads.
+        :return: number of running calls
+        """
+        return self._running
+
+    @property
+    def completed(self) -> int:
+        """
+        Number of finished calls.
+        :return: number of finished calls
+        """
+        return self._completed
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Provides underlying thread pool executor.
+        :return: thread pool executor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.thread_name_prefix,
+            )
+        return self._executor
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+        """
+        Provides async callable that runs given synchronous callable in pool.
+        :param fn: synchronous callable
+        :return: async callable with the same signature
+        """
+
+        async def _call(*args, **kwargs):
+            return await self.run(fn, *args, **kwargs)
+
+        return _call
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs given synchronous callable in pool.
+        :param fn: synchronous callable
+        :param args: callable args
+        :param kwargs: callable keyword args
+        :return: callable result
+        """
+        context = contextvars.copy_context()
+        with self._lock:
+            self._queued += 1
+        future = self.executor.submit(self._work, context, fn, args, kwargs)
+        future.add_done_callback(self._done)
+        return await asyncio.wrap_future(future)
+
+    def _work(
+        self,
+        context: contextvars.Context,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        Runs given callable in worker thread and updates counters.
+        :param context: caller context
+        :param fn: synchronous callable
+        :param args: callable args
+        :param kwargs: callable keyword args
+        :return: callable result
+        """
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return context.run(fn, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def _done(self, future: Future):
+        """
+        Updates counters for calls cancelled before start.
+        :param future: finished call future
+        """
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts down underlying thread pool executor.
+        :param wait: when True waits for all pending calls to finish
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def _warm_up(delay: float) -> int:
+    """
+    Process pool worker warm-up call.
+    :param delay: time to keep worker busy, so other workers are started
+    :return: worker process id
+    """
+    time.sleep(delay)
+    return os.getpid()
+
+
+class ProcessHandlerPool(HandlerPool):
+    """
+    Process handler pool.
+
+    Runs synchronous CPU-bound handler callables in process pool executor
+    (created on first use), so they are not limited by GIL.
+    Handler callables, action subjects and extra arguments have to be picklable;
+    module level functions are transferred by reference.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        mp_context: Optional[Any] = None,
+        initializer: Optional[Callable[..., Any]] = None,
+        initargs: Sequence[Any] = (),
+    ):
+        """
+        Initializes process handler pool.
+        :param max_workers: max number of worker processes;
+        when not provided cpu count is used
+        :param mp_context: (optional) multiprocessing context
+        used to start worker processes
+        :param initializer: (optional) callable invoked at start of every worker,
+        i.e. to import heavy modules or load data
+        :param initargs: initializer arguments
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self.initializer = initializer
+        self.initargs = tuple(initargs)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._completed = 0
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of submitted calls that are not finished yet (queued or running).
+        :return: number of pending calls
+        """
+        return self._pending
+
+    @property
+    def completed(self) -> int:
+        """
+        Number of finished calls.
+        :return: number of finished calls
+        """
+        return self._completed
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """
+        Provides underlying process pool executor.
+        :return: process pool executor
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        return self._executor
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+        """
+        Provides async callable that runs given synchronous callable in pool.
+        :param fn: synchronous callable
+        :raises TypeError: when given callable is not picklable
+        :return: async callable with the same signature
+        """
+        try:
+            pickle.dumps(fn)
+        except Exception as e:
+            raise TypeError(f"Callable {fn!r} is not picklable: {e}") from e
+
+        async def _call(*args, **kwargs):
+            return await self.run(fn, *args, **kwargs)
+
+        return _call
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs given synchronous callable in worker process.
+        :param fn: synchronous picklable callable
+        :param args: callable args
+        :param kwargs: callable keyword args
+        :return: callable result
+        """
+        future = self.executor.submit(fn, *args, **kwargs)
+        self._pending += 1
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+
+    async def warm_up(self, delay: float = 0.05) -> Set[int]:
+        """
+        Starts all worker processes (and runs initializer in them) in advance,
+        so first handler calls do not pay process start cost.
+        :param delay: time every warm-up call keeps worker busy
+        :return: set of started worker process ids
+        """
+        futures = [
+            asyncio.wrap_future(self.executor.submit(_warm_up, delay))
+            for _ in range(self.max_workers)
+        ]
+        return set(await asyncio.gather(*futures))
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts down underlying process pool executor.
+        :param wait: when True waits for all pending calls to finish
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
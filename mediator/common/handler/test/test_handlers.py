@@ -1,6 +1,10 @@
+import asyncio
+import itertools
+from typing import List
+
 import pytest
 
-from mediator.common.handler import CallableHandler
+from mediator.common.handler import BatchCallableHandler, CallableHandler
 from mediator.common.types import ActionResult, ActionSubject
 
 
@@ -23,13 +27,18 @@ def _result(*args, **kwargs):
         (None, {}, None, _result("test", a=10, b=20)),
         ("subject", {}, None, _result(subject="test", a=10, b=20)),
         (None, {"a": "x"}, None, _result("test", x=10, b=20)),
+        ("subject", {"a": "x"}, None, _result(subject="test", x=10, b=20)),
         ("subject", {"a": "x", "b": "y"}, None, _result(subject="test", x=10, y=20)),
         ("subject", {"a": "x", "b": "y"}, {"x"}, _result(subject="test", x=10)),
+        (None, {}, {"a", "c"}, _result("test", a=10)),
+        ("subject", {}, {"subject", "b"}, _result(subject="test", b=20)),
+        (None, {"b": "a"}, {"a"}, _result("test", a=20)),
     ],
 )
+@pytest.mark.parametrize("compiled", [False, True])
 @pytest.mark.asyncio
 async def test_callable_handler_call(
-    action: ActionSubject, subject_name, arg_map, allow_args, expected_result
+    action: ActionSubject, subject_name, arg_map, allow_args, expected_result, compiled
 ):
     handler = CallableHandler(
         obj=_fn,
@@ -38,6 +47,7 @@ async def test_callable_handler_call(
         subject_name=subject_name,
         arg_map=arg_map,
         allow_args=allow_args,
+        compiled=compiled,
     )
     assert handler.key == str
     assert handler.obj == _fn
@@ -46,6 +56,76 @@ async def test_callable_handler_call(
     assert result.result == expected_result
 
 
+@pytest.mark.parametrize(
+    "subject_name, arg_map, allow_args, inject",
+    list(
+        itertools.product(
+            [None, "subject"],
+            [{}, {"x": "y"}, {"y": "x"}, {"x": "y", "z": "y"}, {"x": "subject"}],
+            [None, {"y"}, {"x", "y"}, {"subject", "y"}],
+            [{"x": 1, "y": 2}, {"y": 2, "x": 1}, {"x": 1, "z": 3, "y": 2}, {}],
+        )
+    ),
+)
+@pytest.mark.asyncio
+async def test_callable_handler_compiled_args(
+    subject_name, arg_map, allow_args, inject
+):
+    # compiled invoker passes the same values as generic one, also for collisions
+    results = []
+    for compiled in (False, True):
+        handler = CallableHandler(
+            obj=_fn,
+            fn=_fn,
+            key=str,
+            subject_name=subject_name,
+            arg_map=arg_map,
+            allow_args=allow_args,
+            compiled=compiled,
+        )
+        results.append(await handler(ActionSubject("test", dict(inject))))
+    generic, compiled_result = results
+    assert compiled_result.result == generic.result
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+@pytest.mark.asyncio
+async def test_callable_handler_call_empty(compiled):
+    handler = CallableHandler(
+        obj=_fn,
+        fn=_fn,
+        key=str,
+        subject_name="subject",
+        arg_map={"a": "x"},
+        allow_args={"x"},
+        compiled=compiled,
+    )
+    result = await handler(ActionSubject(subject="test", inject={}))
+    assert result.result == _result(subject="test")
+
+
+@pytest.mark.parametrize(
+    "subject_name, expected_result",
+    [
+        (None, _result("test")),
+        ("subject", _result(subject="test")),
+    ],
+)
+@pytest.mark.asyncio
+async def test_callable_handler_subject_call(subject_name, expected_result):
+    handler = CallableHandler(
+        obj=_fn,
+        fn=_fn,
+        key=str,
+        subject_name=subject_name,
+        arg_map={"a": "x"},
+        allow_args={"x"},
+    )
+    subject_call = handler.subject_call()
+    assert subject_call is not None
+    assert await subject_call("test") == expected_result
+
+
 class _SpecificError(Exception):
     pass
 
@@ -54,8 +134,9 @@ async def _error_fn(*arg, **kwargs):
     raise _SpecificError(f"{arg} {kwargs}")
 
 
+@pytest.mark.parametrize("compiled", [False, True])
 @pytest.mark.asyncio
-async def test_callable_handler_error(action: ActionSubject):
+async def test_callable_handler_error(action: ActionSubject, compiled):
     handler = CallableHandler(
         obj=_error_fn,
         fn=_error_fn,
@@ -63,6 +144,109 @@ async def test_callable_handler_error(action: ActionSubject):
         subject_name="subject",
         arg_map={},
         allow_args=None,
+        compiled=compiled,
     )
     with pytest.raises(_SpecificError):
         await handler(action)
+
+
+def _batch_handler(fn, max_size: int = 10, max_delay: float = 0.0):
+    return BatchCallableHandler(
+        handler=CallableHandler(
+            obj=fn,
+            fn=fn,
+            key=list,
+            subject_name=None,
+            arg_map={},
+            allow_args=None,
+        ),
+        key=str,
+        max_size=max_size,
+        max_delay=max_delay,
+    )
+
+
+@pytest.mark.parametrize(
+    "max_size, max_delay, expected_batches",
+    [
+        (10, 0.0, [["a", "b", "c"], ["d"]]),
+        (2, 0.0, [["a", "b"], ["c"], ["d"]]),
+        (10, 0.01, [["a", "b", "c"], ["d"]]),
+    ],
+)
+@pytest.mark.asyncio
+async def test_batch_callable_handler_call(max_size, max_delay, expected_batches):
+    batches = []
+
+    async def _fn(subjects: List[str], **kwargs):
+        batches.append(subjects)
+        return [(subject, kwargs) for subject in subjects]
+
+    handler = _batch_handler(_fn, max_size=max_size, max_delay=max_delay)
+    assert handler.key == str
+    assert handler.obj == _fn
+    actions = [
+        ActionSubject(subject="a", inject={"x": 1}),
+        ActionSubject(subject="b", inject={"x": 1}),
+        ActionSubject(subject="c", inject={"x": 1}),
+        ActionSubject(subject="d", inject={"x": 2}),
+    ]
+    results = await asyncio.gather(*[handler(action) for action in actions])
+    assert [result.result for result in results] == [
+        (action.subject, action.inject) for action in actions
+    ]
+    assert batches == expected_batches
+
+
+@pytest.mark.asyncio
+async def test_batch_callable_handler_error():
+    async def _fn(subjects: List[str]):
+        if "error" in subjects:
+            raise _SpecificError()
+        if "invalid" in subjects:
+            return []
+        if "cancel" in subjects:
+            await asyncio.sleep(10)
+        return None
+
+    handler = _batch_handler(_fn)
+    assert (await handler(ActionSubject(subject="none", inject={}))).result is None
+    for subject, error in [("error", _SpecificError), ("invalid", ValueError)]:
+        with pytest.raises(error):
+            await asyncio.gather(
+                handler(ActionSubject(subject=subject, inject={})),
+                handler(ActionSubject(subject="other", inject={})),
+            )
+
+    task = asyncio.ensure_future(handler(ActionSubject(subject="cancel", inject={})))
+    await asyncio.sleep(0.001)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_batch_callable_handler_cancel():
+    cancelled: List[List[str]] = []
+
+    async def _fn(subjects: List[str]):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(subjects)
+            raise
+
+    handler = _batch_handler(_fn)
+    tasks = [
+        asyncio.ensure_future(handler(ActionSubject(subject=subject, inject={})))
+        for subject in ["a", "b"]
+    ]
+    await asyncio.sleep(0.001)
+    tasks[0].cancel()
+    await asyncio.sleep(0.001)
+    assert cancelled == []
+
+    tasks[1].cancel()
+    await asyncio.wait(tasks)
+    await asyncio.sleep(0)
+    assert cancelled == [["a", "b"]]
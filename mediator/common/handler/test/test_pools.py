@@ -0,0 +1,87 @@
+import asyncio
+import contextvars
+import os
+import threading
+
+import pytest
+
+from mediator.common.handler import ProcessHandlerPool, ThreadHandlerPool
+
+_var: contextvars.ContextVar[str] = contextvars.ContextVar("_var")
+
+
+@pytest.mark.asyncio
+async def test_thread_handler_pool():
+    pool = ThreadHandlerPool(max_workers=1)
+    release = threading.Event()
+
+    def _fn(value: int, *, wait: bool = False):
+        if wait:
+            release.wait(timeout=1.0)
+        return value, _var.get(), threading.current_thread().name
+
+    call = pool.wrap(_fn)
+    _var.set("context")
+    first = asyncio.ensure_future(call(1, wait=True))
+    second = asyncio.ensure_future(call(2))
+    for _ in range(100):
+        await asyncio.sleep(0.001)
+        if pool.running:
+            break
+    assert (pool.queued, pool.running, pool.completed) == (1, 1, 0)
+
+    release.set()
+    results = await asyncio.gather(first, second)
+    assert [result[:2] for result in results] == [(1, "context"), (2, "context")]
+    assert all(result[2].startswith("mediator-handler") for result in results)
+    assert (pool.queued, pool.running, pool.completed) == (0, 0, 2)
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_handler_pool_cancel():
+    pool = ThreadHandlerPool(max_workers=1)
+    release = threading.Event()
+    first = asyncio.ensure_future(pool.run(release.wait, 1.0))
+    second = asyncio.ensure_future(pool.run(release.wait, 1.0))
+    await asyncio.sleep(0.01)
+    second.cancel()
+    await asyncio.sleep(0.01)
+    release.set()
+    await first
+    assert (pool.queued, pool.running, pool.completed) == (0, 0, 1)
+    pool.shutdown()
+
+
+def test_thread_handler_pool_config():
+    assert ThreadHandlerPool().max_workers > 0
+    with pytest.raises(ValueError):
+        ThreadHandlerPool(max_workers=0)
+
+
+def _process_fn(value: int, *, offset: int = 0):
+    return value + offset, os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_process_handler_pool():
+    pool = ProcessHandlerPool(max_workers=2)
+    try:
+        pids = await pool.warm_up(delay=0.01)
+        assert pids and os.getpid() not in pids
+
+        call = pool.wrap(_process_fn)
+        results = await asyncio.gather(*[call(i, offset=1) for i in range(4)])
+        assert [result[0] for result in results] == [1, 2, 3, 4]
+        assert {result[1] for result in results} <= pids
+        assert (pool.pending, pool.completed) == (0, 4)
+    finally:
+        pool.shutdown()
+
+
+def test_process_handler_pool_config():
+    assert ProcessHandlerPool().max_workers > 0
+    with pytest.raises(ValueError):
+        ProcessHandlerPool(max_workers=0)
+    with pytest.raises(TypeError):
+        ProcessHandlerPool().wrap(lambda value: value)
@@ -0,0 +1,82 @@
+from mediator.common.modifiers.base import (  # noqa F401
+    ActionCallType,
+    ActionResult,
+    ActionSubject,
+    ModifierError,
+    ModifierFactory,
+    ModifierStack,
+    action_identity,
+    modifier_target,
+)
+from mediator.common.modifiers.bulkhead import (
+    BulkheadModifierFactory,
+    BulkheadRejectedError,
+    BulkheadStats,
+)
+from mediator.common.modifiers.cache import CacheModifierFactory
+from mediator.common.modifiers.codel import CoDelModifierFactory, OverloadedError
+from mediator.common.modifiers.deadline import (
+    DeadlineExceededError,
+    DeadlineModifierFactory,
+    current_deadline,
+    remaining_time,
+)
+from mediator.common.modifiers.fair import FairQueueModifierFactory
+from mediator.common.modifiers.flight import SingleFlightModifierFactory
+from mediator.common.modifiers.hedge import HedgeModifierFactory
+from mediator.common.modifiers.limit import (
+    AdaptiveLimiter,
+    AdaptiveLimitModifierFactory,
+    LimitExceededError,
+)
+from mediator.common.modifiers.metrics import HandlerStats, MetricsModifierFactory
+from mediator.common.modifiers.profiler import (
+    SlowCallProfilerModifierFactory,
+    SlowCallRecord,
+)
+from mediator.common.modifiers.rate import (
+    RateLimitExceededError,
+    RateLimitModifierFactory,
+)
+
+__all__ = [
+    # base
+    "ModifierError",
+    "ModifierFactory",
+    "ModifierStack",
+    "action_identity",
+    "modifier_target",
+    # bulkhead
+    "BulkheadModifierFactory",
+    "BulkheadRejectedError",
+    "BulkheadStats",
+    # cache
+    "CacheModifierFactory",
+    # codel
+    "CoDelModifierFactory",
+    "OverloadedError",
+    # deadline
+    "DeadlineExceededError",
+    "DeadlineModifierFactory",
+    "current_deadline",
+    "remaining_time",
+    # fair
+    "FairQueueModifierFactory",
+    # flight
+    "SingleFlightModifierFactory",
+    # hedge
+    "HedgeModifierFactory",
+    # limit
+    "AdaptiveLimiter",
+    "AdaptiveLimitModifierFactory",
+    "LimitExceededError",
+    # metrics
+    "HandlerStats",
+    "MetricsModifierFactory",
+    # profiler
+    "SlowCallProfilerModifierFactory",
+    "SlowCallRecord",
+    # rate
+    "RateLimitExceededError",
+    "RateLimitModifierFactory",
+]
@@ -1,5 +1,6 @@
-from typing import Sequence
+from typing import Any, Hashable, Mapping, Optional, Sequence
 
+from mediator.common.handler.base import HandlerInfo
 from mediator.common.types import (  # noqa F401
     ActionCallType,
     ActionResult,
@@ -7,6 +8,14 @@ from mediator.common.types import (  # noqa F401
 )
 
 
+class ModifierError(Exception):
+    """
+    Modifier base error.
+
+    All errors raised by library modifiers inherits from it.
+    """
+
+
 class ModifierFactory:
     """
     Modifier factory.
@@ -39,6 +48,40 @@ class ModifierFactory:
         raise NotImplementedError
 
 
+def modifier_target(kwargs: Mapping[str, Any]) -> Optional[HandlerInfo]:
+    """
+    Provides handler information of final callable in modifier stack.
+    :param kwargs: extra context information given to `ModifierFactory.create`
+    :return: handler information or None when final callable is not a handler
+    """
+    target = kwargs.get("target")
+    if isinstance(target, HandlerInfo):
+        return target
+    return None
+
+
+def action_identity(
+    scope: Any, action: ActionSubject, inject_args: Optional[Sequence[str]] = None
+) -> Hashable:
+    """
+    Provides identity of action processed in given scope (handler).
+    :param scope: identity scope (handler)
+    :param action: action subject
+    :param inject_args: (optional) names of extra arguments
+    that are part of action identity;
+    when not provided all extra arguments are part of action identity
+    :raises TypeError: when action subject or extra argument is not hashable
+    :return: hashable action identity
+    """
+    inject = action.inject
+    if inject_args is None:
+        identity = (scope, action.subject, frozenset(inject.items()))
+    else:
+        identity = (scope, action.subject, *[inject.get(name) for name in inject_args])
+    hash(identity)
+    return identity
+
+
 class ModifierStack:
     """
     Utility for build modifier stacks that wraps action callable.
@@ -0,0 +1,225 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Hashable, Mapping, Optional
+
+from mediator.common.modifiers.base import (
+    ModifierError,
+    ModifierFactory,
+    modifier_target,
+)
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+
+class BulkheadRejectedError(ModifierError):
+    """
+    Bulkhead rejected error.
+
+    Raised when handler concurrency limit is reached and action cannot be queued.
+    """
+
+    def __init__(self, *args, key: Hashable):
+        """
+        Initializes bulkhead rejected error.
+        :param args: python exception args
+        :param key: handler key of rejected action
+        """
+        super().__init__(*args)
+        self.key = key
+
+
+@dataclass(frozen=True)
+class BulkheadStats:
+    """
+    Bulkhead statistics snapshot.
+
+    Wait time is measured from action arrival to handler start,
+    run time from handler start to handler finish.
+    """
+
+    limit: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    wait_time: float
+    max_wait_time: float
+    run_time: float
+
+
+class _Bulkhead:
+    """
+    Concurrency limit state of single handler key.
+    """
+
+    __slots__ = (
+        "limit",
+        "max_queue",
+        "in_flight",
+        "waiters",
+        "completed",
+        "rejected",
+        "wait_time",
+        "max_wait_time",
+        "run_time",
+    )
+
+    def __init__(self, limit: int, max_queue: Optional[int]):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.completed = 0
+        self.rejected = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.run_time = 0.0
+
+    def release(self):
+        """
+        Hands over execution slot to the first waiting action or frees it.
+        """
+        waiters = self.waiters
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+class BulkheadModifierFactory(ModifierFactory):
+    """
+    Bulkhead modifier factory.
+
+    Produces modifiers that cap number of concurrently processed actions
+    per handler key (action type), so one slow action type cannot starve others.
+    Actions over limit wait for free slot in FIFO order
+    or are rejected with `BulkheadRejectedError` when wait queue is full.
+    Handlers with the same key share their limit.
+    """
+
+    _bulkheads: Dict[Hashable, _Bulkhead]
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limits: Optional[Mapping[Hashable, int]] = None,
+        max_queue: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes bulkhead modifier factory.
+        :param limit: (optional) default max number of concurrently processed actions;
+        when not provided only handler keys present in limits are limited
+        :param limits: (optional) handler key (action type) to concurrency limit
+        mapping; overrides default limit
+        :param max_queue: (optional) max number of actions waiting for free slot;
+        zero rejects actions over limit immediately,
+        when not provided wait queue is unbounded
+        :param clock: time source
+        """
+        if limit is not None and limit <= 0:
+            raise ValueError("limit must be greater than 0")
+        if any(value <= 0 for value in (limits or {}).values()):
+            raise ValueError("limits must be greater than 0")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        self.limit = limit
+        self.limits = dict(limits or {})
+        self.max_queue = max_queue
+        self.clock = clock
+        self._bulkheads = {}
+
+    def stats(self, key: Hashable) -> Optional[BulkheadStats]:
+        """
+        Provides statistics of given handler key.
+        :param key: handler key (action type)
+        :return: statistics snapshot or None when key is not limited
+        """
+        bulkhead = self._bulkheads.get(key)
+        if bulkhead is None:
+            return None
+        return BulkheadStats(
+            limit=bulkhead.limit,
+            in_flight=bulkhead.in_flight,
+            queued=len(bulkhead.waiters),
+            completed=bulkhead.completed,
+            rejected=bulkhead.rejected,
+            wait_time=bulkhead.wait_time,
+            max_wait_time=bulkhead.max_wait_time,
+            run_time=bulkhead.run_time,
+        )
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces bulkhead modifier for given callable.
+        When handler key is not limited returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: bulkhead modifier
+        """
+        target = modifier_target(kwargs)
+        key = None if target is None else target.key
+        limit = self.limits.get(key, self.limit)
+        if limit is None:
+            return call
+
+        bulkhead = self._bulkheads.get(key)
+        if bulkhead is None:
+            bulkhead = _Bulkhead(limit, self.max_queue)
+            self._bulkheads[key] = bulkhead
+        clock = self.clock
+
+        async def _bulkhead(action: ActionSubject) -> ActionResult:
+            arrived = clock()
+            if bulkhead.in_flight < bulkhead.limit and not bulkhead.waiters:
+                bulkhead.in_flight += 1
+            else:
+                await self._wait(bulkhead, key)
+
+            started = clock()
+            wait_time = started - arrived
+            bulkhead.wait_time += wait_time
+            if wait_time > bulkhead.max_wait_time:
+                bulkhead.max_wait_time = wait_time
+            try:
+                return await call(action)
+            finally:
+                bulkhead.run_time += clock() - started
+                bulkhead.completed += 1
+                bulkhead.release()
+
+        return _bulkhead
+
+    @staticmethod
+    async def _wait(bulkhead: _Bulkhead, key: Hashable):
+        """
+        Waits for free execution slot.
+        :param bulkhead: handler key concurrency limit state
+        :param key: handler key
+        :raises BulkheadRejectedError: when wait queue is full
+        """
+        waiters = bulkhead.waiters
+        if bulkhead.max_queue is not None and len(waiters) >= bulkhead.max_queue:
+            bulkhead.rejected += 1
+            raise BulkheadRejectedError(
+                f"Concurrency limit {bulkhead.limit} reached for key {key}", key=key
+            )
+
+        waiter = asyncio.get_event_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # slot was already handed over, pass it to the next one
+                bulkhead.release()
+            else:
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    # cancelled waiter was already skipped by release
+                    pass
+            raise
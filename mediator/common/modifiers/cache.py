@@ -0,0 +1,123 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Collection, Hashable, Optional, Sequence, Tuple
+
+from mediator.common.modifiers.base import (
+    ModifierFactory,
+    action_identity,
+    modifier_target,
+)
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+
+class CacheModifierFactory(ModifierFactory):
+    """
+    Cache modifier factory.
+
+    Produces modifiers that store handler results
+    and return them without handler invocation for equal actions.
+    Action is identified by handler, action subject
+    and values of extra arguments (all of them unless selected),
+    so action subject and extra arguments should be hashable
+    (like frozen dataclass);
+    actions with unhashable identity are always passed to handler.
+    Intended for idempotent requests (queries) only.
+    """
+
+    _entries: "OrderedDict[Hashable, Tuple[float, ActionResult]]"
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        keys: Optional[Collection[Hashable]] = None,
+        inject_args: Optional[Sequence[str]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes cache modifier factory.
+        :param max_size: max number of stored results;
+        least recently used results are evicted first
+        :param ttl: (optional) result time to live in seconds;
+        when not provided results are stored until evicted
+        :param keys: (optional) collection of handler keys (action types)
+        to be cached; when not provided all handlers are cached
+        :param inject_args: (optional) names of extra arguments
+        that are part of action identity;
+        when not provided all extra arguments are part of action identity
+        :param clock: time source
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.keys = None if keys is None else frozenset(keys)
+        self.inject_args = None if inject_args is None else tuple(inject_args)
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of currently stored results.
+        :return: number of stored results
+        """
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Removes all stored results.
+        """
+        self._entries.clear()
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces caching modifier for given callable.
+        When handler key is not opted in returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: caching modifier
+        """
+        target = modifier_target(kwargs)
+        if self.keys is not None and (target is None or target.key not in self.keys):
+            return call
+
+        scope: Any = call if target is None else target
+        inject_args = self.inject_args
+        entries = self._entries
+        clock = self.clock
+
+        async def _cache(action: ActionSubject) -> ActionResult:
+            try:
+                identity = action_identity(scope, action, inject_args)
+                entry = entries.get(identity)
+            except TypeError:
+                return await call(action)
+
+            if entry is not None:
+                expires, result = entry
+                if expires >= clock():
+                    entries.move_to_end(identity)
+                    self.hits += 1
+                    return result
+                del entries[identity]
+
+            self.misses += 1
+            result = await call(action)
+            self._store(identity, result)
+            return result
+
+        return _cache
+
+    def _store(self, identity: Hashable, result: ActionResult):
+        """
+        Stores given result and evicts least recently used ones over size limit.
+        :param identity: action identity
+        :param result: action result to store
+        """
+        entries = self._entries
+        expires = float("inf") if self.ttl is None else self.clock() + self.ttl
+        entries[identity] = (expires, result)
+        entries.move_to_end(identity)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
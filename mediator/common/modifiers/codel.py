@@ -0,0 +1,229 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Callable, Collection, Deque, Hashable, Optional, Tuple
+
+from mediator.common.modifiers.base import (
+    ModifierError,
+    ModifierFactory,
+    modifier_target,
+)
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+
+class OverloadedError(ModifierError):
+    """
+    Overloaded error.
+
+    Raised when action is dropped by admission control,
+    because it waited too long for handler start.
+    """
+
+    def __init__(self, *args, key: Hashable, sojourn: float):
+        """
+        Initializes overloaded error.
+        :param args: python exception args
+        :param key: handler key of dropped action
+        :param sojourn: time action waited for handler start in seconds
+        """
+        super().__init__(*args)
+        self.key = key
+        self.sojourn = sojourn
+
+
+class _CoDel:
+    """
+    Controlled delay (CoDel) drop decision state.
+    """
+
+    __slots__ = (
+        "target",
+        "interval",
+        "first_above",
+        "dropping",
+        "drop_next",
+        "count",
+        "last_count",
+    )
+
+    def __init__(self, target: float, interval: float):
+        self.target = target
+        self.interval = interval
+        self.first_above: Optional[float] = None
+        self.dropping = False
+        self.drop_next = 0.0
+        self.count = 0
+        self.last_count = 0
+
+    def should_drop(self, now: float, sojourn: float) -> bool:
+        """
+        Decides if dequeued action should be dropped.
+        :param now: current time
+        :param sojourn: time dequeued action waited
+        :return: True when action should be dropped
+        """
+        ok_to_drop = False
+        if sojourn < self.target:
+            self.first_above = None
+        elif self.first_above is None:
+            self.first_above = now + self.interval
+        elif now >= self.first_above:
+            ok_to_drop = True
+
+        if self.dropping:
+            if not ok_to_drop:
+                self.dropping = False
+            elif now >= self.drop_next:
+                self.count += 1
+                self.drop_next = self._control_law(self.drop_next)
+                return True
+            return False
+
+        if ok_to_drop:
+            self.dropping = True
+            delta = self.count - self.last_count
+            recent = now - self.drop_next < 16 * self.interval
+            self.count = delta if delta > 1 and recent else 1
+            self.last_count = self.count
+            self.drop_next = self._control_law(now)
+            return True
+        return False
+
+    def _control_law(self, t: float) -> float:
+        """
+        Provides next drop time - drop rate grows with square root of drop count.
+        :param t: reference time
+        :return: next drop time
+        """
+        return t + self.interval / math.sqrt(self.count)
+
+
+class CoDelModifierFactory(ModifierFactory):
+    """
+    CoDel admission control modifier factory.
+
+    Produces modifiers that share one concurrency limit and FIFO wait queue.
+    Time every action waits for handler start (sojourn time) is measured
+    when it leaves the queue and actions are dropped with `OverloadedError`
+    following CoDel algorithm: once sojourn time stays above target
+    for whole interval, actions are dropped with increasing rate
+    until sojourn time goes below target again.
+    So short bursts are queued, while standing queue is drained,
+    and callers fail fast instead of waiting for useless results.
+    """
+
+    _waiters: Deque[Tuple[float, Hashable, asyncio.Future]]
+
+    def __init__(
+        self,
+        limit: int = 100,
+        target: float = 0.005,
+        interval: float = 0.1,
+        keys: Optional[Collection[Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes CoDel admission control modifier factory.
+        :param limit: max number of concurrently processed actions
+        :param target: acceptable sojourn time in seconds
+        :param interval: time sojourn time has to stay above target
+        before actions are dropped; should be close to typical handler latency
+        :param keys: (optional) collection of handler keys (action types)
+        to be controlled; when not provided all handlers are controlled
+        :param clock: time source
+        """
+        if limit <= 0:
+            raise ValueError("limit must be greater than 0")
+        if target <= 0 or interval <= 0:
+            raise ValueError("target and interval must be greater than 0")
+        self.limit = limit
+        self.keys = None if keys is None else frozenset(keys)
+        self.clock = clock
+        self.in_flight = 0
+        self.dropped = 0
+        self._codel = _CoDel(target, interval)
+        self._waiters = deque()
+
+    @property
+    def queued(self) -> int:
+        """
+        Number of actions waiting for handler start.
+        :return: queue length
+        """
+        return len(self._waiters)
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces CoDel admission control modifier for given callable.
+        When handler key is not opted in returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: CoDel admission control modifier
+        """
+        target = modifier_target(kwargs)
+        key = None if target is None else target.key
+        if self.keys is not None and key not in self.keys:
+            return call
+
+        async def _codel(action: ActionSubject) -> ActionResult:
+            if self.in_flight < self.limit and not self._waiters:
+                self.in_flight += 1
+                self._codel.should_drop(self.clock(), 0.0)
+            else:
+                await self._wait(key)
+            try:
+                return await call(action)
+            finally:
+                self._release()
+
+        return _codel
+
+    async def _wait(self, key: Hashable):
+        """
+        Waits in queue for free execution slot.
+        :param key: handler key
+        :raises OverloadedError: when action is dropped
+        """
+        waiter = asyncio.get_event_loop().create_future()
+        entry = (self.clock(), key, waiter)
+        self._waiters.append(entry)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(entry)
+                except ValueError:
+                    # cancelled waiter was already skipped by release
+                    pass
+            elif waiter.exception() is None:
+                # slot was already handed over, pass it to the next one
+                self._release()
+            raise
+
+    def _release(self):
+        """
+        Hands over execution slot to the first waiting action
+        that is not dropped or frees it.
+        """
+        waiters = self._waiters
+        while waiters:
+            arrived, key, waiter = waiters.popleft()
+            if waiter.done():
+                continue
+            now = self.clock()
+            sojourn = now - arrived
+            if self._codel.should_drop(now, sojourn):
+                self.dropped += 1
+                waiter.set_exception(
+                    OverloadedError(
+                        f"Request for key {key} dropped after {sojourn:.4f}s in queue",
+                        key=key,
+                        sojourn=sojourn,
+                    )
+                )
+                continue
+            waiter.set_result(None)
+            return
+        self.in_flight -= 1
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Callable, Hashable, Mapping, Optional
+
+from mediator.common.modifiers.base import (
+    ModifierError,
+    ModifierFactory,
+    modifier_target,
+)
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+_deadline: ContextVar[Optional[float]] = ContextVar("mediator_deadline", default=None)
+
+
+def current_deadline() -> Optional[float]:
+    """
+    Provides deadline of currently processed action
+    (as `time.monotonic` clock value).
+    :return: deadline or None when no deadline is set
+    """
+    return _deadline.get()
+
+
+def remaining_time(clock: Callable[[], float] = time.monotonic) -> Optional[float]:
+    """
+    Provides time budget left for currently processed action.
+    :param clock: time source
+    :return: remaining time in seconds (zero when exceeded)
+    or None when no deadline is set
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - clock(), 0.0)
+
+
+class DeadlineExceededError(ModifierError, asyncio.TimeoutError):
+    """
+    Deadline exceeded error.
+
+    Raised when action processing is not finished before its deadline.
+    """
+
+    def __init__(self, *args, key: Hashable):
+        """
+        Initializes deadline exceeded error.
+        :param args: python exception args
+        :param key: handler key of action exceeding deadline
+        """
+        super().__init__(*args)
+        self.key = key
+
+
+class DeadlineModifierFactory(ModifierFactory):
+    """
+    Deadline modifier factory.
+
+    Produces modifiers that cancel handler processing when its deadline passes.
+    Deadline is computed from action extra argument or per handler key default
+    and is never later than deadline of enclosing action,
+    so nested actions executed inside handler share its time budget.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        timeouts: Optional[Mapping[Hashable, float]] = None,
+        inject_arg: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes deadline modifier factory.
+        :param timeout: (optional) default handler timeout in seconds
+        :param timeouts: (optional) handler key (action type) to timeout mapping;
+        overrides default timeout
+        :param inject_arg: (optional) name of action extra argument
+        with timeout in seconds; when provided overrides default timeouts
+        :param clock: time source
+        """
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.inject_arg = inject_arg
+        self.clock = clock
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces deadline modifier for given callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: deadline modifier
+        """
+        target = modifier_target(kwargs)
+        key = None if target is None else target.key
+        default = self.timeouts.get(key, self.timeout)
+        inject_arg = self.inject_arg
+        clock = self.clock
+
+        async def _deadline_call(action: ActionSubject) -> ActionResult:
+            timeout = default
+            if inject_arg is not None:
+                timeout = action.inject.get(inject_arg, timeout)
+            deadline = _deadline.get()
+            now = clock()
+            if timeout is not None:
+                if deadline is None or now + timeout < deadline:
+                    deadline = now + timeout
+            if deadline is None:
+                return await call(action)
+
+            remaining = deadline - now
+            if remaining <= 0:
+                raise DeadlineExceededError(
+                    f"Deadline exceeded before start for key {key}", key=key
+                )
+            token = _deadline.set(deadline)
+            try:
+                return await asyncio.wait_for(call(action), remaining)
+            except asyncio.TimeoutError as e:
+                if isinstance(e, DeadlineExceededError) or clock() < deadline:
+                    raise
+                raise DeadlineExceededError(
+                    f"Deadline exceeded for key {key}", key=key
+                ) from e
+            finally:
+                _deadline.reset(token)
+
+        return _deadline_call
@@ -0,0 +1,167 @@
+import asyncio
+from collections import deque
+from typing import Collection, Deque, Dict, Hashable, Mapping, Optional
+
+from mediator.common.modifiers.base import ModifierFactory, modifier_target
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+
+class FairQueueModifierFactory(ModifierFactory):
+    """
+    Fair queue modifier factory.
+
+    Produces modifiers that share one concurrency limit between tenants,
+    identified by value of action extra argument (i.e. `tenant_id`).
+    Actions over limit wait in per tenant FIFO queues
+    and free execution slots are given to tenants in deficit round robin order,
+    so every tenant with waiting actions gets share of slots
+    proportional to its weight and burst of one tenant
+    does not increase latency of others.
+    Actions without tenant argument are treated as single tenant `None`.
+    """
+
+    _queues: Dict[Hashable, Deque[asyncio.Future]]
+    _deficits: Dict[Hashable, float]
+    _active: Deque[Hashable]
+
+    def __init__(
+        self,
+        limit: int,
+        inject_arg: str = "tenant_id",
+        weights: Optional[Mapping[Hashable, float]] = None,
+        default_weight: float = 1.0,
+        keys: Optional[Collection[Hashable]] = None,
+    ):
+        """
+        Initializes fair queue modifier factory.
+        :param limit: max number of concurrently processed actions of all tenants
+        :param inject_arg: name of action extra argument with tenant identifier
+        :param weights: (optional) tenant identifier to weight mapping
+        :param default_weight: weight of tenants not present in weights
+        :param keys: (optional) collection of handler keys (action types)
+        to be scheduled; when not provided all handlers are scheduled
+        """
+        if limit <= 0:
+            raise ValueError("limit must be greater than 0")
+        if default_weight <= 0 or any(w <= 0 for w in (weights or {}).values()):
+            raise ValueError("weights must be greater than 0")
+        self.limit = limit
+        self.inject_arg = inject_arg
+        self.weights = dict(weights or {})
+        self.default_weight = default_weight
+        self.keys = None if keys is None else frozenset(keys)
+        self.in_flight = 0
+        self._queues = {}
+        self._deficits = {}
+        self._active = deque()
+
+    def queued(self, tenant: Hashable = None) -> int:
+        """
+        Number of actions of given tenant waiting for execution slot.
+        :param tenant: tenant identifier
+        :return: queue length
+        """
+        queue = self._queues.get(tenant, ())
+        return sum(not waiter.done() for waiter in queue)
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces fair queue modifier for given callable.
+        When handler key is not opted in returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: fair queue modifier
+        """
+        target = modifier_target(kwargs)
+        if self.keys is not None and (target is None or target.key not in self.keys):
+            return call
+
+        inject_arg = self.inject_arg
+
+        async def _fair_queue(action: ActionSubject) -> ActionResult:
+            if self.in_flight < self.limit and not self._active:
+                self.in_flight += 1
+            else:
+                await self._wait(action.inject.get(inject_arg))
+            try:
+                return await call(action)
+            finally:
+                self._release()
+
+        return _fair_queue
+
+    async def _wait(self, tenant: Hashable):
+        """
+        Waits in tenant queue for free execution slot.
+        :param tenant: tenant identifier
+        """
+        queue = self._queues.get(tenant)
+        if queue is None:
+            queue = self._queues[tenant] = deque()
+            self._deficits[tenant] = 0.0
+            self._active.append(tenant)
+            if len(self._active) == 1:
+                self._visit(tenant)
+
+        waiter = asyncio.get_event_loop().create_future()
+        queue.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # slot was already handed over, pass it to the next one
+                self._release()
+            raise
+
+    def _release(self):
+        """
+        Hands over execution slot to the next waiting action or frees it.
+        """
+        waiter = self._dequeue()
+        if waiter is None:
+            self.in_flight -= 1
+        else:
+            waiter.set_result(None)
+
+    def _dequeue(self) -> Optional[asyncio.Future]:
+        """
+        Selects next waiting action in deficit round robin order.
+        :return: waiter of selected action or None when no action is waiting
+        """
+        active = self._active
+        while active:
+            tenant = active[0]
+            queue = self._queues[tenant]
+            while queue and queue[0].done():
+                # cancelled waiter
+                queue.popleft()
+            if not queue:
+                self._deactivate()
+                continue
+            if self._deficits[tenant] >= 1:
+                self._deficits[tenant] -= 1
+                waiter = queue.popleft()
+                if not queue:
+                    self._deactivate()
+                return waiter
+            active.rotate(-1)
+            self._visit(active[0])
+        return None
+
+    def _deactivate(self):
+        """
+        Removes current tenant from round robin and visits the next one.
+        Deficit of tenant without waiting actions is not kept.
+        """
+        tenant = self._active.popleft()
+        del self._queues[tenant]
+        del self._deficits[tenant]
+        if self._active:
+            self._visit(self._active[0])
+
+    def _visit(self, tenant: Hashable):
+        """
+        Adds tenant quantum to its deficit on round robin visit.
+        :param tenant: tenant identifier
+        """
+        self._deficits[tenant] += self.weights.get(tenant, self.default_weight)
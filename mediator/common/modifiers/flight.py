@@ -0,0 +1,120 @@
+import asyncio
+import functools
+from typing import Any, Collection, Dict, Hashable, Optional, Sequence
+
+from mediator.common.modifiers.base import (
+    ModifierFactory,
+    action_identity,
+    modifier_target,
+)
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+
+class _Flight:
+    """
+    Single in-flight handler call shared by all equal actions.
+    """
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[ActionResult]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlightModifierFactory(ModifierFactory):
+    """
+    Single-flight modifier factory.
+
+    Produces modifiers that coalesce concurrent equal actions into one handler call.
+    Action is identified by handler, action subject
+    and values of extra arguments (all of them unless selected),
+    so action subject and extra arguments should be hashable
+    (like frozen dataclass);
+    actions with unhashable identity are always passed to handler.
+    Shared call is cancelled only when all awaiting callers are cancelled.
+    No result is kept after shared call is finished.
+    """
+
+    _flights: Dict[Hashable, _Flight]
+
+    def __init__(
+        self,
+        keys: Optional[Collection[Hashable]] = None,
+        inject_args: Optional[Sequence[str]] = None,
+    ):
+        """
+        Initializes single-flight modifier factory.
+        :param keys: (optional) collection of handler keys (action types)
+        to be coalesced; when not provided all handlers are coalesced
+        :param inject_args: (optional) names of extra arguments
+        that are part of action identity;
+        when not provided all extra arguments are part of action identity
+        """
+        self.keys = None if keys is None else frozenset(keys)
+        self.inject_args = None if inject_args is None else tuple(inject_args)
+        self._flights = {}
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of currently running shared calls.
+        :return: number of running shared calls
+        """
+        return len(self._flights)
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces single-flight modifier for given callable.
+        When handler key is not opted in returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: single-flight modifier
+        """
+        target = modifier_target(kwargs)
+        if self.keys is not None and (target is None or target.key not in self.keys):
+            return call
+
+        scope: Any = call if target is None else target
+        inject_args = self.inject_args
+        flights = self._flights
+
+        async def _single_flight(action: ActionSubject) -> ActionResult:
+            try:
+                identity = action_identity(scope, action, inject_args)
+                flight = flights.get(identity)
+            except TypeError:
+                return await call(action)
+
+            if flight is None:
+                flight = _Flight(asyncio.ensure_future(call(action)))
+                flights[identity] = flight
+                flight.task.add_done_callback(
+                    functools.partial(self._land, identity, flight)
+                )
+
+            flight.waiters += 1
+            try:
+                return await asyncio.shield(flight.task)
+            finally:
+                flight.waiters -= 1
+                if not flight.waiters and not flight.task.done():
+                    # equal action arriving later must not join cancelled call
+                    if flights.get(identity) is flight:
+                        del flights[identity]
+                    flight.task.cancel()
+
+        return _single_flight
+
+    def _land(self, identity: Hashable, flight: _Flight, task: asyncio.Future):
+        """
+        Removes finished shared call.
+        :param identity: action identity
+        :param flight: finished shared call
+        :param task: finished shared call task
+        """
+        if self._flights.get(identity) is flight:
+            del self._flights[identity]
+        if not task.cancelled():
+            # mark error as retrieved, it is raised for all callers
+            task.exception()
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from typing import Callable, Collection, Dict, Hashable, Optional
+
+from mediator.common.modifiers.base import ModifierFactory, modifier_target
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+from mediator.utils.histogram import LatencyHistogram
+
+
+class HedgeModifierFactory(ModifierFactory):
+    """
+    Hedge modifier factory.
+
+    Produces modifiers that start second attempt of handler call
+    when the first one is not finished within hedge delay.
+    First successful attempt wins and the other one is cancelled.
+    Hedge delay is given percentile of handler latency
+    estimated from per handler key latency histogram,
+    so only slowest calls are repeated
+    (i.e. 95th percentile adds at most ~5% of extra calls).
+    Intended for idempotent requests (queries) only.
+    """
+
+    _histograms: Dict[Hashable, LatencyHistogram]
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.05,
+        min_delay: float = 0.001,
+        max_delay: float = 1.0,
+        min_samples: int = 20,
+        max_samples: int = 1000,
+        keys: Optional[Collection[Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes hedge modifier factory.
+        :param percentile: latency percentile used as hedge delay
+        :param initial_delay: hedge delay used until min_samples latencies are known
+        :param min_delay: hedge delay lower bound
+        :param max_delay: hedge delay upper bound
+        :param min_samples: number of latencies required to estimate hedge delay
+        :param max_samples: number of latencies after which histogram decays,
+        so hedge delay follows recent latency
+        :param keys: (optional) collection of handler keys (action types)
+        to be hedged; when not provided all handlers are hedged
+        :param clock: time source
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be in range (0, 100)")
+        if not 0 <= min_delay <= max_delay:
+            raise ValueError("min_delay must be in range [0, max_delay]")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.keys = None if keys is None else frozenset(keys)
+        self.clock = clock
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._histograms = {}
+
+    def delay(self, key: Hashable) -> float:
+        """
+        Provides current hedge delay of given handler key.
+        :param key: handler key (action type)
+        :return: hedge delay in seconds
+        """
+        histogram = self._histograms.get(key)
+        if histogram is None or histogram.count < self.min_samples:
+            delay = self.initial_delay
+        else:
+            delay = histogram.percentile(self.percentile) or self.initial_delay
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces hedge modifier for given callable.
+        When handler key is not opted in returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: hedge modifier
+        """
+        target = modifier_target(kwargs)
+        key = None if target is None else target.key
+        if self.keys is not None and key not in self.keys:
+            return call
+
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = LatencyHistogram(max_count=self.max_samples)
+            self._histograms[key] = histogram
+        clock = self.clock
+
+        async def _attempt(action: ActionSubject) -> ActionResult:
+            started = clock()
+            result = await call(action)
+            histogram.record(clock() - started)
+            return result
+
+        async def _hedge(action: ActionSubject) -> ActionResult:
+            self.calls += 1
+            first = asyncio.ensure_future(_attempt(action))
+            tasks = {first}
+            try:
+                done, _ = await asyncio.wait(tasks, timeout=self.delay(key))
+                if done:
+                    return first.result()
+
+                # attempts get separate extra arguments mapping
+                hedge = ActionSubject(subject=action.subject, inject={**action.inject})
+                second = asyncio.ensure_future(_attempt(hedge))
+                tasks.add(second)
+                self.hedged += 1
+                while tasks:
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if not task.cancelled() and task.exception() is None:
+                            if task is second:
+                                self.hedge_wins += 1
+                            return task.result()
+                # both attempts failed, report the original one
+                return first.result()
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return _hedge
@@ -0,0 +1,318 @@
+import asyncio
+import time
+from typing import Callable, Collection, Hashable, List, Optional
+
+from mediator.common.modifiers.base import (
+    ModifierError,
+    ModifierFactory,
+    modifier_target,
+)
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+
+class LimitExceededError(ModifierError):
+    """
+    Limit exceeded error.
+
+    Raised when handler adaptive concurrency limit is reached
+    and action is shed without handler invocation.
+    """
+
+    def __init__(self, *args, key: Hashable):
+        """
+        Initializes limit exceeded error.
+        :param args: python exception args
+        :param key: handler key of shed action
+        """
+        super().__init__(*args)
+        self.key = key
+
+
+def _check_options(
+    initial_limit: int,
+    min_limit: int,
+    max_limit: int,
+    tolerance: float,
+    backoff: float,
+    window: int,
+    smoothing: float,
+):
+    """
+    Validates adaptive limiter options.
+    :raises ValueError: when options are invalid
+    """
+    if not 0 < min_limit <= initial_limit <= max_limit:
+        raise ValueError(
+            "limits must satisfy 0 < min_limit <= initial_limit <= max_limit"
+        )
+    if tolerance <= 1:
+        raise ValueError("tolerance must be greater than 1")
+    if not 0 < backoff < 1:
+        raise ValueError("backoff must be in range (0, 1)")
+    if window < 1:
+        raise ValueError("window must be greater than 0")
+    if not 0 < smoothing <= 1:
+        raise ValueError("smoothing must be in range (0, 1]")
+
+
+class AdaptiveLimiter:
+    """
+    Adaptive concurrency limiter of single handler.
+
+    Adjusts concurrency limit with AIMD algorithm:
+    limit is increased by reciprocal of the limit for every call finished
+    in time while at least half of the limit is in use
+    (so by about one per limit of calls),
+    and multiplied by backoff ratio at most once per window of calls,
+    when the window is slow (its mean latency exceeds tolerance multiple
+    of baseline latency) or any call in the window timed out.
+    Baseline latency estimates handler latency without load:
+    it is measured only by calls started with less than half of the limit
+    in use (see `loaded`), so it does not follow latency growing with overload,
+    and it is exponentially smoothed, so it follows slow changes
+    of handler latency. Limit is adjusted by latency
+    only when baseline latency is known.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        window: int = 100,
+        smoothing: float = 0.2,
+    ):
+        """
+        Initializes adaptive limiter.
+        :param key: handler key
+        :param initial_limit: initial concurrency limit
+        :param min_limit: concurrency limit lower bound
+        :param max_limit: concurrency limit upper bound
+        :param tolerance: ratio of baseline latency treated as overload
+        :param backoff: ratio applied to concurrency limit on overload
+        :param window: number of calls in single measurement window
+        :param smoothing: weight of mean latency of calls without load
+        in the last window in baseline latency
+        """
+        _check_options(
+            initial_limit, min_limit, max_limit, tolerance, backoff, window, smoothing
+        )
+        self.key = key
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.window = window
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self.rejected = 0
+        self.baseline_latency: Optional[float] = None
+        self.window_latency: Optional[float] = None
+        self._limit = float(initial_limit)
+        self._window_sum = 0.0
+        self._window_samples = 0
+        self._window_count = 0
+        self._window_overloaded = False
+        self._baseline_sum = 0.0
+        self._baseline_samples = 0
+
+    @property
+    def limit(self) -> int:
+        """
+        Current concurrency limit.
+        :return: concurrency limit
+        """
+        return int(self._limit)
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Checks if at least half of the concurrency limit is in use.
+        :return: True when limiter is loaded
+        """
+        return self.in_flight * 2 >= self._limit
+
+    def acquire(self) -> bool:
+        """
+        Takes execution slot.
+        :return: False when concurrency limit is reached
+        """
+        if self.in_flight >= self._limit:
+            self.rejected += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(
+        self, latency: Optional[float], overloaded: bool = False, loaded: bool = True
+    ):
+        """
+        Frees execution slot and adjusts concurrency limit.
+        :param latency: (optional) call latency; when None limit is not adjusted
+        :param overloaded: True when call timed out
+        :param loaded: value of `loaded` before the call took its slot;
+        latency of calls started without load is measured as baseline latency
+        """
+        utilized = self.loaded
+        self.in_flight -= 1
+        if overloaded:
+            self._window_overloaded = True
+        elif latency is None:
+            return
+        else:
+            self._window_sum += latency
+            self._window_samples += 1
+            if not loaded:
+                self._baseline_sum += latency
+                self._baseline_samples += 1
+            baseline = self.baseline_latency
+            if (
+                utilized
+                and baseline is not None
+                and not self._window_overloaded
+                and latency <= self.tolerance * baseline
+            ):
+                self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+
+        self._window_count += 1
+        if self._window_count >= self.window:
+            self._close_window()
+
+    def _close_window(self):
+        """
+        Compares mean latency of finished window with baseline latency,
+        decreases concurrency limit on overload and updates baseline latency.
+        """
+        overloaded = self._window_overloaded
+        baseline = self.baseline_latency
+        if self._window_samples:
+            latency = self._window_sum / self._window_samples
+            self.window_latency = latency
+            if baseline is not None and latency > self.tolerance * baseline:
+                overloaded = True
+        if self._baseline_samples:
+            latency = self._baseline_sum / self._baseline_samples
+            if baseline is None:
+                self.baseline_latency = latency
+            else:
+                self.baseline_latency = baseline + self.smoothing * (latency - baseline)
+        if overloaded:
+            self._limit = max(self._limit * self.backoff, self.min_limit)
+        self._window_sum = 0.0
+        self._window_samples = 0
+        self._window_count = 0
+        self._window_overloaded = False
+        self._baseline_sum = 0.0
+        self._baseline_samples = 0
+
+
+class AdaptiveLimitModifierFactory(ModifierFactory):
+    """
+    Adaptive limit modifier factory.
+
+    Produces modifiers that keep separate `AdaptiveLimiter` for every handler
+    and shed actions over its current limit with `LimitExceededError`.
+    Timeouts (`asyncio.TimeoutError`) are treated as overload,
+    other handler errors do not affect limit.
+    """
+
+    _limiters: List[AdaptiveLimiter]
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        window: int = 100,
+        smoothing: float = 0.2,
+        keys: Optional[Collection[Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes adaptive limit modifier factory.
+        :param initial_limit: initial concurrency limit
+        :param min_limit: concurrency limit lower bound
+        :param max_limit: concurrency limit upper bound
+        :param tolerance: ratio of baseline latency treated as overload
+        :param backoff: ratio applied to concurrency limit on overload
+        :param window: number of calls in single measurement window
+        :param smoothing: weight of mean latency of calls without load
+        in the last window in baseline latency
+        :param keys: (optional) collection of handler keys (action types)
+        to be limited; when not provided all handlers are limited
+        :param clock: time source
+        """
+        _check_options(
+            initial_limit, min_limit, max_limit, tolerance, backoff, window, smoothing
+        )
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.window = window
+        self.smoothing = smoothing
+        self.keys = None if keys is None else frozenset(keys)
+        self.clock = clock
+        self._limiters = []
+
+    @property
+    def limiters(self) -> List[AdaptiveLimiter]:
+        """
+        Provides limiters of all wrapped handlers, i.e. for monitoring.
+        :return: list of limiters
+        """
+        return list(self._limiters)
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces adaptive limit modifier for given callable.
+        When handler key is not opted in returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: adaptive limit modifier
+        """
+        target = modifier_target(kwargs)
+        key = None if target is None else target.key
+        if self.keys is not None and key not in self.keys:
+            return call
+
+        limiter = AdaptiveLimiter(
+            key=key,
+            initial_limit=self.initial_limit,
+            min_limit=self.min_limit,
+            max_limit=self.max_limit,
+            tolerance=self.tolerance,
+            backoff=self.backoff,
+            window=self.window,
+            smoothing=self.smoothing,
+        )
+        self._limiters.append(limiter)
+        clock = self.clock
+
+        async def _adaptive_limit(action: ActionSubject) -> ActionResult:
+            loaded = limiter.loaded
+            if not limiter.acquire():
+                raise LimitExceededError(
+                    f"Concurrency limit {limiter.limit} reached for key {key}",
+                    key=key,
+                )
+            started = clock()
+            latency: Optional[float] = None
+            overloaded = False
+            try:
+                result = await call(action)
+                latency = clock() - started
+                return result
+            except asyncio.TimeoutError:
+                overloaded = True
+                raise
+            finally:
+                limiter.release(latency, overloaded, loaded)
+
+        return _adaptive_limit
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, List
+
+from mediator.common.modifiers.base import ModifierFactory, modifier_target
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+from mediator.utils.histogram import LatencyHistogram
+
+
+@dataclass(frozen=True)
+class HandlerStats:
+    """
+    Handler metrics snapshot.
+    """
+
+    key: Hashable
+    obj: Any
+    calls: int
+    errors: int
+    in_flight: int
+    latency: LatencyHistogram
+
+
+class _HandlerMetrics:
+    """
+    Metrics of single handler pipeline.
+    """
+
+    __slots__ = ("key", "obj", "calls", "errors", "in_flight", "latency")
+
+    def __init__(self, key: Hashable, obj: Any, latency: LatencyHistogram):
+        self.key = key
+        self.obj = obj
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.latency = latency
+
+
+class MetricsModifierFactory(ModifierFactory):
+    """
+    Metrics modifier factory.
+
+    Produces modifiers that record number of calls, errors and in-flight calls
+    and latency histogram of every wrapped handler.
+    Calls are counted when finished, cancelled calls are not counted as errors.
+    """
+
+    _metrics: List[_HandlerMetrics]
+
+    def __init__(
+        self,
+        min_latency: float = 1e-6,
+        growth: float = 2**0.25,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Initializes metrics modifier factory.
+        :param min_latency: upper bound of the first latency histogram bucket
+        :param growth: ratio of consecutive latency histogram bucket upper bounds
+        :param clock: time source
+        """
+        self.min_latency = min_latency
+        self.growth = growth
+        self.clock = clock
+        self._metrics = []
+
+    def snapshot(self) -> List[HandlerStats]:
+        """
+        Provides metrics of all wrapped handlers.
+        :return: list of handler metrics snapshots in handler registration order
+        """
+        return [
+            HandlerStats(
+                key=metrics.key,
+                obj=metrics.obj,
+                calls=metrics.calls,
+                errors=metrics.errors,
+                in_flight=metrics.in_flight,
+                latency=metrics.latency.copy(),
+            )
+            for metrics in self._metrics
+        ]
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces metrics modifier for given callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: metrics modifier
+        """
+        target = modifier_target(kwargs)
+        histogram = LatencyHistogram(min_value=self.min_latency, growth=self.growth)
+        metrics = _HandlerMetrics(
+            key=None if target is None else target.key,
+            obj=call if target is None else target.obj,
+            latency=histogram,
+        )
+        self._metrics.append(metrics)
+        record = histogram.record
+        clock = self.clock
+
+        async def _metrics(action: ActionSubject) -> ActionResult:
+            metrics.in_flight += 1
+            started = clock()
+            try:
+                return await call(action)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                metrics.errors += 1
+                raise
+            finally:
+                record(clock() - started)
+                metrics.calls += 1
+                metrics.in_flight -= 1
+
+        return _metrics
@@ -0,0 +1,231 @@
+import asyncio
+import random
+import reprlib
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Deque, Hashable, List, Optional, Tuple
+
+from mediator.common.modifiers.base import ModifierFactory, modifier_target
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+
+@dataclass(frozen=True)
+class SlowCallRecord:
+    """
+    Slow handler call record.
+
+    Every stack sample is a tuple of `file:line function` entries,
+    from the outermost frame to the frame the call was suspended in.
+    """
+
+    key: Hashable
+    obj: Any
+    subject_type: type
+    summary: str
+    started: float
+    latency: float
+    samples: Tuple[Tuple[str, ...], ...]
+
+
+class _Sampler:
+    """
+    Periodic stack sampler of single handler call.
+    """
+
+    __slots__ = ("task", "interval", "max_samples", "stack_limit", "samples", "timer")
+
+    def __init__(
+        self,
+        task: "asyncio.Task",
+        interval: float,
+        max_samples: int,
+        stack_limit: Optional[int],
+    ):
+        self.task = task
+        self.interval = interval
+        self.max_samples = max_samples
+        self.stack_limit = stack_limit
+        self.samples: List[Tuple[str, ...]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def start(self, delay: float):
+        """
+        Schedules next stack sample.
+        :param delay: time to next sample
+        """
+        self.timer = asyncio.get_event_loop().call_later(delay, self.sample)
+
+    def sample(self):
+        """
+        Takes stack sample of watched task.
+        """
+        frames = []
+        # task.get_stack provides only the top frame of suspended task,
+        # so chain of awaited coroutines is followed instead
+        awaited: Any
+        if sys.version_info >= (3, 8):
+            awaited = self.task.get_coro()
+        else:
+            awaited = getattr(self.task, "_coro", None)
+        while awaited is not None:
+            frame = getattr(awaited, "cr_frame", None) or getattr(
+                awaited, "gi_frame", None
+            )
+            if frame is None:
+                break
+            frames.append(
+                f"{frame.f_code.co_filename}:{frame.f_lineno} {frame.f_code.co_name}"
+            )
+            awaited = getattr(awaited, "cr_await", None) or getattr(
+                awaited, "gi_yieldfrom", None
+            )
+        if self.stack_limit is not None and len(frames) > self.stack_limit:
+            del frames[: len(frames) - self.stack_limit]
+        self.samples.append(tuple(frames))
+        if len(self.samples) < self.max_samples:
+            self.start(self.interval)
+        else:
+            self.timer = None
+
+    def stop(self):
+        """
+        Cancels scheduled stack sample.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+
+class SlowCallProfilerModifierFactory(ModifierFactory):
+    """
+    Slow call profiler modifier factory.
+
+    Produces modifiers that watch handler calls and, once call runs longer
+    than threshold, periodically sample stack of the task awaiting it,
+    showing what the handler is waiting for.
+    Calls that finish over threshold are stored in bounded ring buffer
+    with action subject type and summary of action arguments.
+    Calls that block event loop get no samples (sampling timers cannot run),
+    but are still recorded with their latency.
+    """
+
+    _records: Deque[SlowCallRecord]
+
+    def __init__(
+        self,
+        threshold: float,
+        interval: float = 0.01,
+        max_samples: int = 10,
+        max_records: int = 100,
+        sample_rate: float = 1.0,
+        stack_limit: Optional[int] = 32,
+        keys: Optional[Collection[Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes slow call profiler modifier factory.
+        :param threshold: call latency in seconds after which call is sampled
+        :param interval: time between consecutive stack samples
+        :param max_samples: max number of stack samples per call
+        :param max_records: max number of stored records;
+        oldest records are dropped first
+        :param sample_rate: fraction of calls that are watched
+        :param stack_limit: (optional) max number of the innermost frames
+        in stack sample
+        :param keys: (optional) collection of handler keys (action types)
+        to be watched; when not provided all handlers are watched
+        :param clock: time source
+        """
+        if threshold < 0 or interval <= 0:
+            raise ValueError(
+                "threshold must not be negative, interval must be positive"
+            )
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be in range [0, 1]")
+        self.threshold = threshold
+        self.interval = interval
+        self.max_samples = max_samples
+        self.sample_rate = sample_rate
+        self.stack_limit = stack_limit
+        self.keys = None if keys is None else frozenset(keys)
+        self.clock = clock
+        self._records = deque(maxlen=max_records)
+        self._repr = reprlib.Repr()
+        self._repr.maxstring = 80
+        self._repr.maxother = 80
+
+    @property
+    def records(self) -> List[SlowCallRecord]:
+        """
+        Provides stored slow call records.
+        :return: list of records from the oldest one
+        """
+        return list(self._records)
+
+    def clear(self):
+        """
+        Removes all stored records.
+        """
+        self._records.clear()
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces slow call profiler modifier for given callable.
+        When handler key is not opted in returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: slow call profiler modifier
+        """
+        target = modifier_target(kwargs)
+        if self.keys is not None and (target is None or target.key not in self.keys):
+            return call
+
+        key = None if target is None else target.key
+        obj = call if target is None else target.obj
+        clock = self.clock
+
+        async def _profile(action: ActionSubject) -> ActionResult:
+            if self.sample_rate < 1 and random.random() >= self.sample_rate:
+                return await call(action)
+            task = asyncio.current_task()
+            sampler: Optional[_Sampler] = None
+            if task is not None:
+                sampler = _Sampler(
+                    task, self.interval, self.max_samples, self.stack_limit
+                )
+                sampler.start(self.threshold)
+            started = clock()
+            try:
+                return await call(action)
+            finally:
+                latency = clock() - started
+                if sampler is not None:
+                    sampler.stop()
+                if latency >= self.threshold:
+                    self._records.append(
+                        SlowCallRecord(
+                            key=key,
+                            obj=obj,
+                            subject_type=type(action.subject),
+                            summary=self._summary(action),
+                            started=started,
+                            latency=latency,
+                            samples=tuple(sampler.samples if sampler else ()),
+                        )
+                    )
+
+        return _profile
+
+    def _summary(self, action: ActionSubject) -> str:
+        """
+        Provides short, size limited description of action arguments.
+        :param action: action subject
+        :return: arguments summary
+        """
+        args = [self._repr.repr(action.subject)]
+        args.extend(
+            f"{name}={self._repr.repr(value)}" for name, value in action.inject.items()
+        )
+        return ", ".join(args)
@@ -0,0 +1,208 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Mapping, Optional, Tuple
+
+from mediator.common.modifiers.base import (
+    ModifierError,
+    ModifierFactory,
+    modifier_target,
+)
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+
+class RateLimitExceededError(ModifierError):
+    """
+    Rate limit exceeded error.
+
+    Raised when no token is available for action
+    (or it would have to wait longer than allowed).
+    """
+
+    def __init__(self, *args, key: Hashable, retry_after: float):
+        """
+        Initializes rate limit exceeded error.
+        :param args: python exception args
+        :param key: rate limit bucket key (handler key or handler key and caller)
+        :param retry_after: time in seconds after which token will be available
+        """
+        super().__init__(*args)
+        self.key = key
+        self.retry_after = retry_after
+
+
+class _Bucket:
+    """
+    Token bucket state.
+    """
+
+    __slots__ = ("tokens", "updated", "full_at")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+        self.full_at = updated
+
+
+class RateLimitModifierFactory(ModifierFactory):
+    """
+    Rate limit modifier factory.
+
+    Produces modifiers that take token from token bucket for every action.
+    Buckets are kept per handler key (action type)
+    and optionally per value of action extra argument (i.e. `user_id`).
+    Without available token action is rejected with `RateLimitExceededError`
+    or, in wait mode, token is reserved in advance
+    and action waits until it is refilled.
+    Bucket that is not used until fully refilled is removed
+    (it is equal to new one), so memory is bounded by number of active callers.
+    """
+
+    _buckets: "OrderedDict[Hashable, _Bucket]"
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        limits: Optional[Mapping[Hashable, Tuple[float, float]]] = None,
+        inject_arg: Optional[str] = None,
+        wait: bool = False,
+        max_wait: Optional[float] = None,
+        max_size: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes rate limit modifier factory.
+        :param rate: (optional) default number of tokens refilled per second;
+        when not provided only handler keys present in limits are limited
+        :param burst: (optional) default bucket capacity;
+        when not provided it equals rate (but at least 1)
+        :param limits: (optional) handler key (action type)
+        to (rate, burst) mapping; overrides default rate and burst
+        :param inject_arg: (optional) name of action extra argument
+        with caller identifier; when provided every caller has own buckets
+        :param wait: when True actions wait for token instead of rejection
+        :param max_wait: (optional) max time action can wait for token;
+        actions that would wait longer are rejected
+        :param max_size: max number of kept buckets;
+        least recently used buckets are evicted first
+        :param clock: time source
+        """
+        self.limits = dict(limits or {})
+        self.default: Optional[Tuple[float, float]] = None
+        if rate is not None:
+            self.default = (rate, max(rate, 1.0) if burst is None else burst)
+        checked = list(self.limits.values())
+        if self.default is not None:
+            checked.append(self.default)
+        for limit_rate, limit_burst in checked:
+            if limit_rate <= 0 or limit_burst < 1:
+                raise ValueError("rate must be greater than 0 and burst at least 1")
+        self.inject_arg = inject_arg
+        self.wait = wait
+        self.max_wait = max_wait
+        self.max_size = max_size
+        self.clock = clock
+        self.rejected = 0
+        self._buckets = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of currently kept buckets.
+        :return: number of buckets
+        """
+        return len(self._buckets)
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces rate limit modifier for given callable.
+        When handler key is not limited returns unchanged callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: rate limit modifier
+        """
+        target = modifier_target(kwargs)
+        key = None if target is None else target.key
+        limit = self.limits.get(key, self.default)
+        if limit is None:
+            return call
+
+        rate, burst = limit
+        inject_arg = self.inject_arg
+
+        async def _rate_limit(action: ActionSubject) -> ActionResult:
+            if inject_arg is None:
+                bucket_key: Hashable = key
+            else:
+                bucket_key = (key, action.inject.get(inject_arg))
+            delay = self._take(bucket_key, rate, burst)
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    self._refund(bucket_key, rate)
+                    raise
+            return await call(action)
+
+        return _rate_limit
+
+    def _take(self, bucket_key: Hashable, rate: float, burst: float) -> float:
+        """
+        Takes (or reserves) token from bucket.
+        :param bucket_key: bucket key
+        :param rate: bucket refill rate
+        :param burst: bucket capacity
+        :raises RateLimitExceededError: when token cannot be taken
+        :return: time to wait for reserved token
+        """
+        now = self.clock()
+        self._expire(now)
+        buckets = self._buckets
+        bucket = buckets.get(bucket_key)
+        if bucket is None:
+            bucket = _Bucket(burst, now)
+            buckets[bucket_key] = bucket
+        else:
+            buckets.move_to_end(bucket_key)
+            bucket.tokens = min(bucket.tokens + (now - bucket.updated) * rate, burst)
+            bucket.updated = now
+
+        delay = max((1 - bucket.tokens) / rate, 0.0)
+        if delay > 0 and (
+            not self.wait or (self.max_wait is not None and delay > self.max_wait)
+        ):
+            self.rejected += 1
+            raise RateLimitExceededError(
+                f"Rate limit exceeded for {bucket_key}",
+                key=bucket_key,
+                retry_after=delay,
+            )
+        bucket.tokens -= 1
+        bucket.full_at = now + (burst - bucket.tokens) / rate
+        return delay
+
+    def _refund(self, bucket_key: Hashable, rate: float):
+        """
+        Returns reserved token of cancelled action.
+        :param bucket_key: bucket key
+        :param rate: bucket refill rate
+        """
+        bucket = self._buckets.get(bucket_key)
+        if bucket is not None:
+            bucket.tokens += 1
+            bucket.full_at -= 1 / rate
+
+    def _expire(self, now: float):
+        """
+        Removes least recently used buckets that are fully refilled
+        or exceed size limit.
+        Amortized constant time - stops on the first bucket to keep.
+        :param now: current time
+        """
+        buckets = self._buckets
+        while buckets:
+            bucket = next(iter(buckets.values()))
+            if bucket.full_at > now and len(buckets) < self.max_size:
+                return
+            buckets.popitem(last=False)
@@ -0,0 +1,26 @@
+from typing import Any
+
+import pytest
+
+from mediator.common.modifiers import ModifierFactory
+from mediator.request import LocalRequestBus
+
+
+class MockupClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> MockupClock:
+    return MockupClock()
+
+
+def mockup_request_bus(factory: ModifierFactory, *handlers: Any) -> LocalRequestBus:
+    bus = LocalRequestBus(modifiers=[factory])
+    for handler in handlers:
+        bus.register(handler)
+    return bus
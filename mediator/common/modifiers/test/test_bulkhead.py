@@ -0,0 +1,112 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from mediator.common.modifiers import (
+    BulkheadModifierFactory,
+    BulkheadRejectedError,
+    ModifierError,
+)
+from mediator.common.modifiers.test.conftest import mockup_request_bus
+
+
+class _Slow:
+    def __init__(self, value: int):
+        self.value = value
+
+
+class _Fast:
+    pass
+
+
+def _bus(factory: BulkheadModifierFactory, started: List[int]):
+    release = asyncio.Event()
+
+    async def _handle_slow(slow: _Slow):
+        started.append(slow.value)
+        await release.wait()
+        return slow.value
+
+    async def _handle_fast(fast: _Fast):
+        return "fast"
+
+    return mockup_request_bus(factory, _handle_slow, _handle_fast), release
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_modifier_queue():
+    started: List[int] = []
+    factory = BulkheadModifierFactory(limits={_Slow: 2})
+    bus, release = _bus(factory, started)
+
+    tasks = [asyncio.ensure_future(bus.execute(_Slow(value))) for value in range(5)]
+    await asyncio.sleep(0.01)
+    assert started == [0, 1]
+    stats = factory.stats(_Slow)
+    assert stats is not None
+    assert (stats.limit, stats.in_flight, stats.queued) == (2, 2, 3)
+
+    # other keys are not limited
+    assert factory.stats(_Fast) is None
+    assert await bus.execute(_Fast()) == "fast"
+
+    # cancelled waiter does not take a slot
+    tasks[2].cancel()
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert started == [0, 1, 3, 4]
+    assert results[:2] == [0, 1] and results[3:] == [3, 4]
+    assert isinstance(results[2], asyncio.CancelledError)
+
+    stats = factory.stats(_Slow)
+    assert stats is not None
+    assert (stats.in_flight, stats.queued, stats.completed) == (0, 0, 4)
+    assert stats.max_wait_time > 0.0
+    assert stats.run_time > 0.0 and stats.wait_time > 0.0
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_modifier_cancel_on_release():
+    started: List[int] = []
+    factory = BulkheadModifierFactory(limit=1)
+    bus, release = _bus(factory, started)
+
+    tasks = [asyncio.ensure_future(bus.execute(_Slow(value))) for value in range(3)]
+    await asyncio.sleep(0.01)
+    # waiter is cancelled after slot release is scheduled
+    release.set()
+    tasks[1].cancel()
+    results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1)
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert started == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_modifier_reject():
+    started: List[int] = []
+    factory = BulkheadModifierFactory(limit=1, max_queue=1)
+    bus, release = _bus(factory, started)
+
+    tasks = [asyncio.ensure_future(bus.execute(_Slow(value))) for value in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(BulkheadRejectedError) as exc_info:
+        await bus.execute(_Slow(2))
+    assert exc_info.value.key is _Slow
+    assert isinstance(exc_info.value, ModifierError)
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [0, 1]
+    stats = factory.stats(_Slow)
+    assert stats is not None
+    assert (stats.completed, stats.rejected) == (2, 1)
+
+
+def test_bulkhead_modifier_validation():
+    with pytest.raises(ValueError):
+        BulkheadModifierFactory(limit=0)
+    with pytest.raises(ValueError):
+        BulkheadModifierFactory(limits={_Slow: 0})
+    with pytest.raises(ValueError):
+        BulkheadModifierFactory(limit=1, max_queue=-1)
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from mediator.common.handler import CallableHandler
+from mediator.common.modifiers import CacheModifierFactory
+from mediator.common.modifiers.test.conftest import MockupClock
+from mediator.common.registry import HandlerEntry
+from mediator.common.types import ActionSubject
+
+
+@dataclass(frozen=True)
+class _Query:
+    value: int
+
+
+def _pipeline(factory: CacheModifierFactory, calls: List[int], key=_Query):
+    async def _handle(query, **kwargs):
+        calls.append(query.value)
+        return query.value, kwargs
+
+    handler = CallableHandler(
+        obj=_handle,
+        fn=_handle,
+        key=key,
+        subject_name=None,
+        arg_map={},
+        allow_args=None,
+    )
+    return HandlerEntry(handler=handler, modifiers=[factory]).handler_pipeline()
+
+
+@pytest.mark.asyncio
+async def test_cache_modifier(clock: MockupClock):
+    factory = CacheModifierFactory(
+        max_size=2, ttl=10.0, inject_args=["user"], clock=clock
+    )
+    calls: List[int] = []
+    call = _pipeline(factory, calls)
+
+    for value, user in [(1, "a"), (1, "a"), (1, "b"), (1, "a")]:
+        result = await call(ActionSubject(_Query(value), inject={"user": user}))
+        assert result.result == (value, {"user": user})
+    assert calls == [1, 1]
+    assert (factory.hits, factory.misses, factory.size) == (2, 2, 2)
+
+    await call(ActionSubject(_Query(2), inject={}))
+    assert factory.size == 2
+    await call(ActionSubject(_Query(1), inject={"user": "a"}))
+    assert calls == [1, 1, 2]
+    await call(ActionSubject(_Query(1), inject={"user": "b"}))
+    assert calls == [1, 1, 2, 1]
+
+    clock.now = 11.0
+    await call(ActionSubject(_Query(2), inject={}))
+    assert calls == [1, 1, 2, 1, 2]
+
+    factory.clear()
+    assert factory.size == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_modifier_keys():
+    factory = CacheModifierFactory(keys=[_Query])
+    calls: List[int] = []
+    cached = _pipeline(factory, calls)
+    not_cached = _pipeline(factory, calls, key=str)
+
+    for call in [cached, cached, not_cached, not_cached]:
+        await call(ActionSubject(_Query(1), inject={}))
+    assert calls == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cache_modifier_unhashable():
+    calls: List[int] = []
+    call = _pipeline(CacheModifierFactory(), calls)
+    for _ in range(2):
+        await call(ActionSubject(_Query(1), inject={"user": ["a"]}))
+    assert calls == [1, 1]
+
+    call = _pipeline(CacheModifierFactory(inject_args=["user"]), calls)
+    for _ in range(2):
+        await call(ActionSubject(_Query(1), inject={"user": ["a"]}))
+    assert calls == [1, 1, 1, 1]
+
+    call = _pipeline(CacheModifierFactory(inject_args=[]), calls)
+    for _ in range(2):
+        await call(ActionSubject(_Query(1), inject={"user": ["a"]}))
+    assert calls == [1, 1, 1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cache_modifier_all_inject_args():
+    calls: List[int] = []
+    call = _pipeline(CacheModifierFactory(), calls)
+    for inject in [{"user": 1}, {"user": 2}, {"user": 1}, {}, {}]:
+        await call(ActionSubject(_Query(1), inject=inject))
+    assert calls == [1, 1, 1]
@@ -0,0 +1,96 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from mediator.common.modifiers import (
+    CoDelModifierFactory,
+    ModifierError,
+    OverloadedError,
+)
+from mediator.common.modifiers.test.conftest import MockupClock, mockup_request_bus
+
+
+class _Query:
+    def __init__(self, value: int):
+        self.value = value
+
+
+@pytest.mark.asyncio
+async def test_codel_modifier(clock: MockupClock):
+    factory = CoDelModifierFactory(limit=1, target=0.005, interval=0.1, clock=clock)
+    started: List[int] = []
+    release = asyncio.Queue()  # type: asyncio.Queue
+
+    async def _handle_query(query: _Query):
+        started.append(query.value)
+        clock.now += await release.get()
+        return query.value
+
+    bus = mockup_request_bus(factory, _handle_query)
+
+    tasks = [asyncio.ensure_future(bus.execute(_Query(value))) for value in range(6)]
+    await asyncio.sleep(0)
+    assert (factory.in_flight, factory.queued) == (1, 5)
+
+    # sojourn time above target is tolerated for one interval,
+    # then actions are dropped at rate growing with drop count
+    for delay in [0.01, 0.2, 0.0, 0.0, 0.0]:
+        release.put_nowait(delay)
+    results = await asyncio.wait_for(
+        asyncio.gather(*tasks, return_exceptions=True), timeout=1.0
+    )
+
+    assert started == [0, 1, 3, 4, 5]
+    assert results[:2] == [0, 1] and results[3:] == [3, 4, 5]
+    error = results[2]
+    assert isinstance(error, OverloadedError) and isinstance(error, ModifierError)
+    assert error.key is _Query and error.sojourn == pytest.approx(0.21)
+    assert (factory.in_flight, factory.queued, factory.dropped) == (0, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_codel_modifier_cancel():
+    factory = CoDelModifierFactory(limit=1)
+    release = asyncio.Event()
+
+    async def _handle_query(query: _Query):
+        await release.wait()
+        return query.value
+
+    bus = mockup_request_bus(factory, _handle_query)
+    tasks = [asyncio.ensure_future(bus.execute(_Query(value))) for value in range(3)]
+    await asyncio.sleep(0)
+    tasks[1].cancel()
+    await asyncio.sleep(0)
+    assert factory.queued == 1
+
+    release.set()
+    assert await asyncio.wait_for(asyncio.gather(tasks[0], tasks[2]), 1.0) == [0, 2]
+    assert (factory.in_flight, factory.dropped) == (0, 0)
+
+    with pytest.raises(ValueError):
+        CoDelModifierFactory(limit=0)
+
+
+@pytest.mark.asyncio
+async def test_codel_modifier_cancel_on_release():
+    factory = CoDelModifierFactory(limit=1)
+    release = asyncio.Event()
+
+    async def _handle_query(query: _Query):
+        await release.wait()
+        return query.value
+
+    bus = mockup_request_bus(factory, _handle_query)
+    tasks = [asyncio.ensure_future(bus.execute(_Query(value))) for value in range(3)]
+    await asyncio.sleep(0)
+    # waiter is cancelled after slot release is scheduled
+    release.set()
+    tasks[1].cancel()
+    results = await asyncio.wait_for(
+        asyncio.gather(*tasks, return_exceptions=True), 1.0
+    )
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert (factory.in_flight, factory.queued) == (0, 0)
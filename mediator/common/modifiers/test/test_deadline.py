@@ -0,0 +1,86 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from mediator.common.modifiers import (
+    DeadlineExceededError,
+    DeadlineModifierFactory,
+    ModifierError,
+    current_deadline,
+    remaining_time,
+)
+from mediator.common.modifiers.test.conftest import mockup_request_bus
+
+
+class _Outer:
+    pass
+
+
+class _Inner:
+    pass
+
+
+def _bus(factory: DeadlineModifierFactory, budgets: List[Optional[float]]):
+    async def _handle_inner(inner: _Inner, delay: float = 0.0):
+        budgets.append(remaining_time())
+        await asyncio.sleep(delay)
+        return delay
+
+    async def _handle_outer(outer: _Outer, delay: float = 0.0):
+        budgets.append(remaining_time())
+        return await bus.execute(_Inner(), delay=delay)
+
+    bus = mockup_request_bus(factory, _handle_inner, _handle_outer)
+    return bus
+
+
+@pytest.mark.asyncio
+async def test_deadline_modifier_propagation():
+    budgets: List[Optional[float]] = []
+    factory = DeadlineModifierFactory(timeouts={_Outer: 0.5, _Inner: 5.0})
+    bus = _bus(factory, budgets)
+
+    assert await bus.execute(_Outer()) == 0.0
+    outer_budget, inner_budget = budgets
+    assert outer_budget is not None and inner_budget is not None
+    assert 0.0 < inner_budget <= outer_budget <= 0.5
+
+    budgets.clear()
+    assert await bus.execute(_Inner()) == 0.0
+    assert budgets[0] is not None and 0.5 < budgets[0] <= 5.0
+    assert current_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_deadline_modifier_exceeded():
+    budgets: List[Optional[float]] = []
+    factory = DeadlineModifierFactory(timeouts={_Outer: 0.05})
+    bus = _bus(factory, budgets)
+
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        await bus.execute(_Outer(), delay=1.0)
+    assert exc_info.value.key is _Outer
+    assert isinstance(exc_info.value, ModifierError)
+    assert isinstance(exc_info.value, asyncio.TimeoutError)
+    assert current_deadline() is None
+
+    # handler without deadline
+    budgets.clear()
+    assert await bus.execute(_Inner(), delay=0.01) == 0.01
+    assert budgets == [None]
+
+
+@pytest.mark.asyncio
+async def test_deadline_modifier_inject_arg():
+    budgets: List[Optional[float]] = []
+    factory = DeadlineModifierFactory(timeout=5.0, inject_arg="timeout")
+    bus = _bus(factory, budgets)
+
+    with pytest.raises(DeadlineExceededError):
+        await bus.execute(_Inner(), delay=1.0, timeout=0.05)
+    assert await bus.execute(_Inner(), delay=0.01) == 0.01
+
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        await bus.execute(_Inner(), timeout=0.0)
+    assert exc_info.value.key is _Inner
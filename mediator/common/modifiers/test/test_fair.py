@@ -0,0 +1,95 @@
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from mediator.common.modifiers import FairQueueModifierFactory
+from mediator.common.modifiers.test.conftest import mockup_request_bus
+from mediator.event import LocalEventBus
+
+
+class _Query:
+    def __init__(self, value: int):
+        self.value = value
+
+
+class _Event:
+    pass
+
+
+def _bus(factory: FairQueueModifierFactory, started: List[Tuple[str, int]]):
+    async def _handle_query(query: _Query, tenant_id: str = "-"):
+        started.append((tenant_id, query.value))
+        await asyncio.sleep(0)
+        return query.value
+
+    return mockup_request_bus(factory, _handle_query)
+
+
+@pytest.mark.asyncio
+async def test_fair_queue_modifier():
+    factory = FairQueueModifierFactory(limit=1, weights={"b": 2.0})
+    started: List[Tuple[str, int]] = []
+    bus = _bus(factory, started)
+
+    tasks = [
+        asyncio.ensure_future(bus.execute(_Query(value), tenant_id=tenant))
+        for tenant, count in [("a", 4), ("b", 4), ("c", 1)]
+        for value in range(count)
+    ]
+    await asyncio.sleep(0)
+    assert factory.in_flight == 1
+    assert [factory.queued(tenant) for tenant in "abc"] == [3, 4, 1]
+
+    # burst of tenant "a" does not delay others, "b" gets double share
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1.0)
+    assert started == [
+        ("a", 0),
+        ("a", 1),
+        ("b", 0),
+        ("b", 1),
+        ("c", 0),
+        ("a", 2),
+        ("b", 2),
+        ("b", 3),
+        ("a", 3),
+    ]
+    assert factory.in_flight == 0 and factory.queued("a") == 0
+
+
+@pytest.mark.asyncio
+async def test_fair_queue_modifier_cancel():
+    factory = FairQueueModifierFactory(limit=2)
+    started: List[Tuple[str, int]] = []
+    bus = _bus(factory, started)
+
+    tasks = [
+        asyncio.ensure_future(bus.execute(_Query(value), tenant_id="a"))
+        for value in range(4)
+    ]
+    await asyncio.sleep(0)
+    tasks[2].cancel()
+    assert await asyncio.wait_for(
+        asyncio.gather(tasks[0], tasks[1], tasks[3]), timeout=1.0
+    ) == [0, 1, 3]
+    assert started == [("a", 0), ("a", 1), ("a", 3)]
+    assert factory.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_fair_queue_modifier_event():
+    factory = FairQueueModifierFactory(limit=1)
+    bus = LocalEventBus(modifiers=[factory], sync_mode=True)
+    tenants: List[str] = []
+
+    async def _handle_event(event: _Event, tenant_id: str):
+        tenants.append(tenant_id)
+
+    bus.register(_handle_event)
+    await bus.publish(_Event(), tenant_id="a")
+    assert tenants == ["a"] and factory.in_flight == 0
+
+    with pytest.raises(ValueError):
+        FairQueueModifierFactory(limit=0)
+    with pytest.raises(ValueError):
+        FairQueueModifierFactory(limit=1, weights={"a": 0.0})
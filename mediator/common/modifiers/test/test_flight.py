@@ -0,0 +1,156 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from mediator.common.handler import CallableHandler
+from mediator.common.modifiers import SingleFlightModifierFactory
+from mediator.common.registry import HandlerEntry
+from mediator.common.types import ActionSubject
+
+
+@dataclass(frozen=True)
+class _Query:
+    value: int
+
+
+class _QueryError(Exception):
+    pass
+
+
+def _pipeline(factory: SingleFlightModifierFactory, calls: List[int]):
+    release = asyncio.Event()
+
+    async def _handle(query: _Query, **kwargs):
+        calls.append(query.value)
+        await release.wait()
+        if query.value < 0:
+            raise _QueryError()
+        return query.value
+
+    handler = CallableHandler(
+        obj=_handle,
+        fn=_handle,
+        key=_Query,
+        subject_name=None,
+        arg_map={},
+        allow_args=None,
+    )
+    entry = HandlerEntry(handler=handler, modifiers=[factory])
+    return entry.handler_pipeline(), release
+
+
+def _spawn(call, *values: int):
+    return [
+        asyncio.ensure_future(call(ActionSubject(_Query(value), inject={})))
+        for value in values
+    ]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_modifier():
+    factory = SingleFlightModifierFactory()
+    calls: List[int] = []
+    call, release = _pipeline(factory, calls)
+
+    tasks = _spawn(call, 1, 1, 2, 1)
+    await asyncio.sleep(0)
+    assert factory.in_flight == 2
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert [result.result for result in results] == [1, 1, 2, 1]
+    assert calls == [1, 2]
+    assert factory.in_flight == 0
+
+    await call(ActionSubject(_Query(1), inject={}))
+    assert calls == [1, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_modifier_error():
+    factory = SingleFlightModifierFactory()
+    calls: List[int] = []
+    call, release = _pipeline(factory, calls)
+
+    tasks = _spawn(call, -1, -1)
+    await asyncio.sleep(0)
+    release.set()
+    for task in tasks:
+        with pytest.raises(_QueryError):
+            await task
+    assert calls == [-1]
+    assert factory.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_modifier_cancel():
+    factory = SingleFlightModifierFactory()
+    calls: List[int] = []
+    call, release = _pipeline(factory, calls)
+
+    first, second = _spawn(call, 1, 1)
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert (await second).result == 1
+    assert first.cancelled()
+
+    release.clear()
+    tasks = _spawn(call, 2, 2)
+    await asyncio.sleep(0)
+    for task in tasks:
+        task.cancel()
+    await asyncio.wait(tasks)
+    await asyncio.sleep(0)
+    assert factory.in_flight == 0
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_modifier_cancel_rejoin():
+    factory = SingleFlightModifierFactory()
+    calls: List[int] = []
+    call, release = _pipeline(factory, calls)
+
+    async def _rejoin():
+        (cancelled,) = _spawn(call, 1)
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        # shared call is being cancelled now, equal action starts new one
+        return await call(ActionSubject(_Query(1), inject={}))
+
+    task = asyncio.ensure_future(_rejoin())
+    await asyncio.sleep(0.01)
+    release.set()
+    assert (await asyncio.wait_for(task, 1)).result == 1
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_modifier_inject_args():
+    calls: List[int] = []
+    call, release = _pipeline(SingleFlightModifierFactory(), calls)
+    tasks = [
+        asyncio.ensure_future(call(ActionSubject(_Query(1), inject=inject)))
+        for inject in [{"user": 1}, {"user": 2}, {"user": 1}]
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert calls == [1, 1]
+
+    calls.clear()
+    release.clear()
+    call, release = _pipeline(SingleFlightModifierFactory(inject_args=[]), calls)
+    tasks = [
+        asyncio.ensure_future(call(ActionSubject(_Query(1), inject=inject)))
+        for inject in [{"user": 1}, {"user": 2}]
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert calls == [1]
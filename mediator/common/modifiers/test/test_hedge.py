@@ -0,0 +1,91 @@
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from mediator.common.modifiers import HedgeModifierFactory
+from mediator.common.modifiers.test.conftest import mockup_request_bus
+
+
+class _Query:
+    pass
+
+
+class _Other:
+    pass
+
+
+class _QueryError(Exception):
+    pass
+
+
+def _bus(factory: HedgeModifierFactory, delays: List[float], attempts: List[Dict]):
+    async def _handle_query(query: _Query):
+        attempt = {"n": len(attempts) + 1}
+        attempts.append(attempt)
+        delay = delays.pop(0)
+        if delay < 0:
+            raise _QueryError()
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            attempt["cancelled"] = True
+            raise
+        return attempt["n"]
+
+    return mockup_request_bus(factory, _handle_query)
+
+
+@pytest.mark.asyncio
+async def test_hedge_modifier():
+    factory = HedgeModifierFactory(initial_delay=0.02, keys=[_Query])
+    delays = [0.0, 1.0, 0.0]
+    attempts: List[Dict] = []
+    bus = _bus(factory, delays, attempts)
+
+    # fast call is not hedged
+    assert await bus.execute(_Query()) == 1
+    assert (factory.calls, factory.hedged) == (1, 0)
+
+    # slow call is hedged, hedge wins and original attempt is cancelled
+    attempts.clear()
+    assert await bus.execute(_Query()) == 2
+    assert (factory.calls, factory.hedged, factory.hedge_wins) == (2, 1, 1)
+    await asyncio.sleep(0)
+    assert attempts == [{"n": 1, "cancelled": True}, {"n": 2}]
+
+
+@pytest.mark.asyncio
+async def test_hedge_modifier_errors():
+    factory = HedgeModifierFactory(initial_delay=0.01)
+    attempts: List[Dict] = []
+
+    # failure before delay is not hedged
+    bus = _bus(factory, [-1.0], attempts)
+    with pytest.raises(_QueryError):
+        await bus.execute(_Query())
+
+    # failed hedge does not hide slow original attempt
+    bus = _bus(factory, [0.05, -1.0], attempts)
+    attempts.clear()
+    assert await bus.execute(_Query()) == 1
+    assert factory.hedge_wins == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_modifier_delay():
+    factory = HedgeModifierFactory(
+        percentile=50.0, initial_delay=0.5, min_samples=4, max_delay=0.8
+    )
+    bus = _bus(factory, [0.0] * 4, [])
+
+    assert factory.delay(_Query) == 0.5
+    for _ in range(4):
+        await bus.execute(_Query())
+    assert factory.delay(_Query) < 0.01
+    assert factory.delay(_Other) == 0.5
+
+    with pytest.raises(ValueError):
+        HedgeModifierFactory(percentile=100.0)
+    with pytest.raises(ValueError):
+        HedgeModifierFactory(min_delay=2.0, max_delay=1.0)
@@ -0,0 +1,205 @@
+import asyncio
+import heapq
+import random
+from typing import Callable, List, Tuple
+
+import pytest
+
+from mediator.common.modifiers import (
+    AdaptiveLimiter,
+    AdaptiveLimitModifierFactory,
+    LimitExceededError,
+    ModifierError,
+)
+from mediator.event import LocalEventBus
+from mediator.request import LocalRequestBus
+
+
+class _Query:
+    pass
+
+
+class _Event:
+    pass
+
+
+def test_adaptive_limiter():
+    limiter = AdaptiveLimiter(
+        key=_Query, initial_limit=4, max_limit=5, backoff=0.5, window=4
+    )
+    assert limiter.limit == 4
+
+    loaded = []
+    for _ in range(4):
+        loaded.append(limiter.loaded)
+        assert limiter.acquire()
+    assert not limiter.acquire()
+    assert (limiter.in_flight, limiter.rejected) == (4, 1)
+    assert loaded == [False, False, True, True]
+
+    # the first window sets baseline latency from calls started without load,
+    # limit is not changed before
+    for is_loaded, latency in zip(loaded, [0.01, 0.01, 0.05, 0.05]):
+        limiter.release(latency, loaded=is_loaded)
+    assert limiter.limit == 4 and limiter.in_flight == 0
+    assert limiter.baseline_latency == pytest.approx(0.01)
+    assert limiter.window_latency == pytest.approx(0.03)
+
+    # fast calls with utilized limit increase it by about one per limit of calls
+    for _ in range(4):
+        limiter.acquire()
+    for _ in range(4):
+        limiter.release(0.01)
+        limiter.acquire()
+    assert limiter.limit == 4
+    for _ in range(4):
+        limiter.release(0.01)
+        limiter.acquire()
+    assert limiter.limit == 5
+
+    # slow window decreases limit multiplicatively once, at its end,
+    # and slow calls under load do not change baseline latency
+    for _ in range(3):
+        limiter.release(0.05)
+        limiter.acquire()
+    assert limiter.limit == 5
+    limiter.release(0.05)
+    assert limiter.limit == 2 and limiter.window_latency == pytest.approx(0.05)
+    assert limiter.baseline_latency == pytest.approx(0.01)
+
+    # timeout in window decreases limit once too and blocks increases
+    limiter.release(None, overloaded=True)
+    for _ in range(3):
+        limiter.release(0.01)
+        limiter.acquire()
+    assert limiter.limit == 1
+
+    # failed calls do not affect limit
+    while limiter.in_flight:
+        limiter.release(None)
+    assert limiter.limit == 1
+
+    # calls without load move baseline latency and increase limit again
+    for _ in range(4):
+        is_loaded = limiter.loaded
+        limiter.acquire()
+        limiter.release(0.02, loaded=is_loaded)
+    assert limiter.limit == 2
+    assert limiter.baseline_latency == pytest.approx(0.012)
+
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(key=_Query, initial_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveLimitModifierFactory(tolerance=1.0)
+    with pytest.raises(ValueError):
+        AdaptiveLimitModifierFactory(backoff=1.0)
+    with pytest.raises(ValueError):
+        AdaptiveLimitModifierFactory(window=0)
+    with pytest.raises(ValueError):
+        AdaptiveLimitModifierFactory(smoothing=0.0)
+
+
+def _simulate(
+    limiter: AdaptiveLimiter, latency: Callable[[int], float], calls: int
+) -> List[int]:
+    """
+    Simulates unbounded demand - limiter is always filled up to its limit.
+    :param limiter: simulated limiter
+    :param latency: call latency for given number of calls in flight
+    :param calls: number of simulated calls
+    :return: limits observed after every window of calls
+    """
+    now = 0.0
+    running: List[Tuple[float, float, bool]] = []
+    limits = []
+    for count in range(1, calls + 1):
+        while True:
+            loaded = limiter.loaded
+            if not limiter.acquire():
+                break
+            heapq.heappush(running, (now + latency(limiter.in_flight), now, loaded))
+        now, started, loaded = heapq.heappop(running)
+        limiter.release(now - started, loaded=loaded)
+        if not count % limiter.window:
+            limits.append(limiter.limit)
+    return limits
+
+
+def test_adaptive_limiter_steady_load():
+    # latency jitter without queueing is not treated as overload
+    rng = random.Random(0)
+    limiter = AdaptiveLimiter(key=_Query, initial_limit=20, max_limit=40)
+    limits = _simulate(limiter, lambda _: rng.uniform(0.001, 0.005), 20000)
+    assert limits[-1] == 40 and limiter.baseline_latency == pytest.approx(
+        0.003, rel=0.2
+    )
+
+
+@pytest.mark.parametrize(
+    "capacity, tolerance, expected",
+    [(20, 1.2, (20, 26)), (20, 2.0, (30, 44)), (5, 1.2, (5, 9))],
+)
+def test_adaptive_limiter_queueing(capacity, tolerance, expected):
+    # service latency grows linearly with concurrency over its capacity,
+    # so limit settles near capacity multiplied by tolerated latency growth
+    limiter = AdaptiveLimiter(key=_Query, initial_limit=20, tolerance=tolerance)
+    limits = _simulate(
+        limiter, lambda in_flight: 0.01 * max(1.0, in_flight / capacity), 50000
+    )
+    low, high = expected
+    assert all(low <= limit <= high for limit in limits[-100:])
+    assert limiter.baseline_latency == pytest.approx(0.01, rel=0.5)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_modifier_request():
+    factory = AdaptiveLimitModifierFactory(initial_limit=2)
+    bus = LocalRequestBus(modifiers=[factory])
+    release = asyncio.Event()
+
+    async def _handle_query(query: _Query):
+        await release.wait()
+        return "done"
+
+    bus.register(_handle_query)
+    (limiter,) = factory.limiters
+    assert limiter.key is _Query
+
+    tasks = [asyncio.ensure_future(bus.execute(_Query())) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(LimitExceededError) as exc_info:
+        await bus.execute(_Query())
+    assert exc_info.value.key is _Query
+    assert isinstance(exc_info.value, ModifierError)
+
+    release.set()
+    assert await asyncio.gather(*tasks) == ["done", "done"]
+    # limit is not increased before baseline latency is measured
+    assert (limiter.in_flight, limiter.rejected, limiter.limit) == (0, 1, 2)
+    assert limiter.baseline_latency is None
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_modifier_event():
+    factory = AdaptiveLimitModifierFactory(keys=[_Event], window=1)
+    bus = LocalEventBus(modifiers=[factory], sync_mode=True)
+    calls: List[str] = []
+
+    async def _handle_event_a(event: _Event):
+        calls.append("a")
+
+    async def _handle_event_b(event: _Event):
+        calls.append("b")
+
+    async def _handle_str(event: str):
+        calls.append(event)
+
+    bus.register(_handle_event_a)
+    bus.register(_handle_event_b)
+    bus.register(_handle_str)
+    await bus.publish(_Event())
+    await bus.publish("c")
+
+    assert sorted(calls) == ["a", "b", "c"]
+    assert [limiter.key for limiter in factory.limiters] == [_Event, _Event]
+    assert all(limiter.baseline_latency is not None for limiter in factory.limiters)
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from mediator.common.handler import CallableHandler
+from mediator.common.modifiers import MetricsModifierFactory
+from mediator.common.registry import HandlerEntry
+from mediator.common.types import ActionSubject
+
+
+class _Query:
+    def __init__(self, value: int):
+        self.value = value
+
+
+class _QueryError(Exception):
+    pass
+
+
+async def _handle(query: _Query):
+    await asyncio.sleep(query.value / 1000)
+    if query.value < 0:
+        raise _QueryError()
+    return query.value
+
+
+@pytest.mark.asyncio
+async def test_metrics_modifier():
+    clock_values = iter([0.0, 0.002, 1.0, 1.004, 2.0, 2.0005])
+    factory = MetricsModifierFactory(clock=lambda: next(clock_values))
+    handler = CallableHandler(
+        obj=_handle,
+        fn=_handle,
+        key=_Query,
+        subject_name=None,
+        arg_map={},
+        allow_args=None,
+    )
+    call = HandlerEntry(handler=handler, modifiers=[factory]).handler_pipeline()
+
+    assert (await call(ActionSubject(_Query(1), inject={}))).result == 1
+    task = asyncio.ensure_future(call(ActionSubject(_Query(3), inject={})))
+    await asyncio.sleep(0)
+    (stats,) = factory.snapshot()
+    assert (stats.key, stats.obj) == (_Query, _handle)
+    assert (stats.calls, stats.errors, stats.in_flight) == (1, 0, 1)
+    assert await task
+
+    with pytest.raises(_QueryError):
+        await call(ActionSubject(_Query(-1), inject={}))
+
+    (stats,) = factory.snapshot()
+    assert (stats.calls, stats.errors, stats.in_flight) == (3, 1, 0)
+    assert stats.latency.count == 3
+    assert stats.latency.sum == pytest.approx(0.0065)
+    assert 0.004 <= stats.latency.percentile(100) < 0.005
+    assert 0.0005 <= stats.latency.percentile(0) < 0.0006
+
+    # snapshot holds copy of histogram
+    assert factory.snapshot()[0].latency is not stats.latency
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from mediator.common.modifiers import SlowCallProfilerModifierFactory
+from mediator.request import LocalRequestBus
+
+
+class _Query:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def __repr__(self):
+        return f"_Query({self.delay})"
+
+
+async def _wait_for_backend(delay: float):
+    await asyncio.sleep(delay)
+
+
+async def _handle_query(query: _Query, user: str = ""):
+    await _wait_for_backend(query.delay)
+    return query.delay
+
+
+@pytest.mark.asyncio
+async def test_slow_call_profiler_modifier():
+    factory = SlowCallProfilerModifierFactory(
+        threshold=0.02, interval=0.01, max_samples=3, max_records=2
+    )
+    bus = LocalRequestBus(modifiers=[factory])
+    bus.register(_handle_query)
+
+    assert await bus.execute(_Query(0.0), user="fast") == 0.0
+    assert factory.records == []
+
+    assert await bus.execute(_Query(0.1), user="x" * 200) == 0.1
+    (record,) = factory.records
+    assert (record.key, record.obj, record.subject_type) == (
+        _Query,
+        _handle_query,
+        _Query,
+    )
+    assert record.summary.startswith("_Query(0.1), user='xxx")
+    assert len(record.summary) < 100
+    assert record.latency >= 0.1
+    assert len(record.samples) == 3
+    for sample in record.samples:
+        # innermost frames show what handler is waiting for
+        assert sample[-2].endswith(" _wait_for_backend")
+        assert sample[-1].endswith(" sleep")
+
+    # ring buffer keeps latest records
+    for _ in range(2):
+        await bus.execute(_Query(0.03))
+    assert [record.summary for record in factory.records] == ["_Query(0.03)"] * 2
+    factory.clear()
+    assert factory.records == []
+
+
+@pytest.mark.asyncio
+async def test_slow_call_profiler_modifier_sample_rate():
+    factory = SlowCallProfilerModifierFactory(threshold=0.0, sample_rate=0.0)
+    bus = LocalRequestBus(modifiers=[factory])
+    bus.register(_handle_query)
+    await bus.execute(_Query(0.0))
+    assert factory.records == []
+
+    with pytest.raises(ValueError):
+        SlowCallProfilerModifierFactory(threshold=0.0, sample_rate=2.0)
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from mediator.common.modifiers import (
+    ModifierError,
+    RateLimitExceededError,
+    RateLimitModifierFactory,
+)
+from mediator.common.modifiers.test.conftest import MockupClock, mockup_request_bus
+
+
+class _Query:
+    pass
+
+
+class _Other:
+    pass
+
+
+async def _handle_query(query: _Query):
+    return "query"
+
+
+async def _handle_other(other: _Other):
+    return "other"
+
+
+def _bus(factory: RateLimitModifierFactory):
+    return mockup_request_bus(factory, _handle_query, _handle_other)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_modifier_reject(clock: MockupClock):
+    factory = RateLimitModifierFactory(
+        limits={_Query: (2.0, 2.0)}, inject_arg="user_id", clock=clock
+    )
+    bus = _bus(factory)
+
+    for _ in range(2):
+        assert await bus.execute(_Query(), user_id="a") == "query"
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        await bus.execute(_Query(), user_id="a")
+    error = exc_info.value
+    assert isinstance(error, ModifierError)
+    assert error.key == (_Query, "a") and error.retry_after == pytest.approx(0.5)
+
+    # other callers and not limited keys are not affected
+    assert await bus.execute(_Query(), user_id="b") == "query"
+    for _ in range(5):
+        assert await bus.execute(_Other()) == "other"
+
+    clock.now = 0.5
+    assert await bus.execute(_Query(), user_id="a") == "query"
+    with pytest.raises(RateLimitExceededError):
+        await bus.execute(_Query(), user_id="a")
+    # bucket of "b" was fully refilled, so it is removed
+    assert (factory.rejected, factory.size) == (2, 1)
+
+    clock.now = 2.0
+    assert await bus.execute(_Query(), user_id="c") == "query"
+    assert factory.size == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_modifier_wait():
+    factory = RateLimitModifierFactory(rate=100.0, burst=1.0, wait=True, max_wait=0.015)
+    bus = _bus(factory)
+
+    loop = asyncio.get_event_loop()
+    started = loop.time()
+    results = await asyncio.gather(*[bus.execute(_Query()) for _ in range(2)])
+    assert results == ["query"] * 2
+    assert loop.time() - started >= 0.009
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_modifier_wait_cancel():
+    factory = RateLimitModifierFactory(rate=50.0, burst=1.0, wait=True, max_wait=0.03)
+    bus = _bus(factory)
+
+    # second action waits for reserved token, third would wait too long
+    tasks = [asyncio.ensure_future(bus.execute(_Query())) for _ in range(3)]
+    await asyncio.sleep(0)
+    tasks[1].cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert results[0] == "query"
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert isinstance(results[2], RateLimitExceededError)
+
+    # token reserved by cancelled action is returned
+    task = asyncio.ensure_future(bus.execute(_Query()))
+    await asyncio.sleep(0)
+    assert not task.done()
+    assert await task == "query"
+    assert factory.rejected == 1
+
+
+def test_rate_limit_modifier_size(clock: MockupClock):
+    factory = RateLimitModifierFactory(
+        rate=1.0, inject_arg="user_id", max_size=3, clock=clock
+    )
+    for user_id in range(10):
+        factory._take(("key", user_id), 1.0, 1.0)
+    assert factory.size == 3
+
+    with pytest.raises(ValueError):
+        RateLimitModifierFactory(rate=0.0)
+    with pytest.raises(ValueError):
+        RateLimitModifierFactory(limits={_Query: (1.0, 0.5)})
@@ -4,16 +4,24 @@ from mediator.event.aggregate import (
     EventAggregateError,
 )
 from mediator.event.base import EventPublish, EventPublisher, EventSubscriber
-from mediator.event.local import LocalEventBus
+from mediator.event.local import (
+    ClosedEventBusError,
+    EventFanOut,
+    LocalEventBus,
+    QueuePolicy,
+)
 from mediator.event.registry import EventHandlerRegistry
 
 __all__ = [
+    "ClosedEventBusError",
     "ConfigEventAggregateError",
     "EventAggregate",
     "EventAggregateError",
+    "EventFanOut",
     "EventPublish",
     "EventPublisher",
     "EventSubscriber",
     "LocalEventBus",
+    "QueuePolicy",
     "EventHandlerRegistry",
 ]
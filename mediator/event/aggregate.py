@@ -1,3 +1,5 @@
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 from mediator.event.base import EventPublisher
@@ -46,14 +48,15 @@ class EventAggregate:
     async def commit(self):
         """
         Commits staged events by underlying publisher.
+        Consecutive events with the same extra arguments are published at once.
         """
         publisher = self._publisher
         if publisher is None:
             raise ConfigEventAggregateError(f"Publisher is not set in {self!r}")
 
         async with publisher.transaction() as context:
-            for obj, kwargs in self._staged:
-                await context.publish(obj, **kwargs)
+            for kwargs, staged in groupby(self._staged, key=itemgetter(1)):
+                await context.publish_many([obj for obj, _ in staged], **kwargs)
 
         self._staged.clear()
 
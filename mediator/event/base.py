@@ -17,6 +17,16 @@ class EventPublish:
         """
         raise NotImplementedError
 
+    async def publish_many(self, objs: Iterable[Any], **kwargs):
+        """
+        Publishes given event objects.
+        By default every event object is published one by one.
+        :param objs: event objects to be published
+        :param kwargs: extra arguments common for all events
+        """
+        for obj in objs:
+            await self.publish(obj, **kwargs)
+
 
 class EventPublisher(EventPublish):
     """
@@ -1,13 +1,35 @@
 import asyncio
+import sys
 from collections import defaultdict
-from typing import Any, DefaultDict, Hashable, Iterable, List, Optional, Sequence
+from enum import Enum
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    DefaultDict,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 from mediator.common.factory import (
     CallableHandlerPolicy,
     HandlerFactoryCascade,
     PolicyType,
 )
-from mediator.common.modifiers import ModifierFactory
+from mediator.common.modifiers import (
+    HandlerStats,
+    MetricsModifierFactory,
+    ModifierFactory,
+)
 from mediator.common.registry import (
     CollectionHandlerStore,
     HandlerEntry,
@@ -17,26 +39,143 @@ from mediator.common.types import ActionCallType, ActionSubject
 from mediator.event.base import EventPublisher, EventSubscriber
 
 
+class ClosedEventBusError(RuntimeError):
+    """
+    Closed event bus error.
+
+    Raised when event is published on closed event bus.
+    """
+
+
+class EventFanOut(Enum):
+    """
+    Strategy of running event handlers of single event.
+    """
+
+    #: every handler runs concurrently in separate task (or work item)
+    TASKS = "tasks"
+    #: handlers run one by one in single task (or work item)
+    SEQUENTIAL = "sequential"
+    #: handlers run one by one in publisher task, publish waits for them
+    INLINE = "inline"
+
+
+class QueuePolicy(Enum):
+    """
+    Policy applied when event work queue is full.
+    """
+
+    #: publish waits for free space in queue
+    BLOCK = "block"
+    #: new work item is dropped
+    DROP_NEWEST = "drop_newest"
+    #: the oldest queued work item is dropped to make space for new one
+    DROP_OLDEST = "drop_oldest"
+
+
+_EAGER_START = sys.version_info >= (3, 12)
+
+# handler call taking event action or batch of event actions
+_WorkType = Callable[[Any], Awaitable[Any]]
+
+
 class _EventSchedulerHandlerStore(CollectionHandlerStore):
     """
     Utility event handler store, based on collection handler store
     to work with local event execution.
-    Schedules event processing as background asyncio tasks.
+    Schedules event processing as background asyncio tasks
+    or, when workers are configured, as work items of bounded queue
+    served by long-lived worker tasks.
     """
 
-    _groups: DefaultDict[Hashable, List[ActionCallType]]
+    _calls: DefaultDict[Hashable, List[ActionCallType]]
+    _groups: Dict[Hashable, Callable[[ActionSubject], Awaitable[None]]]
+    _batches: Dict[Hashable, Callable[[Sequence[ActionSubject]], Awaitable[None]]]
+    _tasks: Set["asyncio.Task"]
+    _workers: List["asyncio.Task"]
+    _queue: Optional["asyncio.Queue[Tuple[_WorkType, Any]]"]
 
-    def __init__(self, sync_mode: bool = False):
+    def __init__(
+        self,
+        sync_mode: bool = False,
+        max_tasks: Optional[int] = None,
+        workers: Optional[int] = None,
+        queue_size: int = 1024,
+        queue_policy: QueuePolicy = QueuePolicy.BLOCK,
+        fan_out: EventFanOut = EventFanOut.TASKS,
+        fan_outs: Optional[Mapping[Hashable, EventFanOut]] = None,
+        eager: bool = False,
+    ):
         """
         Initializes event scheduler handler store.
         :param sync_mode: are events should be processed in background
         when True every schedule call waits on event processing to finish
         when False (default) event processing is executed in background;
         useful in test cases
+        :param max_tasks: (optional) max number of pending tasks;
+        when reached schedule call waits for pending tasks to finish
+        :param workers: (optional) number of worker tasks;
+        when provided every handler call is queued as work item
+        instead of being scheduled as separate task
+        :param queue_size: max number of queued work items
+        :param queue_policy: policy applied when work queue is full
+        :param fan_out: default strategy of running handlers of single event
+        :param fan_outs: (optional) mapping of event key (event type)
+        to strategy of running its handlers, overrides default one
+        :param eager: when True handler tasks are started eagerly -
+        handler runs in schedule call until it suspends for the first time,
+        so handlers that never suspend do not create tasks at all;
+        requires Python 3.12+
         """
+        if max_tasks is not None and max_tasks < 1:
+            raise ValueError("max_tasks must be greater than 0")
+        if eager and not _EAGER_START:
+            raise ValueError("eager requires Python 3.12 or newer")
+        if workers is not None:
+            if workers < 1 or queue_size < 1:
+                raise ValueError("workers and queue_size must be greater than 0")
+            if sync_mode or max_tasks is not None:
+                raise ValueError(
+                    "workers cannot be combined with sync_mode or max_tasks"
+                )
         super().__init__()
-        self._groups = defaultdict(list)
+        self._calls = defaultdict(list)
+        self._groups = {}
+        self._batches = {}
+        self._tasks = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._closed = False
         self.sync_mode = sync_mode
+        self.max_tasks = max_tasks
+        self.workers = workers
+        self.queue_size = queue_size
+        self.queue_policy = queue_policy
+        self.fan_out = fan_out
+        self.fan_outs = dict(fan_outs or {})
+        self.eager = eager
+        self._workers = []
+        self._queue = None
+        self._work_items = 0
+        self._dropped = 0
+
+    @property
+    def pending_tasks(self) -> int:
+        """
+        Number of event processing tasks that are not finished yet.
+        With workers number of queued and processed work items is provided.
+        :return: number of pending tasks
+        """
+        if self._queue is not None:
+            return self._work_items
+        return len(self._tasks)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of work items dropped by queue policy.
+        :return: number of dropped work items
+        """
+        return self._dropped
 
     def add(self, entry: HandlerEntry):
         """
@@ -60,9 +199,31 @@ class _EventSchedulerHandlerStore(CollectionHandlerStore):
     def _map_call(self, entry: HandlerEntry):
         """
         Add given handler entry to event processing.
+        Event key dispatch routines (of single event and batch of events)
+        are rebuilt according to its fan-out strategy,
+        so publishing does not depend on strategy.
         :param entry: handler entry to add
         """
-        self._groups[entry.key].append(entry.handler_pipeline())
+        key = entry.key
+        calls = self._calls[key]
+        calls.append(entry.handler_pipeline())
+        fan_out = self.fan_outs.get(key, self.fan_out)
+        group: Sequence[ActionCallType] = tuple(calls)
+        if fan_out is EventFanOut.INLINE:
+            self._groups[key] = partial(self._inline, group)
+            self._batches[key] = partial(self._inline_many, group)
+            return
+        units: Sequence[_WorkType]
+        batch_units: Sequence[_WorkType]
+        if fan_out is EventFanOut.SEQUENTIAL and len(group) > 1:
+            units = (partial(self._inline, group),)
+            batch_units = (partial(self._inline_many, group),)
+        else:
+            units = group
+            batch_units = tuple(partial(self._inline_many, (call,)) for call in group)
+        dispatch = self._spawn if self.workers is None else self._enqueue
+        self._groups[key] = partial(dispatch, units)
+        self._batches[key] = partial(dispatch, batch_units)
 
     async def schedule(self, action: ActionSubject):
         """
@@ -70,12 +231,255 @@ class _EventSchedulerHandlerStore(CollectionHandlerStore):
         by all collected handlers.
         :param action: event action to be processed
         """
-        key = action.key
-        group: Sequence[ActionCallType] = self._groups.get(key, ())
-        tasks = [asyncio.create_task(call(action)) for call in group]
-        if self.sync_mode:
+        if self._closed:
+            raise ClosedEventBusError("event bus is closed")
+        dispatch = self._groups.get(action.key)
+        if dispatch is not None:
+            await dispatch(action)
+
+    async def schedule_many(self, actions: Iterable[ActionSubject]):
+        """
+        Schedule given action objects to be processed as events
+        by all collected handlers.
+        Consecutive actions with the same key are grouped
+        and every handler processes whole group one by one
+        in single task (or work item); order of actions is kept.
+        :param actions: event actions to be processed
+        """
+        if self._closed:
+            raise ClosedEventBusError("event bus is closed")
+        batch: List[ActionSubject] = []
+        for action in actions:
+            if batch and batch[0].key != action.key:
+                await self._schedule_batch(batch)
+                batch = []
+            batch.append(action)
+        if batch:
+            await self._schedule_batch(batch)
+
+    async def _schedule_batch(self, batch: Sequence[ActionSubject]):
+        """
+        Schedule given action objects of the same key.
+        :param batch: event actions to be processed
+        """
+        key = batch[0].key
+        if key not in self._batches:
+            return
+        if len(batch) == 1:
+            await self._groups[key](batch[0])
+        else:
+            await self._batches[key](batch)
+
+    async def _inline(self, group: Sequence[ActionCallType], action: ActionSubject):
+        """
+        Runs all given handler calls one by one in current task.
+        Handler errors are reported and do not stop remaining handlers.
+        :param group: handler calls
+        :param action: event action to be processed
+        """
+        for call in group:
+            try:
+                await call(action)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._report(exc, asyncio.current_task())
+
+    async def _inline_many(
+        self, group: Sequence[ActionCallType], actions: Sequence[ActionSubject]
+    ):
+        """
+        Runs all given handler calls for every given action in current task.
+        Handler errors are reported and do not stop remaining handlers.
+        :param group: handler calls
+        :param actions: event actions to be processed
+        """
+        for action in actions:
+            await self._inline(group, action)
+
+    async def _spawn(self, group: Sequence[_WorkType], action: Any):
+        """
+        Schedules separate task for every given handler call.
+        :param group: handler calls
+        :param action: event action (or batch of event actions) to be processed
+        """
+        if self.max_tasks is not None and self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_tasks)
+        tasks = []
+        for call in group:
+            if self._slots is not None:
+                await self._slots.acquire()
+            if self.eager:
+                started = self._start(call(action))
+                if started is None:
+                    if self._slots is not None:
+                        self._slots.release()
+                    continue
+                task = started
+            else:
+                task = asyncio.create_task(call(action))
+            self._tasks.add(task)
+            task.add_done_callback(self._done)
+            tasks.append(task)
+        if self.sync_mode and tasks:
             await asyncio.wait(tasks)
 
+    def _start(self, awaitable: Awaitable) -> Optional["asyncio.Task"]:
+        """
+        Starts given handler call in eagerly started task (Python 3.12+).
+        Errors of handler calls finished in the first step are reported.
+        :param awaitable: handler call
+        :return: task running handler call or None when call is already finished
+        """
+        task = asyncio.Task(
+            awaitable,  # type: ignore
+            loop=asyncio.get_running_loop(),
+            eager_start=True,
+        )
+        if not task.done():
+            return task
+        if not task.cancelled() and task.exception() is not None:
+            self._report(cast(BaseException, task.exception()), task)
+        return None
+
+    async def _enqueue(self, group: Sequence[_WorkType], action: Any):
+        """
+        Queues work items of given action for all given handler calls.
+        :param group: handler calls
+        :param action: event action (or batch of event actions) to be processed
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+            self._workers = [
+                asyncio.create_task(self._work(self._queue))
+                for _ in range(self.workers or 0)
+            ]
+        queue = self._queue
+        for call in group:
+            if not queue.full():
+                queue.put_nowait((call, action))
+            elif self.queue_policy is QueuePolicy.BLOCK:
+                await queue.put((call, action))
+            elif self.queue_policy is QueuePolicy.DROP_NEWEST:
+                self._dropped += 1
+                continue
+            else:
+                queue.get_nowait()
+                queue.task_done()
+                queue.put_nowait((call, action))
+                self._dropped += 1
+                continue
+            self._work_items += 1
+
+    async def _work(self, queue: "asyncio.Queue[Tuple[_WorkType, Any]]"):
+        """
+        Worker routine - processes queued work items.
+        :param queue: work queue
+        """
+        while True:
+            call, action = await queue.get()
+            try:
+                await call(action)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._report(exc, asyncio.current_task())
+            finally:
+                self._work_items -= 1
+                queue.task_done()
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for pending tasks to finish,
+        including tasks scheduled while waiting.
+        With workers waits for all queued work items to be processed
+        (cannot be awaited by event handler).
+        :param timeout: (optional) max time to wait in seconds
+        :return: True when all pending tasks are finished
+        """
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                return False
+            return True
+        loop = asyncio.get_event_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            # task draining from event handler cannot wait for itself
+            pending = self._tasks - {asyncio.current_task()}
+            if not pending:
+                return True
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            await asyncio.wait(pending, timeout=remaining)
+
+    async def aclose(self, timeout: Optional[float] = None):
+        """
+        Stops accepting new events and waits for pending tasks to finish.
+        Tasks not finished in time are cancelled.
+        :param timeout: (optional) max time to wait in seconds
+        """
+        self._closed = True
+        drained = await self.drain(timeout)
+        if self._workers:
+            pending = set(self._workers)
+            self._workers = []
+        elif drained:
+            return
+        else:
+            pending = self._tasks - {asyncio.current_task()}
+        for task in pending:
+            task.cancel()
+        await asyncio.wait(pending)
+
+    def _done(self, task: "asyncio.Task"):
+        """
+        Releases finished task and reports its unhandled exception
+        to event loop exception handler.
+        :param task: finished task
+        """
+        self._tasks.discard(task)
+        if self._slots is not None:
+            self._slots.release()
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self._report(exc, task)
+
+    @staticmethod
+    def _report(exc: BaseException, task: Optional["asyncio.Task"]):
+        """
+        Reports unhandled exception of event handler
+        to event loop exception handler.
+        :param exc: unhandled exception
+        :param task: task processing event
+        """
+        loop = asyncio.get_event_loop()
+        context = {
+            "message": "Unhandled exception in event handler",
+            "exception": exc,
+            "task": task,
+        }
+        handler = loop.get_exception_handler()
+        if handler is None or task is None or task is not asyncio.current_task():
+            loop.call_exception_handler(context)
+            return
+        # loop runs custom handler in context of given task (Python 3.12+),
+        # which is already entered when reporting from inside of the task
+        try:
+            handler(loop, context)
+        except Exception as handler_exc:
+            loop.default_exception_handler(
+                {
+                    "message": "Unhandled error in exception handler",
+                    "exception": handler_exc,
+                    "context": context,
+                }
+            )
+
 
 class LocalEventBus(EventPublisher, HandlerRegistry, EventSubscriber):
     """
@@ -91,6 +495,14 @@ class LocalEventBus(EventPublisher, HandlerRegistry, EventSubscriber):
         cascade: Optional[HandlerFactoryCascade] = None,
         modifiers: Sequence[ModifierFactory] = (),
         sync_mode: bool = False,
+        metrics: bool = False,
+        max_tasks: Optional[int] = None,
+        workers: Optional[int] = None,
+        queue_size: int = 1024,
+        queue_policy: QueuePolicy = QueuePolicy.BLOCK,
+        fan_out: EventFanOut = EventFanOut.TASKS,
+        fan_outs: Optional[Mapping[Hashable, EventFanOut]] = None,
+        eager: bool = False,
     ):
         """
         Initializes local event bus with given specification.
@@ -103,8 +515,41 @@ class LocalEventBus(EventPublisher, HandlerRegistry, EventSubscriber):
         (optional) custom handler factory cascade to customize
         policy into handler factory mapping
         :param modifiers: sequence of modifiers to be applied on new handler entries
+        :param metrics: when True calls, errors and latency of every handler
+        are recorded and provided by `stats` method
+        :param max_tasks: (optional) max number of pending background tasks;
+        when reached publish call waits for pending tasks to finish
+        (handler publishing events on the same bus may wait for itself)
+        :param workers: (optional) number of long-lived worker tasks;
+        when provided every handler call is queued as work item of bounded queue
+        served by workers instead of being scheduled as separate task;
+        cannot be combined with sync_mode and max_tasks
+        :param queue_size: max number of queued work items
+        :param queue_policy: policy applied when work queue is full
+        :param fan_out: default strategy of running handlers of single event;
+        by default every handler runs in separate task
+        :param fan_outs: (optional) mapping of event key (event type)
+        to strategy of running its handlers, overrides default one;
+        useful for events with many cheap handlers
+        :param eager: when True handler tasks are started eagerly
+        (like `asyncio.eager_task_factory`) - handler runs in publish call
+        until it suspends for the first time, so handlers finishing
+        without suspension never reach event loop scheduler;
+        applies to handlers running in separate tasks; requires Python 3.12+
         """
-        scheduler_store = _EventSchedulerHandlerStore(sync_mode=sync_mode)
+        self._metrics = MetricsModifierFactory() if metrics else None
+        if self._metrics is not None:
+            modifiers = [self._metrics, *modifiers]
+        scheduler_store = _EventSchedulerHandlerStore(
+            sync_mode=sync_mode,
+            max_tasks=max_tasks,
+            workers=workers,
+            queue_size=queue_size,
+            queue_policy=queue_policy,
+            fan_out=fan_out,
+            fan_outs=fan_outs,
+            eager=eager,
+        )
         HandlerRegistry.__init__(
             self,
             store=scheduler_store,
@@ -114,6 +559,52 @@ class LocalEventBus(EventPublisher, HandlerRegistry, EventSubscriber):
         )
         self._scheduler = scheduler_store
 
+    @property
+    def pending_tasks(self) -> int:
+        """
+        Number of background event processing tasks that are not finished yet.
+        With workers number of queued and processed handler calls is provided.
+        :return: number of pending tasks
+        """
+        return self._scheduler.pending_tasks
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of handler calls dropped by work queue policy.
+        :return: number of dropped handler calls
+        """
+        return self._scheduler.dropped
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for background event processing tasks to finish,
+        including tasks scheduled while waiting.
+        :param timeout: (optional) max time to wait in seconds
+        :return: True when all background tasks are finished
+        """
+        return await self._scheduler.drain(timeout)
+
+    async def aclose(self, timeout: Optional[float] = None):
+        """
+        Closes event bus - stops accepting new events
+        and waits for background event processing tasks to finish.
+        Tasks not finished in time are cancelled.
+        Events published on closed bus raise `ClosedEventBusError`.
+        :param timeout: (optional) max time to wait in seconds
+        """
+        await self._scheduler.aclose(timeout)
+
+    def stats(self) -> List[HandlerStats]:
+        """
+        Provides metrics of all registered handlers.
+        :return: list of handler metrics snapshots
+        (empty when bus is created without metrics)
+        """
+        if self._metrics is None:
+            return []
+        return self._metrics.snapshot()
+
     async def publish(self, obj: Any, **kwargs):
         """
         Publishes given event.
@@ -121,3 +612,17 @@ class LocalEventBus(EventPublisher, HandlerRegistry, EventSubscriber):
         :param kwargs: event extra arguments
         """
         await self._scheduler.schedule(ActionSubject(subject=obj, inject=kwargs))
+
+    async def publish_many(self, objs: Iterable[Any], **kwargs):
+        """
+        Publishes given events.
+        Consecutive events of the same type are grouped,
+        handlers are resolved once per group and every handler processes
+        all events of the group one by one in single background task
+        (or work item). Order of events is kept.
+        :param objs: event objects
+        :param kwargs: extra arguments common for all events
+        """
+        await self._scheduler.schedule_many(
+            [ActionSubject(subject=obj, inject={**kwargs}) for obj in objs]
+        )
@@ -4,7 +4,13 @@ from typing import Any
 
 import pytest
 
-from mediator.event import ConfigEventAggregateError, EventAggregate, EventPublisher
+from mediator.event import (
+    ConfigEventAggregateError,
+    EventAggregate,
+    EventFanOut,
+    EventPublisher,
+    LocalEventBus,
+)
 
 
 class _MockupEventPublisher(EventPublisher):
@@ -85,3 +91,77 @@ async def test_event_aggregate_transaction():
     aggregate.add_event1(2)
     aggregate.add_event2("event")
     await aggregate.commit()
+
+
+class _BatchMockupEventPublisher(_MockupEventPublisher):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def publish_many(self, objs, **kwargs):
+        objs = list(objs)
+        self.batches.append((objs, kwargs))
+        await super().publish_many(objs, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_event_aggregate_publish_many():
+    aggregate = _MockupAggregate()
+    publisher = _BatchMockupEventPublisher()
+    aggregate.use(publisher)
+    aggregate.add_event1(1)
+    aggregate.add_event1(2)
+    aggregate.add_event2("event")
+    aggregate.add_event1(3)
+    await aggregate.commit()
+
+    assert publisher.batches == [
+        ([_Event1(1), _Event1(2)], {}),
+        ([_Event2("event")], {"test": "test"}),
+        ([_Event1(3)], {}),
+    ]
+    assert [obj for obj, _ in publisher.calls] == [
+        _Event1(1),
+        _Event1(2),
+        _Event2("event"),
+        _Event1(3),
+    ]
+
+
+class _OrderedAggregate(EventAggregate):
+    def add_event1(self, value: int):
+        self.enqueue(_Event1(value))
+
+    def add_event2(self, value: str):
+        self.enqueue(_Event2(value))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "bus_factory",
+    [
+        lambda: LocalEventBus(sync_mode=True),
+        lambda: LocalEventBus(fan_out=EventFanOut.INLINE),
+    ],
+)
+async def test_event_aggregate_commit_order(bus_factory):
+    handled = []
+
+    async def _handler1(event: _Event1):
+        handled.append(event)
+
+    async def _handler2(event: _Event2):
+        handled.append(event)
+
+    bus = bus_factory()
+    bus.register(_handler1)
+    bus.register(_handler2)
+    aggregate = _OrderedAggregate()
+    aggregate.use(bus)
+    aggregate.add_event1(1)
+    aggregate.add_event2("1")
+    aggregate.add_event1(2)
+    aggregate.add_event1(3)
+    await aggregate.commit()
+
+    assert handled == [_Event1(1), _Event2("1"), _Event1(2), _Event1(3)]
@@ -1,10 +1,18 @@
 import asyncio
+import sys
+from contextvars import ContextVar
 from typing import Mapping, Type
 
 import pytest
 
 from mediator.common.factory import CallableHandlerPolicy
-from mediator.event import EventHandlerRegistry, LocalEventBus
+from mediator.event import (
+    ClosedEventBusError,
+    EventFanOut,
+    EventHandlerRegistry,
+    LocalEventBus,
+    QueuePolicy,
+)
 
 
 class _MockupEvent1:
@@ -61,3 +69,418 @@ async def test_local_event_bus_sync():
     bus.register(_handler, policies=policies)
     await bus.publish("test")
     assert cnt["test"] == 2
+
+
+@pytest.mark.asyncio
+async def test_local_event_bus_stats():
+    async def _handler(event: str):
+        await asyncio.sleep(0.0)
+
+    bus = LocalEventBus(sync_mode=True, metrics=True)
+    bus.register(_handler)
+    bus.register(_handler)
+    await bus.publish("test")
+    await bus.publish("test")
+
+    assert [(stats.key, stats.calls) for stats in bus.stats()] == [(str, 2)] * 2
+    assert LocalEventBus().stats() == []
+
+
+@pytest.mark.asyncio
+async def test_local_event_bus_drain():
+    done = []
+
+    async def _handler(event: str):
+        await asyncio.sleep(0.01)
+        if event == "first":
+            await bus.publish("second")
+        done.append(event)
+
+    bus = LocalEventBus()
+    bus.register(_handler)
+    await bus.publish("first")
+    assert bus.pending_tasks == 1
+
+    assert await bus.drain(timeout=1)
+    assert done == ["first", "second"]
+    assert bus.pending_tasks == 0
+
+
+@pytest.mark.asyncio
+async def test_local_event_bus_aclose():
+    cancelled = []
+
+    async def _handler(event: float):
+        try:
+            await asyncio.sleep(event)
+        except asyncio.CancelledError:
+            cancelled.append(event)
+            raise
+
+    bus = LocalEventBus()
+    bus.register(_handler)
+    await bus.publish(0.01)
+    await bus.publish(10.0)
+
+    assert not await bus.drain(timeout=0.05)
+    await asyncio.wait_for(bus.aclose(timeout=0.05), 1)
+    assert cancelled == [10.0]
+    assert bus.pending_tasks == 0
+    with pytest.raises(ClosedEventBusError):
+        await bus.publish(0.01)
+
+
+@pytest.mark.asyncio
+async def test_local_event_bus_max_tasks():
+    release = asyncio.Event()
+    running = []
+
+    async def _handler(event: int):
+        running.append(event)
+        await release.wait()
+
+    bus = LocalEventBus(max_tasks=2)
+    bus.register(_handler)
+    await bus.publish(1)
+    await bus.publish(2)
+    blocked = asyncio.ensure_future(bus.publish(3))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    assert bus.pending_tasks == 2
+
+    release.set()
+    await asyncio.wait_for(blocked, 1)
+    assert await bus.drain(timeout=1)
+    assert running == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        LocalEventBus(max_tasks=0)
+
+
+@pytest.mark.asyncio
+async def test_local_event_bus_reports_errors():
+    reported = []
+
+    async def _handler(event: str):
+        raise RuntimeError(event)
+
+    loop = asyncio.get_event_loop()
+    previous = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    try:
+        bus = LocalEventBus(sync_mode=True)
+        bus.register(_handler)
+        await bus.publish("failed")
+    finally:
+        loop.set_exception_handler(previous)
+
+    assert len(reported) == 1
+    assert isinstance(reported[0]["exception"], RuntimeError)
+    assert reported[0]["task"].done()
+
+
+@pytest.mark.asyncio
+async def test_local_event_bus_workers():
+    done = []
+
+    async def _handler(event: int):
+        await asyncio.sleep(0)
+        if event < 0:
+            raise RuntimeError(event)
+        done.append(event)
+
+    reported = []
+    loop = asyncio.get_event_loop()
+    previous = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    try:
+        bus = LocalEventBus(workers=2)
+        bus.register(_handler)
+        for event in [1, 2, -1, 3]:
+            await bus.publish(event)
+        assert bus.pending_tasks == 4
+
+        assert await bus.drain(timeout=1)
+    finally:
+        loop.set_exception_handler(previous)
+
+    assert sorted(done) == [1, 2, 3]
+    assert bus.pending_tasks == 0
+    assert [str(context["exception"]) for context in reported] == ["-1"]
+
+    await asyncio.wait_for(bus.aclose(), 1)
+    with pytest.raises(ClosedEventBusError):
+        await bus.publish(1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy, expected, dropped",
+    [
+        (QueuePolicy.BLOCK, [0, 1, 2, 3], 0),
+        (QueuePolicy.DROP_NEWEST, [0, 1, 2], 1),
+        (QueuePolicy.DROP_OLDEST, [0, 2, 3], 1),
+    ],
+)
+async def test_local_event_bus_workers_queue_policy(policy, expected, dropped):
+    release = asyncio.Event()
+    done = []
+
+    async def _handler(event: int):
+        await release.wait()
+        done.append(event)
+
+    bus = LocalEventBus(workers=1, queue_size=2, queue_policy=policy)
+    bus.register(_handler)
+    await bus.publish(0)
+    await asyncio.sleep(0)
+    await bus.publish(1)
+    await bus.publish(2)
+    blocked = asyncio.ensure_future(bus.publish(3))
+    await asyncio.sleep(0.01)
+    assert blocked.done() is (policy is not QueuePolicy.BLOCK)
+
+    release.set()
+    await asyncio.wait_for(blocked, 1)
+    assert await bus.drain(timeout=1)
+    assert done == expected
+    assert bus.dropped == dropped
+    await asyncio.wait_for(bus.aclose(), 1)
+
+
+def test_local_event_bus_workers_options():
+    with pytest.raises(ValueError):
+        LocalEventBus(workers=0)
+    with pytest.raises(ValueError):
+        LocalEventBus(workers=1, sync_mode=True)
+    with pytest.raises(ValueError):
+        LocalEventBus(workers=1, max_tasks=1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fan_out, tasks, pending",
+    [
+        (EventFanOut.TASKS, 3, 3),
+        (EventFanOut.SEQUENTIAL, 1, 1),
+        (EventFanOut.INLINE, 1, 0),
+    ],
+)
+async def test_local_event_bus_fan_out(fan_out, tasks, pending):
+    running = []
+    reported = []
+
+    def _create_handler(index: int):
+        async def _handler(event: str):
+            running.append((index, asyncio.current_task()))
+            if index == 1:
+                raise RuntimeError(index)
+
+        return _handler
+
+    async def _other_handler(event: int):
+        running.append((None, asyncio.current_task()))
+
+    loop = asyncio.get_event_loop()
+    previous = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    try:
+        bus = LocalEventBus(fan_outs={str: fan_out})
+        for index in range(3):
+            bus.register(_create_handler(index))
+        bus.register(_other_handler)
+        await bus.publish("test")
+        assert bus.pending_tasks == pending
+        assert await bus.drain(timeout=1)
+        await bus.publish(1)
+        assert await bus.drain(timeout=1)
+    finally:
+        loop.set_exception_handler(previous)
+
+    assert [index for index, _ in running] == [0, 1, 2, None]
+    assert len({task for _, task in running[:3]}) == tasks
+    assert (running[0][1] is asyncio.current_task()) is (fan_out is EventFanOut.INLINE)
+    assert running[3][1] is not asyncio.current_task()
+    assert [str(context["exception"]) for context in reported] == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_local_event_bus_fan_out_workers():
+    running = []
+
+    async def _handler(event: str):
+        running.append(asyncio.current_task())
+
+    bus = LocalEventBus(workers=2, fan_out=EventFanOut.SEQUENTIAL)
+    bus.register(_handler)
+    bus.register(_handler)
+    await bus.publish("test")
+    assert bus.pending_tasks == 1
+    assert await bus.drain(timeout=1)
+    assert len(running) == 2 and running[0] is running[1]
+    await asyncio.wait_for(bus.aclose(), 1)
+
+
+_eager_var: ContextVar[str] = ContextVar("eager_var", default="publisher")
+
+_eager_only = pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="eager task start requires Python 3.12+"
+)
+
+
+@_eager_only
+@pytest.mark.asyncio
+async def test_local_event_bus_eager():
+    release = asyncio.Event()
+    done = []
+    reported = []
+    tasks = []
+
+    async def _handler(event: str):
+        tasks.append(asyncio.current_task())
+        _eager_var.set(event)
+        if event == "suspend":
+            await release.wait()
+        elif event == "fail":
+            raise RuntimeError(event)
+        done.append((event, _eager_var.get()))
+
+    loop = asyncio.get_event_loop()
+    previous = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    try:
+        bus = LocalEventBus(eager=True, max_tasks=1)
+        bus.register(_handler)
+
+        await bus.publish("immediate")
+        assert done == [("immediate", "immediate")]
+        assert bus.pending_tasks == 0
+
+        await bus.publish("fail")
+        assert [str(context["exception"]) for context in reported] == ["fail"]
+        assert bus.pending_tasks == 0
+
+        await bus.publish("suspend")
+        assert bus.pending_tasks == 1
+        release.set()
+        assert await bus.drain(timeout=1)
+        assert done[-1] == ("suspend", "suspend")
+    finally:
+        loop.set_exception_handler(previous)
+    assert _eager_var.get() == "publisher"
+    # handler runs in its own task even before it suspends
+    assert len(set(tasks)) == 3
+    assert asyncio.current_task() not in tasks
+
+
+@_eager_only
+@pytest.mark.asyncio
+async def test_local_event_bus_eager_timeout():
+    timed_out = []
+
+    async def _handler(event: str):
+        try:
+            await asyncio.wait_for(asyncio.sleep(10), 0.01)
+        except asyncio.TimeoutError:
+            timed_out.append(event)
+
+    bus = LocalEventBus(eager=True)
+    bus.register(_handler)
+    await bus.publish("test")
+    # handler timeout cancels handler task, not publisher
+    await asyncio.sleep(0.05)
+    assert timed_out == ["test"]
+    assert await bus.drain(timeout=1)
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 12), reason="eager task start supported")
+def test_local_event_bus_eager_unsupported():
+    with pytest.raises(ValueError):
+        LocalEventBus(eager=True)
+
+
+@_eager_only
+@pytest.mark.asyncio
+async def test_local_event_bus_eager_cancel():
+    cancelled = []
+
+    async def _handler(event: str):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(event)
+            raise
+
+    bus = LocalEventBus(eager=True)
+    bus.register(_handler)
+    await bus.publish("test")
+    await asyncio.wait_for(bus.aclose(timeout=0.01), 1)
+    assert cancelled == ["test"]
+    assert bus.pending_tasks == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("workers", [None, 2])
+async def test_local_event_bus_publish_many(workers):
+    running = []
+
+    def _create_handler(index: int):
+        async def _handler(event: int, source: str):
+            await asyncio.sleep(0)
+            running.append((index, event, source, asyncio.current_task()))
+
+        return _handler
+
+    async def _other_handler(event: str, source: str):
+        running.append((None, event, source, asyncio.current_task()))
+
+    bus = LocalEventBus(workers=workers)
+    bus.register(_create_handler(0))
+    bus.register(_create_handler(1))
+    bus.register(_other_handler)
+    await bus.publish_many([1, 2, 3, "a", None], source="test")
+    assert bus.pending_tasks == 3
+    assert await bus.drain(timeout=1)
+    await asyncio.wait_for(bus.aclose(), 1)
+
+    for index in (0, 1):
+        handled = [item for item in running if item[0] == index]
+        assert [(event, source) for _, event, source, _ in handled] == [
+            (1, "test"),
+            (2, "test"),
+            (3, "test"),
+        ]
+        if workers is None:
+            assert len({task for *_, task in handled}) == 1
+    assert [item[1] for item in running if item[0] is None] == ["a"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fan_out", [EventFanOut.TASKS, EventFanOut.SEQUENTIAL, EventFanOut.INLINE]
+)
+async def test_local_event_bus_publish_many_fan_out(fan_out):
+    running = []
+    reported = []
+
+    def _create_handler(index: int):
+        async def _handler(event: int):
+            if event == 2:
+                raise RuntimeError(event)
+            running.append((index, event))
+
+        return _handler
+
+    loop = asyncio.get_event_loop()
+    previous = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    try:
+        bus = LocalEventBus(fan_out=fan_out, sync_mode=True)
+        bus.register(_create_handler(0))
+        bus.register(_create_handler(1))
+        await bus.publish_many([1, 2, 3])
+    finally:
+        loop.set_exception_handler(previous)
+
+    assert sorted(running) == [(0, 1), (0, 3), (1, 1), (1, 3)]
+    assert [str(context["exception"]) for context in reported] == ["2", "2"]
@@ -0,0 +1,23 @@
+from mediator.monitoring.prometheus import (
+    DEFAULT_BUCKETS,
+    PrometheusExporter,
+    render_prometheus,
+)
+from mediator.monitoring.watchdog import (
+    LoopWatchdog,
+    StallReport,
+    WatchdogModifierFactory,
+    current_handler,
+)
+
+__all__ = [
+    # prometheus
+    "DEFAULT_BUCKETS",
+    "PrometheusExporter",
+    "render_prometheus",
+    # watchdog
+    "LoopWatchdog",
+    "StallReport",
+    "WatchdogModifierFactory",
+    "current_handler",
+]
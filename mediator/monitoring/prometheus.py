@@ -0,0 +1,300 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from mediator.common.modifiers import HandlerStats
+from mediator.utils.histogram import LatencyHistogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#: default latency histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    """
+    Escapes label value according to Prometheus text format.
+    :param value: raw label value
+    :return: escaped label value
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _name(obj: Any) -> str:
+    """
+    Provides readable name of handler key or handler object.
+    :param obj: handler key (action type) or handler object
+    :return: qualified name
+    """
+    module: Optional[str]
+    name = getattr(obj, "__qualname__", None)
+    if name is None:
+        name = type(obj).__qualname__
+        module = type(obj).__module__
+    else:
+        module = getattr(obj, "__module__", None)
+    return name if not module or module == "builtins" else f"{module}.{name}"
+
+
+def _labels(labels: Iterable[Tuple[str, str]]) -> str:
+    """
+    Renders label set.
+    :param labels: label name, value pairs
+    :return: rendered label set
+    """
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+
+
+def _cumulative(histogram: LatencyHistogram, bounds: Sequence[float]) -> List[float]:
+    """
+    Provides cumulative counts of given histogram for given bucket bounds.
+    Values of log-bucketed histogram bucket are counted in the first bucket
+    with bound not lower than log-bucketed histogram bucket upper bound.
+    :param histogram: latency histogram
+    :param bounds: ascending bucket upper bounds
+    :return: count of values not greater than bound for every bound
+    """
+    buckets = histogram.buckets()
+    counts = []
+    cumulative = 0.0
+    index = 0
+    for bound in bounds:
+        while index < len(buckets) and buckets[index][0] <= bound:
+            cumulative += buckets[index][1]
+            index += 1
+        counts.append(cumulative)
+    return counts
+
+
+def _value(value: float) -> str:
+    """
+    Renders sample value.
+    :param value: sample value
+    :return: rendered sample value
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus(
+    buses: Mapping[str, Any],
+    namespace: str = "mediator",
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> str:
+    """
+    Renders metrics of given buses in Prometheus text exposition format.
+
+    Buses are expected to be created with `metrics=True`,
+    handler metrics are labeled with bus name, handler key and handler object;
+    handler objects with the same name get `#<number>` suffix
+    in order of registration.
+    For event buses number of pending background tasks is rendered too.
+    Latency histogram always has the same buckets of given bounds,
+    recorded latencies are assigned to them
+    with precision of metrics latency histogram.
+    :param buses: bus name to bus (`LocalRequestBus` or `LocalEventBus`) mapping
+    :param namespace: metric name prefix
+    :param buckets: latency histogram bucket upper bounds in seconds
+    :return: metrics text
+    """
+    bounds = sorted(buckets)
+    le_values = [_value(bound) for bound in bounds]
+    families: Dict[str, Tuple[str, str, List[str]]] = {
+        "calls": ("counter", "Number of finished handler calls.", []),
+        "errors": ("counter", "Number of handler calls finished with error.", []),
+        "in_flight": ("gauge", "Number of handler calls in progress.", []),
+        "latency": ("histogram", "Handler call latency in seconds.", []),
+        "tasks": ("gauge", "Number of pending background event tasks.", []),
+    }
+    names = {
+        "calls": f"{namespace}_handler_calls_total",
+        "errors": f"{namespace}_handler_errors_total",
+        "in_flight": f"{namespace}_handler_in_flight",
+        "latency": f"{namespace}_handler_latency_seconds",
+        "tasks": f"{namespace}_event_tasks_pending",
+    }
+
+    for bus_name, bus in buses.items():
+        stats_list: List[HandlerStats] = bus.stats()
+        seen: Dict[Tuple[str, str], int] = {}
+        for stats in stats_list:
+            key_name, handler_name = _name(stats.key), _name(stats.obj)
+            number = seen[key_name, handler_name] = (
+                seen.get((key_name, handler_name), 0) + 1
+            )
+            if number > 1:
+                handler_name = f"{handler_name}#{number}"
+            labels = [
+                ("bus", bus_name),
+                ("key", key_name),
+                ("handler", handler_name),
+            ]
+            label_text = _labels(labels)
+            families["calls"][2].append(
+                f"{names['calls']}{{{label_text}}} {stats.calls}"
+            )
+            families["errors"][2].append(
+                f"{names['errors']}{{{label_text}}} {stats.errors}"
+            )
+            families["in_flight"][2].append(
+                f"{names['in_flight']}{{{label_text}}} {stats.in_flight}"
+            )
+            samples = families["latency"][2]
+            counts = _cumulative(stats.latency, bounds)
+            for le_value, cumulative in zip(le_values, counts):
+                bucket_labels = _labels([*labels, ("le", le_value)])
+                samples.append(
+                    f"{names['latency']}_bucket{{{bucket_labels}}} {_value(cumulative)}"
+                )
+            bucket_labels = _labels([*labels, ("le", "+Inf")])
+            samples.append(
+                f"{names['latency']}_bucket{{{bucket_labels}}} "
+                f"{_value(stats.latency.count)}"
+            )
+            samples.append(
+                f"{names['latency']}_sum{{{label_text}}} {_value(stats.latency.sum)}"
+            )
+            samples.append(
+                f"{names['latency']}_count{{{label_text}}} "
+                f"{_value(stats.latency.count)}"
+            )
+
+        pending_tasks: Optional[int] = getattr(bus, "pending_tasks", None)
+        if pending_tasks is not None:
+            families["tasks"][2].append(
+                f"{names['tasks']}{{{_labels([('bus', bus_name)])}}} {pending_tasks}"
+            )
+
+    lines: List[str] = []
+    for family, (kind, help_text, samples) in families.items():
+        if not samples:
+            continue
+        lines.append(f"# HELP {names[family]} {help_text}")
+        lines.append(f"# TYPE {names[family]} {kind}")
+        lines.extend(samples)
+    return "".join(f"{line}\n" for line in lines)
+
+
+class PrometheusExporter:
+    """
+    Prometheus exporter.
+
+    Minimal asyncio HTTP listener that serves metrics of given buses
+    in Prometheus text exposition format, so they can be scraped directly.
+
+    >>> async with PrometheusExporter({"requests": request_bus}, port=9464):
+    >>>     ...
+    """
+
+    def __init__(
+        self,
+        buses: Mapping[str, Any],
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        path: str = "/metrics",
+        namespace: str = "mediator",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        read_timeout: float = 5.0,
+    ):
+        """
+        Initializes Prometheus exporter.
+        :param buses: bus name to bus (`LocalRequestBus` or `LocalEventBus`) mapping
+        :param host: listen address
+        :param port: listen port; zero selects free port
+        :param path: metrics endpoint path
+        :param namespace: metric name prefix
+        :param buckets: latency histogram bucket upper bounds in seconds
+        :param read_timeout: max time to receive request head
+        """
+        self.buses = buses
+        self.host = host
+        self.port = port
+        self.path = path
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self.read_timeout = read_timeout
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._bound_port: Optional[int] = None
+
+    @property
+    def bound_port(self) -> Optional[int]:
+        """
+        Provides actual listen port of started exporter.
+        :return: listen port or None when exporter is not started
+        """
+        return self._bound_port
+
+    async def start(self):
+        """
+        Starts listening for scrape requests.
+        """
+        if self._server is None:
+            server = await asyncio.start_server(
+                self._serve, host=self.host, port=self.port
+            )
+            self._server = server
+            if server.sockets:
+                self._bound_port = server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """
+        Stops listening for scrape requests.
+        """
+        server, self._server = self._server, None
+        self._bound_port = None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def __aenter__(self) -> "PrometheusExporter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serves single HTTP connection.
+        :param reader: connection reader
+        :param writer: connection writer
+        """
+        try:
+            head = await asyncio.wait_for(
+                reader.readuntil(b"\r\n\r\n"), timeout=self.read_timeout
+            )
+            method, target, *_ = head.decode("latin-1").split(" ", 2)
+            path = target.split("?", 1)[0]
+            if method not in ("GET", "HEAD"):
+                status, body = "405 Method Not Allowed", b""
+            elif path != self.path:
+                status, body = "404 Not Found", b""
+            else:
+                text = render_prometheus(
+                    self.buses, namespace=self.namespace, buckets=self.buckets
+                )
+                status, body = "200 OK", text.encode("utf-8")
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: {CONTENT_TYPE}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("latin-1")
+            )
+            if method != "HEAD":
+                writer.write(body)
+            await writer.drain()
+        except (
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            ConnectionError,
+            ValueError,
+        ):
+            # malformed or broken request, connection is just closed
+            pass
+        finally:
+            writer.close()
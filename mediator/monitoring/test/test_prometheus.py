@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from mediator.event import LocalEventBus
+from mediator.monitoring import DEFAULT_BUCKETS, PrometheusExporter, render_prometheus
+from mediator.request import LocalRequestBus
+
+
+class _Query:
+    pass
+
+
+class _Event:
+    pass
+
+
+async def _handle_query(query: _Query):
+    return "query"
+
+
+async def _handle_event(event: _Event):
+    await asyncio.sleep(0)
+
+
+async def _buses():
+    request_bus = LocalRequestBus(metrics=True)
+    request_bus.register(_handle_query)
+    event_bus = LocalEventBus(metrics=True)
+    event_bus.register(_handle_event)
+
+    await request_bus.execute(_Query())
+    await event_bus.publish(_Event())
+    return {"requests": request_bus, "events": event_bus}
+
+
+@pytest.mark.asyncio
+async def test_render_prometheus():
+    buses = await _buses()
+    text = render_prometheus(buses)
+    lines = text.splitlines()
+    name = __name__
+
+    labels = f'bus="requests",key="{name}._Query",handler="{name}._handle_query"'
+    assert "# TYPE mediator_handler_calls_total counter" in lines
+    assert f"mediator_handler_calls_total{{{labels}}} 1" in lines
+    assert f"mediator_handler_errors_total{{{labels}}} 0" in lines
+    assert f"mediator_handler_in_flight{{{labels}}} 0" in lines
+    assert "# TYPE mediator_handler_latency_seconds histogram" in lines
+    assert f'mediator_handler_latency_seconds_bucket{{{labels},le="+Inf"}} 1' in lines
+    assert f"mediator_handler_latency_seconds_count{{{labels}}} 1" in lines
+
+    # event is scheduled but not processed yet
+    labels = f'bus="events",key="{name}._Event",handler="{name}._handle_event"'
+    assert f"mediator_handler_calls_total{{{labels}}} 0" in lines
+    assert 'mediator_event_tasks_pending{bus="events"} 1' in lines
+    assert text.endswith("\n")
+
+    await asyncio.sleep(0.01)
+    lines = render_prometheus(buses).splitlines()
+    assert f"mediator_handler_calls_total{{{labels}}} 1" in lines
+    assert 'mediator_event_tasks_pending{bus="events"} 0' in lines
+
+    assert render_prometheus({"empty": LocalRequestBus()}, namespace="app") == ""
+
+
+def _buckets(lines, labels):
+    prefix = f"mediator_handler_latency_seconds_bucket{{{labels},le="
+    return [
+        (line.split('le="')[1].split('"')[0], float(line.rsplit(" ", 1)[1]))
+        for line in lines
+        if line.startswith(prefix)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_render_prometheus_buckets():
+    delays = []
+
+    async def _handle_query(query: _Query):
+        await asyncio.sleep(delays.pop())
+
+    bus = LocalRequestBus(metrics=True)
+    bus.register(_handle_query)
+    handler = f"{__name__}.{_handle_query.__qualname__}"
+    labels = f'bus="requests",key="{__name__}._Query",handler="{handler}"'
+
+    lines = render_prometheus({"requests": bus}, buckets=[0.1, 0.01]).splitlines()
+    assert _buckets(lines, labels) == [("0.01", 0), ("0.1", 0), ("+Inf", 0)]
+
+    delays.extend([0.2, 0.02])
+    for _ in range(2):
+        await bus.execute(_Query())
+    lines = render_prometheus({"requests": bus}, buckets=[0.1, 0.01]).splitlines()
+    assert _buckets(lines, labels) == [("0.01", 0), ("0.1", 1), ("+Inf", 2)]
+
+    lines = render_prometheus({"requests": bus}).splitlines()
+    buckets = _buckets(lines, labels)
+    assert [float(le) for le, _ in buckets] == [*DEFAULT_BUCKETS, float("inf")]
+    counts = [count for _, count in buckets]
+    assert counts == sorted(counts) and counts[-1] == 2
+
+
+def _create_handler():
+    async def _handle_event(event: _Event):
+        pass
+
+    return _handle_event
+
+
+@pytest.mark.asyncio
+async def test_render_prometheus_same_names():
+    bus = LocalEventBus(metrics=True, sync_mode=True)
+    for _ in range(3):
+        bus.register(_create_handler())
+    await bus.publish(_Event())
+
+    text = render_prometheus({"events": bus}, buckets=[])
+    name = f"{__name__}.{_create_handler().__qualname__}"
+    calls = [
+        line
+        for line in text.splitlines()
+        if line.startswith("mediator_handler_calls_total{")
+    ]
+    assert calls == [
+        f'mediator_handler_calls_total{{bus="events",key="{__name__}._Event",'
+        f'handler="{handler}"}} 1'
+        for handler in [name, f"{name}#2", f"{name}#3"]
+    ]
+
+
+async def _scrape(port: int, request: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_prometheus_exporter():
+    buses = await _buses()
+    async with PrometheusExporter(buses, port=0, namespace="app") as exporter:
+        port = exporter.bound_port
+        assert port is not None
+
+        response = await _scrape(port, b"GET /metrics HTTP/1.1\r\nHost: x\r\n\r\n")
+        head, body = response.split(b"\r\n\r\n", 1)
+        assert head.startswith(b"HTTP/1.1 200 OK")
+        assert b"Content-Type: text/plain; version=0.0.4" in head
+        assert b"app_handler_calls_total{" in body
+
+        response = await _scrape(port, b"GET /other HTTP/1.1\r\n\r\n")
+        assert response.startswith(b"HTTP/1.1 404")
+        response = await _scrape(port, b"POST /metrics HTTP/1.1\r\n\r\n")
+        assert response.startswith(b"HTTP/1.1 405")
+    assert exporter.bound_port is None
@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+
+from mediator.monitoring import (
+    LoopWatchdog,
+    StallReport,
+    WatchdogModifierFactory,
+    current_handler,
+)
+from mediator.request import LocalRequestBus
+
+
+class _Blocking:
+    pass
+
+
+class _Current:
+    pass
+
+
+class _Waiting:
+    pass
+
+
+async def _handle_blocking(query: _Blocking):
+    time.sleep(0.2)
+    return "blocked"
+
+
+async def _handle_current(query: _Current):
+    handler = current_handler()
+    return None if handler is None else handler.key
+
+
+@pytest.mark.asyncio
+async def test_current_handler():
+    bus = LocalRequestBus(modifiers=[WatchdogModifierFactory()])
+    bus.register(_handle_current)
+
+    assert await bus.execute(_Current()) is _Current
+    assert current_handler() is None
+
+
+@pytest.mark.asyncio
+async def test_loop_watchdog_reports_stall():
+    bus = LocalRequestBus(modifiers=[WatchdogModifierFactory()])
+    bus.register(_handle_blocking)
+    reported = []
+
+    async with LoopWatchdog(threshold=0.05, callback=reported.append) as watchdog:
+        await asyncio.sleep(0.05)
+        assert watchdog.reports == []
+        assert await asyncio.wait_for(bus.execute(_Blocking()), 1) == "blocked"
+
+    assert len(watchdog.reports) == 1
+    report = watchdog.reports[0]
+    assert isinstance(report, StallReport)
+    assert reported == [report]
+    assert report.key is _Blocking
+    assert report.obj is _handle_blocking
+    assert report.duration > 0.05
+    assert report.stack[-1].endswith("_handle_blocking")
+
+
+@pytest.mark.asyncio
+async def test_loop_watchdog_unattributed_stall():
+    async with LoopWatchdog(threshold=0.05, max_reports=1) as watchdog:
+        time.sleep(0.2)
+        await asyncio.sleep(0.05)
+        time.sleep(0.2)
+        await asyncio.sleep(0.05)
+
+    assert len(watchdog.reports) == 1
+    assert watchdog.reports[0].key is None
+    assert watchdog.reports[0].obj is None
+
+
+@pytest.mark.asyncio
+async def test_loop_watchdog_suspended_handler():
+    bus = LocalRequestBus(modifiers=[WatchdogModifierFactory()])
+    bus.register(_handle_blocking)
+    release = asyncio.Event()
+
+    async def _handle_waiting(query: _Waiting):
+        await release.wait()
+
+    bus.register(_handle_waiting)
+    waiting = asyncio.ensure_future(bus.execute(_Waiting()))
+    await asyncio.sleep(0)
+
+    async with LoopWatchdog(threshold=0.05) as watchdog:
+        # suspended handler is not executing
+        time.sleep(0.2)
+        await asyncio.sleep(0.05)
+        assert await asyncio.wait_for(bus.execute(_Blocking()), 1) == "blocked"
+        await asyncio.sleep(0.05)
+    release.set()
+    await waiting
+
+    assert [report.key for report in watchdog.reports] == [None, _Blocking]
+
+
+@pytest.mark.asyncio
+async def test_loop_watchdog_callback_error(caplog):
+    def _callback(report: StallReport):
+        raise RuntimeError("callback")
+
+    async with LoopWatchdog(threshold=0.05, callback=_callback) as watchdog:
+        for _ in range(2):
+            time.sleep(0.2)
+            await asyncio.sleep(0.05)
+
+    assert len(watchdog.reports) == 2
+    assert "Loop watchdog callback failed" in caplog.text
+
+
+def test_loop_watchdog_options():
+    with pytest.raises(ValueError):
+        LoopWatchdog(threshold=0)
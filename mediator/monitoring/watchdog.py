@@ -0,0 +1,284 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import FrameType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from mediator.common.handler import HandlerInfo
+from mediator.common.modifiers import ModifierFactory, modifier_target
+from mediator.common.types import ActionCallType, ActionResult, ActionSubject
+
+_logger = logging.getLogger(__name__)
+
+_current_handler: ContextVar[Optional[HandlerInfo]] = ContextVar(
+    "mediator_current_handler", default=None
+)
+
+# handler executing right now in given thread, published for LoopWatchdog
+_executing: Dict[int, HandlerInfo] = {}
+
+
+def current_handler() -> Optional[HandlerInfo]:
+    """
+    Provides handler currently processing action in this context.
+    Requires handler to be wrapped by `WatchdogModifierFactory` modifier.
+    :return: handler or None when called outside of watched handler
+    """
+    return _current_handler.get()
+
+
+class WatchdogModifierFactory(ModifierFactory):
+    """
+    Watchdog modifier factory.
+
+    Produces modifiers that mark handler as currently processing action
+    (see `current_handler`) and publish it as executing in event loop thread
+    during every step of its call, so event loop stalls detected
+    by `LoopWatchdog` can be attributed to handler that blocked the loop.
+    """
+
+    def create(self, call: ActionCallType, **kwargs) -> ActionCallType:
+        """
+        Produces watchdog modifier for given callable.
+        :param call: callable to be wrapped
+        :param kwargs: extra context information
+        :return: watchdog modifier
+        """
+        target = modifier_target(kwargs)
+        if target is None:
+            return call
+
+        async def _watchdog(action: ActionSubject) -> ActionResult:
+            token = _current_handler.set(target)
+            try:
+                return await _Executing(call(action), target)
+            finally:
+                _current_handler.reset(token)
+
+        return _watchdog
+
+
+class _Executing:
+    """
+    Awaitable running given handler call
+    and publishing handler as executing in current thread during every step,
+    so `LoopWatchdog` sentinel thread can read it.
+    """
+
+    __slots__ = ("awaitable", "target")
+
+    def __init__(self, awaitable: Awaitable[ActionResult], target: HandlerInfo):
+        self.awaitable = awaitable
+        self.target = target
+
+    def __await__(self):
+        steps = self.awaitable.__await__()
+        target = self.target
+        thread = threading.get_ident()
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            previous = _executing.get(thread)
+            _executing[thread] = target
+            try:
+                if error is None:
+                    yielded = steps.send(value)
+                else:
+                    yielded = steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                if previous is None:
+                    del _executing[thread]
+                else:
+                    _executing[thread] = previous
+            try:
+                value, error = (yield yielded), None
+            except GeneratorExit:
+                steps.close()
+                raise
+            except BaseException as exc:
+                value, error = None, exc
+
+
+@dataclass(frozen=True)
+class StallReport:
+    """
+    Event loop stall report.
+
+    Stack is a tuple of `file:line function` entries of event loop thread
+    from the outermost frame, captured when stall was detected.
+    """
+
+    started: float
+    duration: float
+    key: Hashable
+    obj: Any
+    stack: Tuple[str, ...]
+
+
+class LoopWatchdog:
+    """
+    Event loop watchdog.
+
+    Event loop periodically updates heartbeat timestamp,
+    while sentinel thread checks if heartbeat is late.
+    When it is late more than threshold, event loop is considered stalled
+    (blocked by synchronous code) and stall is reported
+    with event loop thread stack and handler running at that moment
+    (handlers have to be wrapped by `WatchdogModifierFactory` modifier).
+    Every stall is reported once, from sentinel thread, while it lasts.
+
+    >>> async with LoopWatchdog(threshold=0.1, callback=print):
+    >>>     ...
+    """
+
+    _reports: Deque[StallReport]
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        interval: Optional[float] = None,
+        callback: Optional[Callable[[StallReport], Any]] = None,
+        max_reports: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes event loop watchdog.
+        :param threshold: heartbeat delay in seconds treated as stall
+        :param interval: (optional) heartbeat and check interval;
+        when not provided quarter of threshold is used
+        :param callback: (optional) callable invoked with every stall report;
+        it is invoked in sentinel thread, while event loop is still blocked
+        :param max_reports: max number of kept reports;
+        oldest reports are dropped first
+        :param clock: time source
+        """
+        if threshold <= 0:
+            raise ValueError("threshold must be greater than 0")
+        self.threshold = threshold
+        self.interval = threshold / 4 if interval is None else interval
+        self.callback = callback
+        self.clock = clock
+        self._reports = deque(maxlen=max_reports)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread = 0
+        self._beat = 0.0
+        self._reported_beat: Optional[float] = None
+        self._heartbeat: Optional[asyncio.TimerHandle] = None
+        self._sentinel: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def reports(self) -> List[StallReport]:
+        """
+        Provides kept stall reports.
+        :return: list of reports from the oldest one
+        """
+        return list(self._reports)
+
+    def start(self):
+        """
+        Starts watching event loop running in current thread.
+        """
+        if self._sentinel is not None:
+            return
+        self._loop = asyncio.get_event_loop()
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        self._pulse()
+        self._sentinel = threading.Thread(
+            target=self._watch, name="mediator-loop-watchdog", daemon=True
+        )
+        self._sentinel.start()
+
+    def stop(self):
+        """
+        Stops watching event loop.
+        """
+        sentinel, self._sentinel = self._sentinel, None
+        if sentinel is None:
+            return
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        sentinel.join()
+
+    async def __aenter__(self) -> "LoopWatchdog":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _pulse(self):
+        """
+        Updates heartbeat timestamp and schedules the next one.
+        """
+        self._beat = self.clock()
+        assert self._loop is not None
+        self._heartbeat = self._loop.call_later(self.interval, self._pulse)
+
+    def _watch(self):
+        """
+        Sentinel thread routine - checks heartbeat delays.
+        """
+        while not self._stopped.wait(self.interval):
+            beat = self._beat
+            delay = self.clock() - beat - self.interval
+            if delay > self.threshold and self._reported_beat != beat:
+                self._reported_beat = beat
+                self._report(beat, delay)
+
+    def _report(self, beat: float, delay: float):
+        """
+        Captures event loop thread state and reports stall.
+        :param beat: last heartbeat timestamp
+        :param delay: heartbeat delay
+        """
+        frame = sys._current_frames().get(self._loop_thread)
+        target = _executing.get(self._loop_thread)
+        report = StallReport(
+            started=beat + self.interval,
+            duration=delay,
+            key=None if target is None else target.key,
+            obj=None if target is None else target.obj,
+            stack=self._format(frame),
+        )
+        self._reports.append(report)
+        if self.callback is not None:
+            try:
+                self.callback(report)
+            except Exception:
+                # sentinel thread keeps watching despite callback error
+                _logger.exception("Loop watchdog callback failed for %r", report)
+
+    @staticmethod
+    def _format(frame: Optional[FrameType]) -> Tuple[str, ...]:
+        """
+        Formats given stack.
+        :param frame: the innermost stack frame
+        :return: stack entries from the outermost frame
+        """
+        entries = []
+        while frame is not None:
+            code = frame.f_code
+            entries.append(f"{code.co_filename}:{frame.f_lineno} {code.co_name}")
+            frame = frame.f_back
+        return tuple(reversed(entries))
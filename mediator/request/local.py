@@ -1,11 +1,27 @@
-from typing import Any, Dict, Hashable, Iterable, Optional, Sequence
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from mediator.common.factory import (
     CallableHandlerPolicy,
     HandlerFactoryCascade,
     PolicyType,
 )
-from mediator.common.modifiers import ModifierFactory
+from mediator.common.modifiers import (
+    HandlerStats,
+    MetricsModifierFactory,
+    ModifierFactory,
+)
 from mediator.common.registry import (
     HandlerEntry,
     HandlerRegistry,
@@ -23,13 +39,24 @@ class _RequestExecutorHandlerStore(MappingHandlerStore):
     """
 
     _calls: Dict[Hashable, ActionCallType]
+    _resolved: Dict[Hashable, None]
+    subject_calls: Dict[Hashable, Callable[[Any], Awaitable[Any]]]
 
-    def __init__(self):
+    def __init__(self, mro_lookup: bool = False, mro_cache_size: int = 1024):
         """
         Initializes empty request executor handler store.
+        :param mro_lookup: when True requests that have no exactly matching handler
+        are dispatched to handler of the nearest base class in request type MRO,
+        when False (default) only exact request type match is allowed
+        :param mro_cache_size: max number of request types
+        with memoized MRO resolution result
         """
         super().__init__()
         self._calls = {}
+        self._resolved = {}
+        self.subject_calls = {}
+        self.mro_lookup = mro_lookup
+        self.mro_cache_size = mro_cache_size
 
     def add(self, entry: HandlerEntry):
         """
@@ -57,9 +84,59 @@ class _RequestExecutorHandlerStore(MappingHandlerStore):
     def _map_call(self, entry: HandlerEntry):
         """
         Sets given handler entry to request processing.
+        Handler fast path is connected when entry has no modifiers.
         :param entry: handler entry to add
         """
+        self._invalidate()
         self._calls[entry.key] = entry.handler_pipeline()
+        subject_call = None if entry.modifiers else entry.handler.subject_call()
+        if subject_call is not None:
+            self.subject_calls[entry.key] = subject_call
+
+    def _invalidate(self):
+        """
+        Drops all memoized MRO resolution results.
+        """
+        calls = self._calls
+        for key in self._resolved:
+            del calls[key]
+        self._resolved.clear()
+
+    def lookup(self, key: Hashable) -> ActionCallType:
+        """
+        Provides request processing callable for given action key.
+        :param key: request action key
+        :raises LookupHandlerStoreError:
+        when there is no matching handler to process given request
+        :return: request processing callable
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = self._resolve(key)
+        return call
+
+    def _resolve(self, key: Hashable) -> ActionCallType:
+        """
+        Finds request processing callable for nearest base class
+        of given action key and memoizes it among exactly matching ones.
+        :param key: request action key
+        :raises LookupHandlerStoreError:
+        when there is no matching handler to process given request
+        :return: request processing callable
+        """
+        if self.mro_lookup:
+            for base in getattr(key, "__mro__", ())[1:]:
+                call = self._calls.get(base)
+                if call is not None:
+                    resolved = self._resolved
+                    if resolved and len(resolved) >= self.mro_cache_size:
+                        oldest = next(iter(resolved))
+                        del resolved[oldest]
+                        del self._calls[oldest]
+                    resolved[key] = None
+                    self._calls[key] = call
+                    return call
+        raise LookupHandlerStoreError(f"Handler not defined for key {key}")
 
     async def __call__(self, action: ActionSubject) -> ActionResult:
         """
@@ -70,11 +147,7 @@ class _RequestExecutorHandlerStore(MappingHandlerStore):
         when there is no matching handler to process given request
         :return: request processing action result
         """
-        key = action.key
-        call = self._calls.get(key)
-        if call is None:
-            raise LookupHandlerStoreError(f"Handler not defined for key {key}")
-        return await call(action)
+        return await self.lookup(action.key)(action)
 
 
 class LocalRequestBus(HandlerRegistry, RequestExecutor):
@@ -90,6 +163,9 @@ class LocalRequestBus(HandlerRegistry, RequestExecutor):
         policies: Optional[Sequence[PolicyType]] = None,
         cascade: Optional[HandlerFactoryCascade] = None,
         modifiers: Sequence[ModifierFactory] = (),
+        mro_lookup: bool = False,
+        mro_cache_size: int = 1024,
+        metrics: bool = False,
     ):
         """
         Initializes local request bus with given specification.
@@ -102,8 +178,19 @@ class LocalRequestBus(HandlerRegistry, RequestExecutor):
         (optional) custom handler factory cascade to customize
         policy into handler factory mapping
         :param modifiers: sequence of modifiers to be applied on new handler entries
+        :param mro_lookup: when True request subclasses without own handler
+        are processed by handler of the nearest base class;
+        resolution is done once per request type and memoized
+        :param mro_cache_size: max number of memoized request type resolutions
+        :param metrics: when True calls, errors and latency of every handler
+        are recorded and provided by `stats` method
         """
-        executor_store = _RequestExecutorHandlerStore()
+        self._metrics = MetricsModifierFactory() if metrics else None
+        if self._metrics is not None:
+            modifiers = [self._metrics, *modifiers]
+        executor_store = _RequestExecutorHandlerStore(
+            mro_lookup=mro_lookup, mro_cache_size=mro_cache_size
+        )
         HandlerRegistry.__init__(
             self,
             store=executor_store,
@@ -112,18 +199,118 @@ class LocalRequestBus(HandlerRegistry, RequestExecutor):
             modifiers=modifiers,
         )
         self._executor = executor_store
+        self._subject_calls = executor_store.subject_calls
+
+    def stats(self) -> List[HandlerStats]:
+        """
+        Provides metrics of all registered handlers.
+        :return: list of handler metrics snapshots
+        (empty when bus is created without metrics)
+        """
+        if self._metrics is None:
+            return []
+        return self._metrics.snapshot()
 
     async def execute(self, obj: Any, **kwargs):
         """
         Executes given request.
+        Requests without extra arguments, matching handler without modifiers,
+        are executed using handler fast path (directly with request object).
         :param obj: request object
         :param kwargs: request extra arguments
         :raises LookupHandlerStoreError:
         when there is no matching handler to process given request
         :return: request processing result
         """
+        if not kwargs:
+            subject_call = self._subject_calls.get(type(obj))  # type: ignore
+            if subject_call is not None:
+                return await subject_call(obj)
         result = await self._executor(ActionSubject(subject=obj, inject=kwargs))
         assert isinstance(
             result, ActionResult
         ), "modifier or handler should provide `ActionResult` type object"
         return result.result
+
+    async def execute_many(
+        self,
+        objs: Iterable[Any],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Executes given requests concurrently.
+        Handler lookup is performed once per request type
+        and all handlers are resolved before any request is executed.
+        :param objs: request objects
+        :param concurrency: max number of requests executed at the same time;
+        when not provided all requests are executed at once
+        :param return_exceptions: when True errors are returned in place of
+        corresponding results, when False (default) first error is raised
+        once execution of remaining requests is cancelled and finished
+        :param kwargs: extra arguments common for all requests
+        :raises LookupHandlerStoreError:
+        when there is no matching handler to process one of given requests
+        (and return_exceptions is False)
+        :return: request processing results in order of given requests
+        """
+        results: List[Any] = []
+        items: List[Tuple[int, ActionCallType, Any]] = []
+        calls: Dict[Hashable, ActionCallType] = {}
+        lookup = self._executor.lookup
+        for index, obj in enumerate(objs):
+            key: Hashable = type(obj)  # type: ignore
+            call = calls.get(key)
+            if call is None:
+                try:
+                    call = calls[key] = lookup(key)
+                except LookupHandlerStoreError as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+                    continue
+            results.append(None)
+            items.append((index, call, obj))
+
+        if not items:
+            return results
+        if concurrency is None or concurrency > len(items):
+            concurrency = len(items)
+        elif concurrency < 1:
+            raise ValueError(f"Invalid concurrency value {concurrency}")
+
+        queue = iter(items)
+
+        async def _worker():
+            for index, call, obj in queue:
+                try:
+                    result = await call(ActionSubject(subject=obj, inject={**kwargs}))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+                else:
+                    results[index] = result.result
+
+        if concurrency == 1:
+            await _worker()
+            return results
+
+        workers = [asyncio.ensure_future(_worker()) for _ in range(concurrency)]
+        try:
+            done, _ = await asyncio.wait(workers, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            # handlers have to finish before results or errors are passed on
+            await asyncio.gather(*workers, return_exceptions=True)
+        errors = [
+            worker.exception()
+            for worker in workers
+            if worker in done and not worker.cancelled()
+        ]
+        for error in errors:
+            if error is not None:
+                raise error
+        return results
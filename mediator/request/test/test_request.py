@@ -1,8 +1,9 @@
-from typing import List
+import asyncio
+from typing import List, Sequence
 
 import pytest
 
-from mediator.common.factory import CallableHandlerPolicy
+from mediator.common.factory import BatchHandlerPolicy, CallableHandlerPolicy
 from mediator.common.registry import LookupHandlerStoreError
 from mediator.common.test.test_modifiers import MockupModifierFactory
 from mediator.request import LocalRequestBus, RequestHandlerRegistry
@@ -49,3 +50,188 @@ async def test_local_request_executor():
 
     with pytest.raises(LookupHandlerStoreError):
         await executor.execute(object())
+
+
+class _RequestA1(_RequestA):
+    pass
+
+
+class _RequestA2(_RequestA1):
+    pass
+
+
+# noinspection PyUnusedLocal
+async def _handle_a1(a: _RequestA1, seq: List[str]):
+    return ["a1"]
+
+
+# noinspection PyUnusedLocal
+async def _handle_b_keyword(*, b: _RequestB, seq: Sequence[str] = ()):
+    return ["b", *seq]
+
+
+@pytest.mark.asyncio
+async def test_local_request_executor_subject_call():
+    executor = LocalRequestBus()
+    executor.register(_handle_b_keyword)
+    executor.register(_handle_a, modifiers=MockupModifierFactory.modifiers("abc"))
+
+    assert executor._executor.subject_calls.keys() == {_RequestB}
+    assert await executor.execute(_RequestB()) == ["b"]
+    assert await executor.execute(_RequestB(), seq=["x"]) == ["b", "x"]
+    assert await executor.execute(_RequestA()) == list("abc")
+
+
+@pytest.mark.asyncio
+async def test_local_request_executor_mro_lookup():
+    executor = LocalRequestBus(mro_lookup=True, mro_cache_size=1)
+    executor.register(_handle_a)
+
+    assert await executor.execute(_RequestA1(), seq=["a"]) == ["a"]
+    assert await executor.execute(_RequestA2(), seq=["a"]) == ["a"]
+    with pytest.raises(LookupHandlerStoreError):
+        await executor.execute(object())
+
+    executor.register(_handle_a1)
+    assert await executor.execute(_RequestA(), seq=["a"]) == ["a"]
+    assert await executor.execute(_RequestA1(), seq=[]) == ["a1"]
+    assert await executor.execute(_RequestA2(), seq=[]) == ["a1"]
+
+
+@pytest.mark.asyncio
+async def test_local_request_executor_exact_lookup():
+    executor = LocalRequestBus()
+    executor.register(_handle_a)
+    with pytest.raises(LookupHandlerStoreError):
+        await executor.execute(_RequestA1(), seq=[])
+
+
+class _RequestError(Exception):
+    pass
+
+
+class _RequestC:
+    def __init__(self, value: int):
+        self.value = value
+
+
+@pytest.mark.asyncio
+async def test_local_request_executor_execute_many():
+    active = {"now": 0, "max": 0}
+
+    async def _handle_c(c: _RequestC, offset: int = 0):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.0)
+        active["now"] -= 1
+        if c.value < 0:
+            raise _RequestError(c.value)
+        return c.value + offset
+
+    executor = LocalRequestBus()
+    executor.register(_handle_c)
+    executor.register(_handle_a)
+
+    requests = [_RequestC(i) for i in range(10)]
+    assert await executor.execute_many(requests, offset=1) == list(range(1, 11))
+    assert active["max"] == 10
+
+    active["max"] = 0
+    assert await executor.execute_many(requests, concurrency=3) == list(range(10))
+    assert active["max"] == 3
+
+    results = await executor.execute_many(
+        [_RequestC(1), _RequestC(-1), _RequestA(), object()],
+        concurrency=2,
+        return_exceptions=True,
+        seq=["a"],
+    )
+    assert results[0] == 1
+    assert isinstance(results[1], _RequestError)
+    assert results[2] == ["a"]
+    assert isinstance(results[3], LookupHandlerStoreError)
+
+    with pytest.raises(_RequestError):
+        await executor.execute_many([_RequestC(1), _RequestC(-1)], concurrency=2)
+    with pytest.raises(LookupHandlerStoreError):
+        await executor.execute_many([_RequestC(1), object()])
+    assert await executor.execute_many([]) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cancel", [False, True])
+async def test_local_request_executor_execute_many_cleanup(cancel):
+    running = set()
+    started = asyncio.Event()
+
+    async def _handle_c(c: _RequestC):
+        running.add(c.value)
+        try:
+            if c.value < 0:
+                await started.wait()
+                raise _RequestError(c.value)
+            started.set()
+            await asyncio.sleep(10)
+        finally:
+            # cleanup suspends and fails after cancellation
+            await asyncio.sleep(0)
+            running.discard(c.value)
+            if c.value > 1:
+                raise _RequestError(c.value)
+
+    executor = LocalRequestBus()
+    executor.register(_handle_c)
+    requests = [_RequestC(value) for value in [1, 2, -1 if not cancel else 3]]
+
+    task = asyncio.ensure_future(executor.execute_many(requests))
+    if cancel:
+        await started.wait()
+        task.cancel()
+    with pytest.raises(asyncio.CancelledError if cancel else _RequestError):
+        await task
+    assert running == set()
+
+
+@pytest.mark.asyncio
+async def test_local_request_executor_batch():
+    batches = []
+
+    async def _handle_c_batch(batch: List[_RequestC], offset: int = 0):
+        batches.append([c.value for c in batch])
+        return [c.value + offset for c in batch]
+
+    executor = LocalRequestBus(
+        policies=[BatchHandlerPolicy(max_size=3), CallableHandlerPolicy()]
+    )
+    executor.register(_handle_c_batch)
+    executor.register(_handle_a)
+
+    results = await asyncio.gather(
+        *[executor.execute(_RequestC(i), offset=1) for i in range(5)]
+    )
+    assert results == [1, 2, 3, 4, 5]
+    assert batches == [[0, 1, 2], [3, 4]]
+    assert await executor.execute(_RequestA(), seq=["a"]) == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_local_request_executor_stats():
+    executor = LocalRequestBus(metrics=True)
+    executor.register(_handle_a)
+    executor.register(_handle_b)
+    assert LocalRequestBus().stats() == []
+
+    await executor.execute(_RequestA(), seq=[])
+    await executor.execute(_RequestA(), seq=[])
+    with pytest.raises(TypeError):
+        await executor.execute(_RequestB())
+
+    stats_a, stats_b = executor.stats()
+    assert (stats_a.key, stats_a.obj, stats_a.calls, stats_a.errors) == (
+        _RequestA,
+        _handle_a,
+        2,
+        0,
+    )
+    assert (stats_b.key, stats_b.calls, stats_b.errors) == (_RequestB, 1, 1)
+    assert stats_a.latency.count == 2 and stats_a.in_flight == 0
@@ -0,0 +1,156 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram.
+
+    Bucket upper bounds grow geometrically (`min_value * growth ** index`),
+    so relative error of estimated percentiles is bounded by growth factor
+    and memory depends only on observed value range.
+    With max_count provided all counts are halved whenever it is exceeded,
+    so estimates follow recent latency changes.
+    """
+
+    __slots__ = (
+        "min_value",
+        "growth",
+        "max_count",
+        "_log_growth",
+        "_counts",
+        "_count",
+        "_sum",
+    )
+
+    _counts: Dict[int, float]
+
+    def __init__(
+        self,
+        min_value: float = 1e-6,
+        growth: float = 2**0.25,
+        max_count: Optional[float] = None,
+    ):
+        """
+        Initializes latency histogram.
+        :param min_value: upper bound of the first bucket
+        :param growth: ratio of consecutive bucket upper bounds
+        :param max_count: (optional) recorded values count that triggers decay;
+        when not provided counts never decay
+        """
+        if min_value <= 0:
+            raise ValueError("min_value must be greater than 0")
+        if growth <= 1:
+            raise ValueError("growth must be greater than 1")
+        self.min_value = min_value
+        self.growth = growth
+        self.max_count = max_count
+        self._log_growth = math.log(growth)
+        self._counts = {}
+        self._count = 0.0
+        self._sum = 0.0
+
+    @property
+    def count(self) -> float:
+        """
+        Number of recorded values (after decay).
+        :return: number of recorded values
+        """
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """
+        Sum of recorded values (after decay).
+        :return: sum of recorded values
+        """
+        return self._sum
+
+    def upper_bound(self, index: int) -> float:
+        """
+        Provides upper bound of given bucket.
+        :param index: bucket index
+        :return: bucket upper bound
+        """
+        return self.min_value * self.growth**index
+
+    def record(self, value: float):
+        """
+        Records given value.
+        :param value: value to record (i.e. latency in seconds)
+        """
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = math.ceil(math.log(value / self.min_value) / self._log_growth)
+            if self.upper_bound(index - 1) >= value:
+                # float rounding of exact bucket bound
+                index -= 1
+        counts = self._counts
+        counts[index] = counts.get(index, 0.0) + 1.0
+        self._count += 1.0
+        self._sum += value
+        if self.max_count is not None and self._count > self.max_count:
+            self.decay()
+
+    def decay(self, factor: float = 0.5):
+        """
+        Scales all counts by given factor and drops almost empty buckets.
+        :param factor: scale factor
+        """
+        self._counts = {
+            index: count * factor
+            for index, count in self._counts.items()
+            if count * factor >= 0.5
+        }
+        self._count = sum(self._counts.values())
+        self._sum *= factor
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimates given percentile of recorded values.
+        :param q: percentile in range [0, 100]
+        :return: upper bound of bucket containing percentile
+        or None when no values are recorded
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("q must be in range [0, 100]")
+        buckets = self.buckets()
+        if not buckets:
+            return None
+        rank = q / 100 * self._count
+        seen = 0.0
+        for bound, count in buckets:
+            seen += count
+            if seen >= rank:
+                return bound
+        return buckets[-1][0]
+
+    def buckets(self) -> List[Tuple[float, float]]:
+        """
+        Provides non-empty buckets ordered by upper bound.
+        :return: list of (bucket upper bound, count) pairs
+        """
+        return [
+            (self.upper_bound(index), self._counts[index])
+            for index in sorted(self._counts)
+        ]
+
+    def copy(self) -> "LatencyHistogram":
+        """
+        Provides independent copy of histogram.
+        :return: histogram copy
+        """
+        histogram = LatencyHistogram(self.min_value, self.growth, self.max_count)
+        histogram._counts = dict(self._counts)
+        histogram._count = self._count
+        histogram._sum = self._sum
+        return histogram
+
+    def clear(self):
+        """
+        Removes all recorded values.
+        """
+        self._counts = {}
+        self._count = 0.0
+        self._sum = 0.0
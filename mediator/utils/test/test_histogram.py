@@ -0,0 +1,53 @@
+import pytest
+
+from mediator.utils.histogram import LatencyHistogram
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(min_value=0.001, growth=2.0)
+    assert histogram.percentile(50) is None
+
+    for value in [0.0005, 0.001, 0.002, 0.003, 0.1]:
+        histogram.record(value)
+
+    assert histogram.count == 5
+    assert histogram.sum == pytest.approx(0.1065)
+    assert histogram.buckets() == [
+        (0.001, 2.0),
+        (0.002, 1.0),
+        (0.004, 1.0),
+        (0.128, 1.0),
+    ]
+    assert histogram.percentile(0) == 0.001
+    assert histogram.percentile(40) == 0.001
+    assert histogram.percentile(60) == 0.002
+    assert histogram.percentile(80) == 0.004
+    assert histogram.percentile(100) == 0.128
+
+    with pytest.raises(ValueError):
+        histogram.percentile(101)
+
+    copy = histogram.copy()
+    histogram.clear()
+    assert histogram.count == 0 and histogram.buckets() == []
+    assert copy.count == 5 and copy.percentile(100) == 0.128
+
+
+def test_latency_histogram_decay():
+    histogram = LatencyHistogram(min_value=0.001, growth=2.0, max_count=10)
+    for _ in range(10):
+        histogram.record(1.0)
+    assert histogram.percentile(50) == 1.024
+
+    # old values decay, recent ones dominate
+    for _ in range(15):
+        histogram.record(0.001)
+    assert histogram.count <= 10
+    assert histogram.percentile(50) == 0.001
+
+
+def test_latency_histogram_validation():
+    with pytest.raises(ValueError):
+        LatencyHistogram(min_value=0)
+    with pytest.raises(ValueError):
+        LatencyHistogram(growth=1.0)